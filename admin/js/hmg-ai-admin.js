@@ -523,6 +523,10 @@
             // Get selected provider
             const selectedProvider = $('#hmg-ai-provider-select').val() || 'auto';
             
+            // Regenerate requests skip the server-side response cache
+            const forceRegenerate = $button.data('force-regenerate') ? 1 : 0;
+            $button.removeData('force-regenerate');
+            
             $button.prop('disabled', true).html(loadingText);
             this.hideNotices();
             
@@ -534,7 +538,8 @@
                     nonce: hmg_ai_ajax.nonce,
                     content: content,
                     post_id: postId,
-                    provider: selectedProvider
+                    provider: selectedProvider,
+                    force_regenerate: forceRegenerate
                 },
                 success: (response) => {
 
@@ -753,6 +758,7 @@
                     
                     // Trigger the generation
                     const $generateBtn = $(`.hmg-ai-generate-${type}`);
+                    $generateBtn.data('force-regenerate', true);
                     $generateBtn.click();
                     
                     // Watch for completion
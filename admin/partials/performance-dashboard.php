@@ -136,6 +136,28 @@ $options = get_option('hmg_ai_blog_enhancer_options', array());
                 <p class="metric-target"><?php echo $cache_stats->active_entries; ?> active entries</p>
             </div>
         </div>
+
+        <div class="metric-card">
+            <div class="metric-icon">
+                <span class="dashicons dashicons-layout"></span>
+            </div>
+            <div class="metric-content">
+                <h3><?php _e('Fragment Cache', 'hmg-ai-blog-enhancer'); ?></h3>
+                <p class="metric-value">
+                    <?php echo $metrics['fragment_cache']['hit_rate'] === null ? esc_html__('n/a', 'hmg-ai-blog-enhancer') : esc_html($metrics['fragment_cache']['hit_rate']) . '%'; ?>
+                </p>
+                <p class="metric-target">
+                    <?php
+                    printf(
+                        __('%1$d misses, %2$d rebuilds, %3$d stale served', 'hmg-ai-blog-enhancer'),
+                        $metrics['fragment_cache']['misses'],
+                        $metrics['fragment_cache']['rebuilds'],
+                        $metrics['fragment_cache']['stale_served']
+                    );
+                    ?>
+                </p>
+            </div>
+        </div>
     </div>
 
     <!-- Optimization Recommendations -->
@@ -63,6 +63,7 @@ if (isset($_POST['submit']) && wp_verify_nonce($_POST['hmg_ai_settings_nonce'],
     update_option('hmg_ai_tts_similarity', floatval($_POST['tts_similarity'] ?? 0.75));
     update_option('hmg_ai_tts_style', floatval($_POST['tts_style'] ?? 0.0));
     update_option('hmg_ai_tts_speaker_boost', isset($_POST['tts_speaker_boost']) ? 1 : 0);
+    update_option('hmg_ai_tts_max_concurrency', min(10, max(1, (int) ($_POST['tts_max_concurrency'] ?? 3))));
     
     // Dynamic styling settings
     update_option('hmg_ai_dynamic_styling', isset($_POST['hmg_ai_dynamic_styling']));
@@ -94,6 +95,14 @@ if (isset($_POST['submit']) && wp_verify_nonce($_POST['hmg_ai_settings_nonce'],
     // Cache settings
     $new_options['cache_enabled'] = isset($_POST['cache_enabled']);
     $new_options['cache_duration'] = (int) ($_POST['cache_duration'] ?? 3600);
+    $new_options['cache_max_entries'] = max(50, min(100000, (int) ($_POST['cache_max_entries'] ?? 1000))); // Fewer than 50 thrashes the cache
+    
+    // Hedged provider requests
+    $new_options['hedging_enabled'] = isset($_POST['hedging_enabled']);
+    $new_options['hedge_percentile'] = min(99, max(50, (int) ($_POST['hedge_percentile'] ?? 95)));
+    $new_options['hedge_latency_budget'] = max(5, (int) ($_POST['hedge_latency_budget'] ?? 60));
+    $new_options['hedge_max_rate'] = min(100, max(0, (int) ($_POST['hedge_max_rate'] ?? 20))) / 100;
+    $new_options['hedge_max_cost'] = max(0, (float) ($_POST['hedge_max_cost'] ?? 0.05));
     
     // Usage tracking
     $new_options['usage_tracking'] = isset($_POST['usage_tracking']);
@@ -414,6 +423,77 @@ if (isset($_POST['submit']) && wp_verify_nonce($_POST['hmg_ai_settings_nonce'],
                            style="width: 150px;" />
                     <p class="description"><?php _e('How long to cache generated content (300 seconds minimum, 86400 maximum).', 'hmg-ai-blog-enhancer'); ?></p>
                 </div>
+
+                <div class="hmg-ai-form-group">
+                    <label for="cache_max_entries"><?php _e('Maximum Cached Responses', 'hmg-ai-blog-enhancer'); ?></label>
+                    <input type="number" 
+                           id="cache_max_entries" 
+                           name="cache_max_entries" 
+                           value="<?php echo esc_attr($options['cache_max_entries'] ?? 1000); ?>" 
+                           min="50" 
+                           max="100000" 
+                           style="width: 150px;" />
+                    <p class="description"><?php _e('Oldest cached responses are removed once this many are stored.', 'hmg-ai-blog-enhancer'); ?></p>
+                </div>
+
+                <div class="hmg-ai-form-group">
+                    <label>
+                        <input type="checkbox" 
+                               name="hedging_enabled" 
+                               value="1" 
+                               <?php checked($options['hedging_enabled'] ?? false); ?> />
+                        <?php _e('Hedge slow provider requests', 'hmg-ai-blog-enhancer'); ?>
+                    </label>
+                    <p class="description"><?php _e('When the primary provider is slower than usual, send the same request to the next provider and use whichever answers first. The losing request may still be billed.', 'hmg-ai-blog-enhancer'); ?></p>
+                </div>
+
+                <div class="hmg-ai-form-group">
+                    <label for="hedge_percentile"><?php _e('Hedge After Percentile', 'hmg-ai-blog-enhancer'); ?></label>
+                    <input type="number" 
+                           id="hedge_percentile" 
+                           name="hedge_percentile" 
+                           value="<?php echo esc_attr($options['hedge_percentile'] ?? 95); ?>" 
+                           min="50" 
+                           max="99" 
+                           style="width: 150px;" />
+                    <p class="description"><?php _e('Fire the backup request once the primary has taken longer than this percentile of its recent response times.', 'hmg-ai-blog-enhancer'); ?></p>
+                </div>
+
+                <div class="hmg-ai-form-group">
+                    <label for="hedge_latency_budget"><?php _e('Latency Budget (seconds)', 'hmg-ai-blog-enhancer'); ?></label>
+                    <input type="number" 
+                           id="hedge_latency_budget" 
+                           name="hedge_latency_budget" 
+                           value="<?php echo esc_attr($options['hedge_latency_budget'] ?? 60); ?>" 
+                           min="5" 
+                           max="300" 
+                           style="width: 150px;" />
+                    <p class="description"><?php _e('Longest a hedged request may take. No backup is fired if it could not answer within the budget.', 'hmg-ai-blog-enhancer'); ?></p>
+                </div>
+
+                <div class="hmg-ai-form-group">
+                    <label for="hedge_max_rate"><?php _e('Maximum Hedged Requests (%)', 'hmg-ai-blog-enhancer'); ?></label>
+                    <input type="number" 
+                           id="hedge_max_rate" 
+                           name="hedge_max_rate" 
+                           value="<?php echo esc_attr(round(($options['hedge_max_rate'] ?? 0.2) * 100)); ?>" 
+                           min="0" 
+                           max="100" 
+                           style="width: 150px;" />
+                    <p class="description"><?php _e('Share of recent requests allowed to fire a backup request.', 'hmg-ai-blog-enhancer'); ?></p>
+                </div>
+
+                <div class="hmg-ai-form-group">
+                    <label for="hedge_max_cost"><?php _e('Maximum Backup Request Cost ($)', 'hmg-ai-blog-enhancer'); ?></label>
+                    <input type="number" 
+                           id="hedge_max_cost" 
+                           name="hedge_max_cost" 
+                           value="<?php echo esc_attr($options['hedge_max_cost'] ?? 0.05); ?>" 
+                           min="0" 
+                           step="0.01" 
+                           style="width: 150px;" />
+                    <p class="description"><?php _e('Skip the backup request when its estimated cost is higher than this.', 'hmg-ai-blog-enhancer'); ?></p>
+                </div>
             </div>
         </div>
 
@@ -619,6 +699,18 @@ if (isset($_POST['submit']) && wp_verify_nonce($_POST['hmg_ai_settings_nonce'],
                         <p class="description"><?php _e('Enhances voice clarity and presence (recommended)', 'hmg-ai-blog-enhancer'); ?></p>
                     </div>
                     
+                    <div class="hmg-ai-form-group">
+                        <label for="tts_max_concurrency"><?php _e('Parallel Requests for Long Articles', 'hmg-ai-blog-enhancer'); ?></label>
+                        <input type="number" 
+                               id="tts_max_concurrency" 
+                               name="tts_max_concurrency" 
+                               value="<?php echo esc_attr(get_option('hmg_ai_tts_max_concurrency', 3)); ?>" 
+                               min="1" 
+                               max="10" 
+                               style="width: 100px;" />
+                        <p class="description"><?php _e('Long articles are split into segments that are generated in parallel. Keep this at or below the concurrency limit of your Eleven Labs plan.', 'hmg-ai-blog-enhancer'); ?></p>
+                    </div>
+                    
                     <div style="padding: 15px; background: #f8f9fa; border-left: 3px solid #00a32a; margin-top: 20px;">
                         <strong>🎙️ <?php _e('Eleven Labs Features:', 'hmg-ai-blog-enhancer'); ?></strong>
                         <ul style="margin: 10px 0; padding-left: 20px;">
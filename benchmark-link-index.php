@@ -0,0 +1,192 @@
+<?php
+/**
+ * Benchmark internal link suggestions against a large synthetic index
+ *
+ * Fills a copy of the link index tables (under a separate table prefix, the
+ * live index is not touched) with synthetic posts whose words follow a Zipf
+ * distribution, then times HMG_AI_Link_Index::find_related queries.
+ *
+ * Usage: php benchmark-link-index.php [posts=50000] [queries=200] [keep]
+ *    or: wp eval-file benchmark-link-index.php 50000 200 keep
+ *
+ * With "keep" the synthetic tables are left in place and reused by the next
+ * run with the same post count.
+ */
+
+// Load WordPress
+if (!defined('ABSPATH')) {
+    if (file_exists('/var/www/html/wp-load.php')) {
+        require_once('/var/www/html/wp-load.php');
+    } elseif (file_exists('../../../wp-load.php')) {
+        require_once('../../../wp-load.php');
+    } else {
+        die('Could not find wp-load.php');
+    }
+}
+
+require_once(dirname(__FILE__) . '/includes/services/class-link-index.php');
+
+global $wpdb;
+
+$bench_args = isset($args) ? $args : array_slice($argv ?? array(), 1);
+$post_count = max(1, (int) ($bench_args[0] ?? 50000));
+$query_count = max(1, (int) ($bench_args[1] ?? 200));
+$keep_tables = ($bench_args[2] ?? '') === 'keep';
+
+$vocabulary_size = 30000;
+$words_per_post = 400;
+
+/**
+ * Synthetic word for a vocabulary rank (letters only, longer than 3 characters)
+ */
+function hmg_bench_word($rank) {
+    $word = 'term';
+    do {
+        $word .= chr(97 + $rank % 26);
+        $rank = intdiv($rank, 26);
+    } while ($rank > 0);
+    return $word;
+}
+
+/**
+ * Draw a document's words from a Zipf distribution over the vocabulary
+ */
+function hmg_bench_document($cumulative, $length) {
+    $total = end($cumulative);
+    $last = count($cumulative) - 1;
+    $words = array();
+
+    for ($i = 0; $i < $length; $i++) {
+        $target = mt_rand() / mt_getrandmax() * $total;
+        $low = 0;
+        $high = $last;
+        while ($low < $high) {
+            $mid = ($low + $high) >> 1;
+            if ($cumulative[$mid] < $target) {
+                $low = $mid + 1;
+            } else {
+                $high = $mid;
+            }
+        }
+        $words[] = hmg_bench_word($low);
+    }
+
+    return $words;
+}
+
+mt_srand(42);
+$cumulative = array();
+$sum = 0;
+for ($rank = 1; $rank <= $vocabulary_size; $rank++) {
+    $sum += 1 / $rank;
+    $cumulative[] = $sum;
+}
+
+// Point the index at its own tables; core tables are left alone
+$previous_db_version = get_option('hmg_ai_link_index_db_version');
+$original_prefix = $wpdb->prefix;
+$wpdb->prefix = $original_prefix . 'hmgbench_';
+HMG_AI_Link_Index::create_tables();
+$index = new HMG_AI_Link_Index();
+$wpdb->prefix = $original_prefix;
+
+$postings_table = $original_prefix . 'hmgbench_hmg_ai_link_postings';
+$terms_table = $original_prefix . 'hmgbench_hmg_ai_link_terms';
+
+add_filter('pre_option_hmg_ai_link_index_doc_count', function() use ($post_count) {
+    return $post_count;
+});
+
+if ((int) $wpdb->get_var("SELECT MAX(post_id) FROM $postings_table") !== $post_count) {
+    echo "Building synthetic index: $post_count posts...\n";
+    $build_start = microtime(true);
+
+    $wpdb->query("TRUNCATE TABLE $postings_table");
+    $wpdb->query("TRUNCATE TABLE $terms_table");
+
+    $dfs = array();
+    $rows = array();
+    for ($post_id = 1; $post_id <= $post_count; $post_id++) {
+        // Same weighting as HMG_AI_Link_Index::get_document_weights
+        $counts = array_count_values(hmg_bench_document($cumulative, $words_per_post));
+        arsort($counts);
+        $counts = array_slice($counts, 0, HMG_AI_Link_Index::MAX_DOC_TERMS, true);
+
+        $weights = array();
+        $norm = 0;
+        foreach ($counts as $term => $count) {
+            $weights[$term] = 1 + log($count);
+            $norm += $weights[$term] * $weights[$term];
+        }
+        $norm = sqrt($norm);
+
+        foreach ($weights as $term => $weight) {
+            $rows[] = $wpdb->prepare('(%s, %d, %f)', $term, $post_id, $weight / $norm);
+            $dfs[$term] = ($dfs[$term] ?? 0) + 1;
+        }
+
+        if (count($rows) >= 5000 || $post_id === $post_count) {
+            $wpdb->query("INSERT INTO $postings_table (term, post_id, weight) VALUES " . implode(', ', $rows));
+            $rows = array();
+        }
+
+        if ($post_id % 5000 === 0) {
+            echo "  $post_id posts\n";
+        }
+    }
+
+    foreach (array_chunk($dfs, 5000, true) as $chunk) {
+        $values = array();
+        foreach ($chunk as $term => $df) {
+            $values[] = $wpdb->prepare('(%s, %d)', $term, $df);
+        }
+        $wpdb->query("INSERT INTO $terms_table (term, df) VALUES " . implode(', ', $values));
+    }
+
+    printf("Built in %.1f s\n", microtime(true) - $build_start);
+}
+
+printf(
+    "Index: %d posts, %d postings, %d terms\n",
+    $post_count,
+    $wpdb->get_var("SELECT COUNT(*) FROM $postings_table"),
+    $wpdb->get_var("SELECT COUNT(*) FROM $terms_table")
+);
+
+// Warm up caches before timing
+$index->find_related(implode(' ', hmg_bench_document($cumulative, $words_per_post)), 5);
+
+$timings = array();
+$queries = array();
+for ($i = 0; $i < $query_count; $i++) {
+    $content = implode(' ', hmg_bench_document($cumulative, $words_per_post));
+
+    $queries_before = $wpdb->num_queries;
+    $start = microtime(true);
+    $index->find_related($content, 5);
+    $timings[] = (microtime(true) - $start) * 1000;
+    $queries[] = $wpdb->num_queries - $queries_before;
+}
+
+sort($timings);
+printf(
+    "find_related over %d queries: mean %.2f ms, p50 %.2f ms, p95 %.2f ms, max %.2f ms, %.1f SQL queries each\n",
+    $query_count,
+    array_sum($timings) / $query_count,
+    $timings[(int) floor(0.50 * ($query_count - 1))],
+    $timings[(int) floor(0.95 * ($query_count - 1))],
+    end($timings),
+    array_sum($queries) / $query_count
+);
+
+if (!$keep_tables) {
+    $wpdb->query("DROP TABLE IF EXISTS $postings_table");
+    $wpdb->query("DROP TABLE IF EXISTS $terms_table");
+}
+
+// create_tables() records the schema version for the benchmark tables only
+if ($previous_db_version === false) {
+    delete_option('hmg_ai_link_index_db_version');
+} else {
+    update_option('hmg_ai_link_index_db_version', $previous_db_version);
+}
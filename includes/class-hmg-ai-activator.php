@@ -97,6 +97,7 @@ class HMG_AI_Activator {
             'usage_tracking' => true,
             'cache_enabled' => true,
             'cache_duration' => 3600, // 1 hour
+            'cache_max_entries' => 1000,
         );
 
         add_option('hmg_ai_blog_enhancer_options', $default_options);
@@ -156,5 +157,9 @@ class HMG_AI_Activator {
         
         dbDelta($sql);
         dbDelta($cache_sql);
+
+        // Internal link index tables
+        require_once HMG_AI_BLOG_ENHANCER_PLUGIN_DIR . 'includes/services/class-link-index.php';
+        HMG_AI_Link_Index::create_tables();
     }
 } 
\ No newline at end of file
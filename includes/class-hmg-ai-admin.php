@@ -599,6 +599,9 @@ class HMG_AI_Admin {
             if ($provider !== 'auto') {
                 $options['provider'] = $provider;
             }
+            if (!empty($_POST['force_regenerate'])) {
+                $options['force_regenerate'] = true;
+            }
 
             // Generate takeaways using AI service manager
             $result = $this->ai_service_manager->generate_content('takeaways', $content, $post_id, $options);
@@ -688,6 +691,9 @@ class HMG_AI_Admin {
             if ($provider !== 'auto') {
                 $options['provider'] = $provider;
             }
+            if (!empty($_POST['force_regenerate'])) {
+                $options['force_regenerate'] = true;
+            }
 
             // Generate FAQ using AI service manager
             $result = $this->ai_service_manager->generate_content('faq', $content, $post_id, $options);
@@ -777,6 +783,9 @@ class HMG_AI_Admin {
             if ($provider !== 'auto') {
                 $options['provider'] = $provider;
             }
+            if (!empty($_POST['force_regenerate'])) {
+                $options['force_regenerate'] = true;
+            }
 
             // Generate TOC using AI service manager
             $result = $this->ai_service_manager->generate_content('toc', $content, $post_id, $options);
@@ -1905,6 +1914,10 @@ class HMG_AI_Admin {
             
             // Clear fragment cache
             delete_transient('hmg_ai_fragment_cache');
+            if (!class_exists('HMG_AI_Performance_Optimizer')) {
+                require_once HMG_AI_BLOG_ENHANCER_PLUGIN_DIR . 'includes/class-performance-optimizer.php';
+            }
+            HMG_AI_Performance_Optimizer::reset_fragment_stats();
             
             // Clear minified assets cache
             $upload_dir = wp_upload_dir();
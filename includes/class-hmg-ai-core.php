@@ -210,6 +210,23 @@ class HMG_AI_Core {
         // Context-Aware AI handlers
         $this->loader->add_action('wp_ajax_hmg_analyze_brand_voice', $plugin_admin, 'ajax_analyze_brand_voice');
         $this->loader->add_action('wp_ajax_hmg_clear_brand_profile', $plugin_admin, 'ajax_clear_brand_profile');
+
+        // Keep per-post brand voice features and the brand profile current as posts are edited
+        if (!class_exists('HMG_AI_Context_Analyzer')) {
+            require_once HMG_AI_BLOG_ENHANCER_PLUGIN_DIR . 'includes/services/class-context-analyzer.php';
+        }
+        $context_analyzer = new HMG_AI_Context_Analyzer();
+        $this->loader->add_action('save_post', $context_analyzer, 'update_post_features', 10, 2);
+        $this->loader->add_action('before_delete_post', $context_analyzer, 'handle_delete_post');
+
+        // Keep the internal link index in step with published posts
+        if (!class_exists('HMG_AI_Link_Index')) {
+            require_once HMG_AI_BLOG_ENHANCER_PLUGIN_DIR . 'includes/services/class-link-index.php';
+        }
+        $link_index = new HMG_AI_Link_Index();
+        $this->loader->add_action('save_post', $link_index, 'handle_save_post', 10, 2);
+        $this->loader->add_action('before_delete_post', $link_index, 'handle_delete_post');
+        $this->loader->add_action(HMG_AI_Link_Index::BUILD_HOOK, $link_index, 'build_batch');
         
         // SEO Optimizer handlers
         $this->loader->add_action('wp_ajax_hmg_analyze_seo', $plugin_admin, 'ajax_analyze_seo');
@@ -75,6 +75,7 @@ class HMG_AI_Deactivator {
         // Clear any other scheduled events
         wp_clear_scheduled_hook('hmg_ai_cache_cleanup');
         wp_clear_scheduled_hook('hmg_ai_usage_sync');
+        wp_clear_scheduled_hook('hmg_ai_link_index_build');
     }
 
     /**
@@ -48,6 +48,15 @@ class HMG_AI_Public {
      */
     private $style_analyzer;
     
+    /**
+     * Performance optimizer used for the shortcode HTML cache
+     *
+     * @since    1.4.0
+     * @access   private
+     * @var      HMG_AI_Performance_Optimizer    $performance_optimizer    Fragment cache provider.
+     */
+    private $performance_optimizer;
+    
     /**
      * Stores if adaptive styles have been output for a post
      *
@@ -174,6 +183,17 @@ class HMG_AI_Public {
             'style' => 'default'
         ), $atts, 'hmg_ai_takeaways');
 
+        return $this->render_cached_shortcode('hmg_ai_takeaways', $atts, '_hmg_ai_takeaways', 'build_takeaways_html');
+    }
+
+    /**
+     * Build takeaways HTML
+     *
+     * @since    1.4.0
+     * @param    array    $atts    Normalized shortcode attributes.
+     * @return   string            Rendered HTML.
+     */
+    private function build_takeaways_html($atts) {
         $post_id = (int) $atts['post_id'];
         $style = sanitize_text_field($atts['style']);
 
@@ -255,6 +275,17 @@ class HMG_AI_Public {
             'style' => 'list'
         ), $atts, 'hmg_ai_faq');
 
+        return $this->render_cached_shortcode('hmg_ai_faq', $atts, '_hmg_ai_faq', 'build_faq_html');
+    }
+
+    /**
+     * Build FAQ HTML
+     *
+     * @since    1.4.0
+     * @param    array    $atts    Normalized shortcode attributes.
+     * @return   string            Rendered HTML.
+     */
+    private function build_faq_html($atts) {
         $post_id = (int) $atts['post_id'];
         $style = sanitize_text_field($atts['style']);
 
@@ -316,6 +347,17 @@ class HMG_AI_Public {
             'style' => 'numbered'
         ), $atts, 'hmg_ai_toc');
 
+        return $this->render_cached_shortcode('hmg_ai_toc', $atts, '_hmg_ai_toc', 'build_toc_html');
+    }
+
+    /**
+     * Build table of contents HTML
+     *
+     * @since    1.4.0
+     * @param    array    $atts    Normalized shortcode attributes.
+     * @return   string            Rendered HTML.
+     */
+    private function build_toc_html($atts) {
         $post_id = (int) $atts['post_id'];
         $style = sanitize_text_field($atts['style']);
 
@@ -380,6 +422,56 @@ class HMG_AI_Public {
         return $output;
     }
     
+    /**
+     * Render a shortcode through the fragment cache
+     *
+     * The cache key covers everything the HTML depends on: the post and its
+     * content revision, the normalized attributes, a hash of the shortcode's
+     * _hmg_ai_* meta, the plugin's style settings, the active theme and its
+     * mods, the locale and the plugin version. Editing any of them yields a
+     * new key, so stale HTML is never served and no purge hooks are needed.
+     *
+     * @since    1.4.0
+     * @param    string    $shortcode    Shortcode tag.
+     * @param    array     $atts         Attributes after shortcode_atts().
+     * @param    string    $meta_key     Post meta the shortcode renders.
+     * @param    string    $builder      Method that builds the HTML.
+     * @return   string                  Rendered HTML.
+     */
+    private function render_cached_shortcode($shortcode, $atts, $meta_key, $builder) {
+        $post_id = (int) $atts['post_id'];
+
+        $normalized_atts = array_map('strval', $atts);
+        $normalized_atts['post_id'] = (string) $post_id;
+        ksort($normalized_atts);
+
+        $fragment_id = wp_json_encode(array(
+            'shortcode' => $shortcode,
+            'post_id' => $post_id,
+            'atts' => $normalized_atts,
+            'meta_version' => md5(maybe_serialize(get_post_meta($post_id, $meta_key, true))),
+            'post_modified' => get_post_field('post_modified_gmt', $post_id),
+            'style_settings' => array(
+                get_option('hmg_ai_style_override', 'best-practices'),
+                (bool) get_option('hmg_ai_dynamic_styling', true)
+            ),
+            'theme' => array(get_stylesheet(), md5(maybe_serialize(get_theme_mods()))),
+            'locale' => get_locale(),
+            'version' => $this->version
+        ));
+
+        if (!$this->performance_optimizer) {
+            if (!class_exists('HMG_AI_Performance_Optimizer')) {
+                require_once HMG_AI_BLOG_ENHANCER_PLUGIN_DIR . 'includes/class-performance-optimizer.php';
+            }
+            $this->performance_optimizer = new HMG_AI_Performance_Optimizer();
+        }
+
+        return $this->performance_optimizer->fragment_cache($fragment_id, function() use ($builder, $atts) {
+            return $this->$builder($atts);
+        }, DAY_IN_SECONDS);
+    }
+
     /**
      * Get inline styles for AI content
      * 
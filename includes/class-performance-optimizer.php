@@ -41,6 +41,67 @@ class HMG_AI_Performance_Optimizer {
      */
     private $asset_config;
 
+    /**
+     * Fragments already resolved during this request
+     *
+     * @since    1.4.0
+     * @access   private
+     * @var      array    $fragment_memo    Cache key => fragment content.
+     */
+    private static $fragment_memo = array();
+
+    /**
+     * Fragment cache counters not yet persisted
+     *
+     * @since    1.4.0
+     * @access   private
+     * @var      array    $fragment_stats    Counter => count for this request.
+     */
+    private static $fragment_stats = array();
+
+    /**
+     * Fragment cache counters
+     *
+     * @since    1.4.0
+     * @var      array
+     */
+    const FRAGMENT_COUNTERS = array('hits', 'memo_hits', 'misses', 'stale_served', 'rebuilds');
+
+    /**
+     * Counters persisted to the options table when there is no object cache
+     *
+     * Only events that already touch the database are stored, so a cache
+     * hit never costs a query or a write.
+     *
+     * @since    1.4.0
+     * @var      array
+     */
+    const FRAGMENT_DB_COUNTERS = array('misses', 'stale_served', 'rebuilds');
+
+    /**
+     * Random spread applied to fragment TTLs so entries don't expire together
+     *
+     * @since    1.4.0
+     * @var      float
+     */
+    const FRAGMENT_TTL_JITTER = 0.1;
+
+    /**
+     * How long past its TTL a fragment may be served while it is rebuilt, as a multiple of the TTL
+     *
+     * @since    1.4.0
+     * @var      float
+     */
+    const FRAGMENT_STALE_FACTOR = 1.0;
+
+    /**
+     * Seconds a fragment regeneration lock is held before it is considered abandoned
+     *
+     * @since    1.4.0
+     * @var      int
+     */
+    const FRAGMENT_LOCK_TTL = 30;
+
     /**
      * Initialize the Performance Optimizer
      *
@@ -96,7 +157,8 @@ class HMG_AI_Performance_Optimizer {
             'load_time' => (microtime(true) - $this->metrics['start_time']) * 1000, // in ms
             'memory_used' => (memory_get_usage() - $this->metrics['start_memory']) / 1024 / 1024, // in MB
             'queries' => get_num_queries() - $this->metrics['queries_start'],
-            'peak_memory' => memory_get_peak_usage() / 1024 / 1024 // in MB
+            'peak_memory' => memory_get_peak_usage() / 1024 / 1024, // in MB
+            'fragment_cache' => $this->get_fragment_stats()
         );
     }
 
@@ -340,6 +402,12 @@ class HMG_AI_Performance_Optimizer {
     /**
      * Implement fragment caching
      *
+     * Fragments are read from an in-request memo first, then from the
+     * object cache (or transients without one). Each stored entry carries
+     * its own jittered freshness deadline and outlives it by a stale
+     * window: once stale, one request takes a short lock and rebuilds
+     * while concurrent requests keep serving the stale copy.
+     *
      * @since    1.4.0
      * @param    string    $fragment_id    Fragment identifier
      * @param    callable  $callback       Callback to generate content
@@ -352,16 +420,260 @@ class HMG_AI_Performance_Optimizer {
         }
         
         $cache_key = 'hmg_ai_fragment_' . md5($fragment_id);
-        $cached = get_transient($cache_key);
-        
-        if ($cached !== false) {
-            return $cached;
+
+        if (array_key_exists($cache_key, self::$fragment_memo)) {
+            $this->count_fragment('memo_hits');
+            return self::$fragment_memo[$cache_key];
         }
+
+        $entry = $this->get_fragment_entry($cache_key);
         
-        $content = call_user_func($callback);
-        set_transient($cache_key, $content, $ttl);
+        if ($entry !== null && $entry['fresh_until'] > time()) {
+            $this->count_fragment('hits');
+            return self::$fragment_memo[$cache_key] = $entry['content'];
+        }
+
+        $this->count_fragment('misses');
+
+        if (!$this->acquire_fragment_lock($cache_key)) {
+            if ($entry !== null) {
+                // Another request is rebuilding; serve what we have
+                $this->count_fragment('stale_served');
+                return self::$fragment_memo[$cache_key] = $entry['content'];
+            }
+
+            // Cold miss while locked: build for this request only, the lock holder stores it
+            $this->count_fragment('rebuilds');
+            return self::$fragment_memo[$cache_key] = call_user_func($callback);
+        }
+
+        try {
+            $this->count_fragment('rebuilds');
+            $content = call_user_func($callback);
+            $this->save_fragment_entry($cache_key, $content, $ttl);
+        } finally {
+            $this->release_fragment_lock($cache_key);
+        }
         
-        return $content;
+        return self::$fragment_memo[$cache_key] = $content;
+    }
+
+    /**
+     * Read a stored fragment entry
+     *
+     * @since    1.4.0
+     * @access   private
+     * @param    string    $cache_key    Fragment cache key
+     * @return   array|null              Entry with content and fresh_until, or null
+     */
+    private function get_fragment_entry($cache_key) {
+        $entry = wp_using_ext_object_cache()
+            ? wp_cache_get($cache_key, 'hmg_ai')
+            : get_transient($cache_key);
+
+        if (!is_array($entry) || !isset($entry['fresh_until']) || !array_key_exists('content', $entry)) {
+            return null;
+        }
+
+        return $entry;
+    }
+
+    /**
+     * Store a fragment with a jittered TTL and a stale window
+     *
+     * @since    1.4.0
+     * @access   private
+     * @param    string    $cache_key    Fragment cache key
+     * @param    mixed     $content      Fragment content
+     * @param    int       $ttl          Time to live in seconds
+     */
+    private function save_fragment_entry($cache_key, $content, $ttl) {
+        $jitter = (mt_rand(-1000, 1000) / 1000) * self::FRAGMENT_TTL_JITTER;
+        $fresh_ttl = max(1, (int) round($ttl * (1 + $jitter)));
+        $expiration = $fresh_ttl + (int) ceil($ttl * self::FRAGMENT_STALE_FACTOR);
+
+        $entry = array(
+            'content' => $content,
+            'fresh_until' => time() + $fresh_ttl
+        );
+
+        if (wp_using_ext_object_cache()) {
+            wp_cache_set($cache_key, $entry, 'hmg_ai', $expiration);
+        } else {
+            set_transient($cache_key, $entry, $expiration);
+        }
+    }
+
+    /**
+     * Take the regeneration lock for a fragment
+     *
+     * Uses an atomic add on the object cache, or an INSERT IGNORE on the
+     * options table (the same approach as WP_Upgrader::create_lock).
+     *
+     * @since    1.4.0
+     * @access   private
+     * @param    string    $cache_key    Fragment cache key
+     * @return   bool                    Whether this request holds the lock
+     */
+    private function acquire_fragment_lock($cache_key) {
+        global $wpdb;
+
+        $lock_key = $cache_key . '_lock';
+
+        if (wp_using_ext_object_cache()) {
+            return wp_cache_add($lock_key, time(), 'hmg_ai', self::FRAGMENT_LOCK_TTL);
+        }
+
+        $inserted = $wpdb->query($wpdb->prepare(
+            "INSERT IGNORE INTO {$wpdb->options} (option_name, option_value, autoload) VALUES (%s, %s, 'no')",
+            $lock_key,
+            time()
+        ));
+
+        if ($inserted) {
+            return true;
+        }
+
+        // Take over a lock left behind by a request that died mid-rebuild
+        $locked_at = (int) $wpdb->get_var($wpdb->prepare(
+            "SELECT option_value FROM {$wpdb->options} WHERE option_name = %s",
+            $lock_key
+        ));
+
+        if ($locked_at > time() - self::FRAGMENT_LOCK_TTL) {
+            return false;
+        }
+
+        return (bool) $wpdb->query($wpdb->prepare(
+            "UPDATE {$wpdb->options} SET option_value = %s WHERE option_name = %s AND option_value = %s",
+            time(),
+            $lock_key,
+            $locked_at
+        ));
+    }
+
+    /**
+     * Release the regeneration lock for a fragment
+     *
+     * @since    1.4.0
+     * @access   private
+     * @param    string    $cache_key    Fragment cache key
+     */
+    private function release_fragment_lock($cache_key) {
+        if (wp_using_ext_object_cache()) {
+            wp_cache_delete($cache_key . '_lock', 'hmg_ai');
+        } else {
+            delete_option($cache_key . '_lock');
+        }
+    }
+
+    /**
+     * Count a fragment cache event
+     *
+     * With a persistent object cache every event is an atomic wp_cache_incr.
+     * Without one, only misses, stale serves and rebuilds are kept and added
+     * to the options table once at shutdown.
+     *
+     * @since    1.4.0
+     * @access   private
+     * @param    string    $counter    Counter name
+     */
+    private function count_fragment($counter) {
+        if (wp_using_ext_object_cache()) {
+            if (wp_cache_incr($counter, 1, 'hmg_ai_fragment_stats') === false) {
+                wp_cache_add($counter, 0, 'hmg_ai_fragment_stats');
+                wp_cache_incr($counter, 1, 'hmg_ai_fragment_stats');
+            }
+            return;
+        }
+
+        if (!in_array($counter, self::FRAGMENT_DB_COUNTERS, true)) {
+            return;
+        }
+
+        if (empty(self::$fragment_stats)) {
+            add_action('shutdown', array(__CLASS__, 'flush_fragment_stats'));
+        }
+
+        self::$fragment_stats[$counter] = (self::$fragment_stats[$counter] ?? 0) + 1;
+    }
+
+    /**
+     * Add this request's fragment cache counters to the stored totals
+     *
+     * Each counter is its own option, incremented in SQL so concurrent
+     * requests don't overwrite each other.
+     *
+     * @since    1.4.0
+     */
+    public static function flush_fragment_stats() {
+        global $wpdb;
+
+        foreach (self::$fragment_stats as $counter => $count) {
+            $option = 'hmg_ai_fragment_stat_' . $counter;
+
+            add_option($option, 0, '', 'no');
+            $wpdb->query($wpdb->prepare(
+                "UPDATE {$wpdb->options} SET option_value = option_value + %d WHERE option_name = %s",
+                $count,
+                $option
+            ));
+            wp_cache_delete($option, 'options');
+        }
+
+        self::$fragment_stats = array();
+    }
+
+    /**
+     * Reset the fragment cache counters
+     *
+     * @since    1.4.0
+     */
+    public static function reset_fragment_stats() {
+        foreach (self::FRAGMENT_COUNTERS as $counter) {
+            wp_cache_delete($counter, 'hmg_ai_fragment_stats');
+            delete_option('hmg_ai_fragment_stat_' . $counter);
+        }
+
+        self::$fragment_stats = array();
+    }
+
+    /**
+     * Get fragment cache counters including this request
+     *
+     * Hits are only counted with a persistent object cache; without one
+     * hits, memo hits and the hit rate are null.
+     *
+     * @since    1.4.0
+     * @return   array    Hits, misses, stale serves, rebuilds and hit rate
+     */
+    public function get_fragment_stats() {
+        $stats = array();
+
+        if (wp_using_ext_object_cache()) {
+            foreach (self::FRAGMENT_COUNTERS as $counter) {
+                $stats[$counter] = (int) wp_cache_get($counter, 'hmg_ai_fragment_stats');
+            }
+        } else {
+            foreach (self::FRAGMENT_COUNTERS as $counter) {
+                $stats[$counter] = null;
+            }
+            foreach (self::FRAGMENT_DB_COUNTERS as $counter) {
+                $stats[$counter] = (int) get_option('hmg_ai_fragment_stat_' . $counter, 0)
+                    + (self::$fragment_stats[$counter] ?? 0);
+            }
+        }
+
+        if ($stats['hits'] === null) {
+            $stats['hit_rate'] = null;
+            return $stats;
+        }
+
+        $lookups = $stats['hits'] + $stats['memo_hits'] + $stats['misses'];
+        $served = $stats['hits'] + $stats['memo_hits'] + $stats['stale_served'];
+        $stats['hit_rate'] = $lookups > 0 ? round($served / $lookups * 100, 1) : 0;
+
+        return $stats;
     }
 
     /**
@@ -61,6 +61,90 @@ class HMG_AI_Service_Manager {
      */
     private $context_analyzer;
 
+    /**
+     * Providers whose half-open probe this request holds
+     *
+     * @since    1.3.0
+     * @access   private
+     * @var      array    $held_probes    Provider key => true.
+     */
+    private $held_probes = array();
+
+    /**
+     * Default maximum number of cached generation responses
+     *
+     * @since    1.3.0
+     * @var      int
+     */
+    const DEFAULT_CACHE_MAX_ENTRIES = 1000;
+
+    /**
+     * Prefix of the response cache keys this class writes
+     *
+     * Other writers to the content cache table use plain md5 keys, so the
+     * prefix (not a hex digit) keeps eviction to this cache's own rows.
+     *
+     * @since    1.3.0
+     * @var      string
+     */
+    const RESPONSE_CACHE_KEY_PREFIX = 'r:';
+
+    /**
+     * Number of recent response times kept per provider for hedging
+     *
+     * @since    1.3.0
+     * @var      int
+     */
+    const LATENCY_SAMPLE_SIZE = 50;
+
+    /**
+     * Response times needed before a provider's latency percentile is trusted
+     *
+     * @since    1.3.0
+     * @var      int
+     */
+    const MIN_LATENCY_SAMPLES = 10;
+
+    /**
+     * Number of recent hedge-eligible requests used for the hedge rate cap
+     *
+     * @since    1.3.0
+     * @var      int
+     */
+    const HEDGE_WINDOW_SIZE = 100;
+
+    /**
+     * Consecutive failures that open a provider's circuit breaker
+     *
+     * @since    1.3.0
+     * @var      int
+     */
+    const BREAKER_FAILURE_THRESHOLD = 3;
+
+    /**
+     * Seconds an open circuit waits before letting a probe request through
+     *
+     * @since    1.3.0
+     * @var      int
+     */
+    const BREAKER_COOLDOWN = 60;
+
+    /**
+     * Weight of the newest sample in the latency and error rate averages
+     *
+     * @since    1.3.0
+     * @var      float
+     */
+    const EWMA_ALPHA = 0.3;
+
+    /**
+     * How much worse than the best score a higher priority provider may be and still be chosen
+     *
+     * @since    1.3.0
+     * @var      float
+     */
+    const ROUTING_SCORE_TOLERANCE = 1.5;
+
     /**
      * Initialize the AI service manager
      *
@@ -167,15 +251,40 @@ class HMG_AI_Service_Manager {
             );
         }
 
-        // Try the preferred provider first
-        $result = $this->try_provider($preferred_provider, $content_type, $content, $post_id, $options);
+        // Serve unchanged content from the response cache unless regeneration was forced
+        $cache_key = $this->get_response_cache_key($preferred_provider, $content_type, $content, $options);
+        if ($cache_key && empty($options['force_regenerate'])) {
+            $cached_result = $this->get_cached_response($cache_key);
+            $this->log_cache_lookup($preferred_provider, $cached_result !== false);
+
+            if ($cached_result !== false) {
+                return $cached_result;
+            }
+        }
+
+        $fallback_providers = $this->get_fallback_providers($preferred_provider, $content_type);
+
+        // Try the preferred provider first, hedged with the first fallback when enabled
+        if ($this->is_hedging_enabled($options) && !empty($fallback_providers)
+            && $this->supports_hedging($preferred_provider, $content_type)
+            && $this->supports_hedging($fallback_providers[0], $content_type)) {
+            $result = $this->try_provider_hedged($preferred_provider, $fallback_providers[0], $content_type, $content, $post_id, $options);
+        } else {
+            $result = $this->try_provider($preferred_provider, $content_type, $content, $post_id, $options);
+        }
         
         if ($result['success']) {
+            if ($cache_key) {
+                $this->cache_response($cache_key, $result, $content_type, $preferred_provider);
+            }
             return $result;
         }
 
-        // If preferred provider failed, try fallback providers
-        $fallback_providers = $this->get_fallback_providers($preferred_provider, $content_type);
+        // Errors are collected as providers are tried so none has to be called again to report them
+        $provider_errors = $result['provider_errors'] ?? array($preferred_provider => $result['error']);
+
+        // If preferred provider failed, try fallback providers not already tried by the hedge
+        $fallback_providers = array_diff($fallback_providers, $result['attempted_providers'] ?? array());
         
         foreach ($fallback_providers as $provider_key) {
             $fallback_result = $this->try_provider($provider_key, $content_type, $content, $post_id, $options);
@@ -185,9 +294,16 @@ class HMG_AI_Service_Manager {
                 $fallback_result['provider_used'] = $provider_key;
                 $fallback_result['fallback_used'] = true;
                 $fallback_result['original_error'] = $result['error'];
+
+                // Cached under the preferred provider's key so a re-run doesn't retry the failing provider
+                if ($cache_key) {
+                    $this->cache_response($cache_key, $fallback_result, $content_type, $provider_key);
+                }
                 
                 return $fallback_result;
             }
+
+            $provider_errors[$provider_key] = $fallback_result['error'];
         }
 
         // All providers failed
@@ -197,7 +313,7 @@ class HMG_AI_Service_Manager {
                 __('Content generation failed. Primary error: %s', 'hmg-ai-blog-enhancer'),
                 $result['error']
             ),
-            'provider_errors' => $this->get_all_provider_errors($content_type, $content, $post_id)
+            'provider_errors' => $this->get_all_provider_errors($content_type, $provider_errors)
         );
     }
 
@@ -241,12 +357,19 @@ class HMG_AI_Service_Manager {
             );
         }
 
+        // Skip providers whose circuit breaker is open
+        if (!$this->acquire_circuit($provider_key)) {
+            return array(
+                'success' => false,
+                'error' => sprintf(
+                    __('Provider %s is temporarily skipped after repeated failures.', 'hmg-ai-blog-enhancer'),
+                    $this->providers[$provider_key]['name']
+                )
+            );
+        }
+
         try {
-            // Add brand context if available
-            $generation_options = array();
-            if ($this->context_analyzer && ($this->options['use_brand_context'] ?? false)) {
-                $generation_options['brand_context'] = $this->context_analyzer->get_ai_context();
-            }
+            $generation_options = $this->get_generation_options($options);
             
             $start_time = microtime(true);
             $result = $provider->generate_content($content_type, $content, $post_id, $generation_options);
@@ -261,21 +384,606 @@ class HMG_AI_Service_Manager {
                 $this->log_generation_success($provider_key, $content_type, $generation_time, $result['tokens_used'] ?? 0);
             } else {
                 // Log generation failure
-                $this->log_generation_failure($provider_key, $content_type, $result['error']);
+                $this->log_generation_failure($provider_key, $content_type, $result['error'], $this->is_provider_fault($result));
             }
 
             return $result;
 
         } catch (Exception $e) {
+            $error = sprintf(
+                __('Provider %s encountered an error: %s', 'hmg-ai-blog-enhancer'),
+                $this->providers[$provider_key]['name'],
+                $e->getMessage()
+            );
+            $this->log_generation_failure($provider_key, $content_type, $error);
+
+            return array(
+                'success' => false,
+                'error' => $error
+            );
+        }
+    }
+
+    /**
+     * Build the options passed on to a provider's generate_content()
+     *
+     * @since    1.3.0
+     * @param    array    $options    Request options.
+     * @return   array                Provider generation options.
+     */
+    private function get_generation_options($options) {
+        // Add brand context if available
+        $generation_options = array();
+        if ($this->context_analyzer && ($this->options['use_brand_context'] ?? false)) {
+            $generation_options['brand_context'] = $this->context_analyzer->get_ai_context();
+        }
+        if (!empty($options['force_regenerate'])) {
+            $generation_options['force_regenerate'] = true;
+        }
+
+        return $generation_options;
+    }
+
+    /**
+     * Whether hedged requests are enabled and possible for this request
+     *
+     * @since    1.3.0
+     * @param    array    $options    Request options.
+     * @return   bool                 Whether to hedge.
+     */
+    private function is_hedging_enabled($options) {
+        if (isset($options['hedge'])) {
+            $enabled = (bool) $options['hedge'];
+        } else {
+            $enabled = (bool) ($this->options['hedging_enabled'] ?? false);
+        }
+
+        return $enabled && function_exists('curl_multi_init');
+    }
+
+    /**
+     * Whether a provider can take part in a hedged request
+     *
+     * Hedged requests are sent by the manager itself, so the provider has to
+     * expose its HTTP request and response handling separately.
+     *
+     * @since    1.3.0
+     * @param    string    $provider_key    Provider key.
+     * @param    string    $content_type    Type of content to generate.
+     * @return   bool                       Whether the provider supports hedging.
+     */
+    private function supports_hedging($provider_key, $content_type) {
+        if (!isset($this->providers[$provider_key]) || !$this->providers[$provider_key]['enabled']
+            || !in_array($content_type, $this->providers[$provider_key]['features'])) {
+            return false;
+        }
+
+        $provider = $this->get_provider_instance($provider_key);
+
+        return $provider
+            && method_exists($provider, 'build_generation_request')
+            && method_exists($provider, 'parse_generation_response');
+    }
+
+    /**
+     * Try the primary provider, firing a backup in parallel if it is slow
+     *
+     * The primary request is sent on its own. If it hasn't answered after
+     * the configured percentile of its recent response times, the same
+     * request goes to the backup provider and the first valid response wins.
+     * Whether the backup may be fired at all is bounded by the per-request
+     * latency budget, the estimated cost of the backup call and the share of
+     * recent requests that were hedged.
+     *
+     * @since    1.3.0
+     * @param    string    $primary         Primary provider key.
+     * @param    string    $backup          Backup provider key.
+     * @param    string    $content_type    Type of content to generate.
+     * @param    string    $content         Source content.
+     * @param    int       $post_id         Post ID.
+     * @param    array     $options         Additional options.
+     * @return   array                      Generation result; attempted_providers lists the providers tried.
+     */
+    private function try_provider_hedged($primary, $backup, $content_type, $content, $post_id, $options) {
+        $budget = (float) ($options['latency_budget'] ?? $this->options['hedge_latency_budget'] ?? 60);
+        $hedge_delay = $this->get_hedge_delay($primary, $backup, $budget);
+        $can_hedge = $hedge_delay !== null && $this->can_afford_hedge($backup, $content, $options);
+
+        $generation_options = $this->get_generation_options($options);
+        $multi_handle = curl_multi_init();
+        $attempts = array();
+        $errors = array();
+        $winner = null;
+        $hedged = false;
+        $start_time = microtime(true);
+
+        $attempt = $this->start_hedged_attempt($multi_handle, $primary, $content_type, $content, $post_id, $generation_options);
+        if (isset($attempt['success'])) {
+            // Validation error or cached content: nothing was sent
+            curl_multi_close($multi_handle);
+            $attempt['attempted_providers'] = array($primary);
+            return $this->finish_attempt($primary, $attempt, 0);
+        }
+        $attempts[$primary] = $attempt;
+
+        while ($winner === null && !empty($attempts)) {
+            curl_multi_exec($multi_handle, $running);
+
+            while ($info = curl_multi_info_read($multi_handle)) {
+                foreach ($attempts as $provider_key => $attempt) {
+                    if ($attempt['handle'] !== $info['handle']) {
+                        continue;
+                    }
+
+                    $result = $this->complete_hedged_attempt($provider_key, $attempt, $info['result']);
+                    curl_multi_remove_handle($multi_handle, $attempt['handle']);
+                    curl_close($attempt['handle']);
+                    unset($attempts[$provider_key]);
+
+                    if ($result['success']) {
+                        $winner = $result;
+                        break 2;
+                    }
+                    $errors[$provider_key] = $result['error'];
+                }
+            }
+
+            if ($winner !== null) {
+                break;
+            }
+
+            $elapsed = microtime(true) - $start_time;
+
+            // The primary is slower than usual: race it against the backup
+            if (!$hedged && $can_hedge && isset($attempts[$primary]) && $elapsed >= $hedge_delay) {
+                $hedged = true;
+                $attempt = $this->start_hedged_attempt($multi_handle, $backup, $content_type, $content, $post_id, $generation_options);
+                if (isset($attempt['success'])) {
+                    if ($attempt['success']) {
+                        $winner = $this->finish_attempt($backup, $attempt, 0);
+                        break;
+                    }
+                    $errors[$backup] = $attempt['error'];
+                } else {
+                    $attempts[$backup] = $attempt;
+                }
+            }
+
+            if ($elapsed >= $budget) {
+                foreach (array_keys($attempts) as $provider_key) {
+                    $errors[$provider_key] = sprintf(
+                        __('No response within the %s second latency budget.', 'hmg-ai-blog-enhancer'),
+                        $budget
+                    );
+                    $this->log_generation_failure($provider_key, $content_type, $errors[$provider_key], true);
+                }
+                break;
+            }
+
+            if (!empty($attempts) && curl_multi_select($multi_handle, 0.05) === -1) {
+                usleep(10000);
+            }
+        }
+
+        // Cancel whichever request lost the race; a cancelled half-open probe
+        // tells us nothing, so its circuit goes back to open for the next probe
+        foreach ($attempts as $provider_key => $attempt) {
+            curl_multi_remove_handle($multi_handle, $attempt['handle']);
+            curl_close($attempt['handle']);
+            $this->release_circuit($provider_key);
+        }
+        curl_multi_close($multi_handle);
+
+        if ($can_hedge) {
+            $this->log_hedge_decision($backup, $hedged, $winner !== null && $winner['provider_used'] === $backup);
+        }
+
+        $attempted = $hedged ? array($primary, $backup) : array($primary);
+
+        if ($winner !== null) {
+            if ($winner['provider_used'] !== $primary) {
+                $winner['fallback_used'] = true;
+                $winner['original_error'] = $errors[$primary] ?? __('Primary provider was slower than the hedge delay.', 'hmg-ai-blog-enhancer');
+            }
+            $winner['hedged'] = $hedged;
+            $winner['attempted_providers'] = $attempted;
+            return $winner;
+        }
+
+        return array(
+            'success' => false,
+            'error' => $errors[$primary] ?? reset($errors),
+            'hedged' => $hedged,
+            'attempted_providers' => $attempted,
+            'provider_errors' => $errors
+        );
+    }
+
+    /**
+     * Add a provider's generation request to a curl multi handle
+     *
+     * @since    1.3.0
+     * @param    resource  $multi_handle          curl multi handle.
+     * @param    string    $provider_key          Provider key.
+     * @param    string    $content_type          Type of content to generate.
+     * @param    string    $content               Source content.
+     * @param    int       $post_id               Post ID.
+     * @param    array     $generation_options    Provider generation options.
+     * @return   array                            Attempt (handle, request, start time) or a finished result.
+     */
+    private function start_hedged_attempt($multi_handle, $provider_key, $content_type, $content, $post_id, $generation_options) {
+        if (!$this->acquire_circuit($provider_key)) {
             return array(
                 'success' => false,
                 'error' => sprintf(
-                    __('Provider %s encountered an error: %s', 'hmg-ai-blog-enhancer'),
-                    $this->providers[$provider_key]['name'],
-                    $e->getMessage()
+                    __('Provider %s is temporarily skipped after repeated failures.', 'hmg-ai-blog-enhancer'),
+                    $this->providers[$provider_key]['name']
                 )
             );
         }
+
+        $request = $this->get_provider_instance($provider_key)->build_generation_request($content_type, $content, $post_id, $generation_options);
+
+        if (isset($request['success'])) {
+            if (!$request['success']) {
+                $this->log_generation_failure($provider_key, $content_type, $request['error']);
+            } else {
+                // Served from the provider's own cache, so nothing was probed
+                $this->release_circuit($provider_key);
+            }
+            return $request;
+        }
+
+        $headers = array();
+        foreach ($request['headers'] as $name => $value) {
+            $headers[] = $name . ': ' . $value;
+        }
+
+        $handle = curl_init($request['url']);
+        curl_setopt_array($handle, array(
+            CURLOPT_POST => true,
+            CURLOPT_POSTFIELDS => $request['body'],
+            CURLOPT_HTTPHEADER => $headers,
+            CURLOPT_RETURNTRANSFER => true,
+            CURLOPT_TIMEOUT => $request['timeout'],
+            CURLOPT_CONNECTTIMEOUT => 10,
+            CURLOPT_SSL_VERIFYPEER => true,
+            CURLOPT_CAINFO => ABSPATH . WPINC . '/certificates/ca-bundle.crt',
+            CURLOPT_USERAGENT => 'WordPress/' . get_bloginfo('version') . '; ' . home_url()
+        ));
+        curl_multi_add_handle($multi_handle, $handle);
+
+        return array(
+            'handle' => $handle,
+            'request' => $request,
+            'content_type' => $content_type,
+            'start_time' => microtime(true)
+        );
+    }
+
+    /**
+     * Parse a finished hedged request and log the outcome
+     *
+     * @since    1.3.0
+     * @param    string    $provider_key    Provider key.
+     * @param    array     $attempt         Attempt from start_hedged_attempt().
+     * @param    int       $curl_result     CURLE_* code of the transfer.
+     * @return   array                      Generation result.
+     */
+    private function complete_hedged_attempt($provider_key, $attempt, $curl_result) {
+        $generation_time = microtime(true) - $attempt['start_time'];
+
+        if ($curl_result !== CURLE_OK) {
+            $result = array(
+                'success' => false,
+                'error' => sprintf(__('API request failed: %s', 'hmg-ai-blog-enhancer'), curl_error($attempt['handle'])),
+                'status_code' => 0
+            );
+        } else {
+            $result = $this->get_provider_instance($provider_key)->parse_generation_response(
+                $attempt['request'],
+                (int) curl_getinfo($attempt['handle'], CURLINFO_HTTP_CODE),
+                curl_multi_getcontent($attempt['handle'])
+            );
+        }
+
+        if (!$result['success']) {
+            $this->log_generation_failure($provider_key, $attempt['content_type'], $result['error'], $this->is_provider_fault($result));
+            return $result;
+        }
+
+        return $this->finish_attempt($provider_key, $result, $generation_time, $attempt['content_type']);
+    }
+
+    /**
+     * Label a provider result the way try_provider() does and log successes
+     *
+     * @since    1.3.0
+     * @param    string     $provider_key       Provider key.
+     * @param    array      $result             Generation result.
+     * @param    float      $generation_time    Time taken to generate.
+     * @param    string     $content_type       Content type, to log successful generations.
+     * @return   array                          Labelled result.
+     */
+    private function finish_attempt($provider_key, $result, $generation_time, $content_type = null) {
+        if ($result['success']) {
+            $result['provider_used'] = $provider_key;
+            $result['provider_name'] = $this->providers[$provider_key]['name'];
+            $result['generation_time'] = round($generation_time, 2);
+
+            if ($content_type !== null) {
+                $this->log_generation_success($provider_key, $content_type, $generation_time, $result['tokens_used'] ?? 0);
+            }
+        }
+
+        return $result;
+    }
+
+    /**
+     * Get how long to wait for the primary before firing the backup
+     *
+     * @since    1.3.0
+     * @param    string    $primary    Primary provider key.
+     * @param    string    $backup     Backup provider key.
+     * @param    float     $budget     Latency budget in seconds.
+     * @return   float|null            Delay in seconds, or null if a hedge couldn't help.
+     */
+    private function get_hedge_delay($primary, $backup, $budget) {
+        $primary_times = get_option('hmg_ai_provider_metrics_' . $primary, array())['recent_times'] ?? array();
+        if (count($primary_times) < self::MIN_LATENCY_SAMPLES) {
+            // Not enough history to tell slow from normal
+            return null;
+        }
+
+        $delay = $this->latency_percentile($primary_times, (float) ($this->options['hedge_percentile'] ?? 95));
+
+        // The backup needs time to answer within the budget after it is fired
+        $backup_times = get_option('hmg_ai_provider_metrics_' . $backup, array())['recent_times'] ?? array();
+        $backup_median = count($backup_times) >= self::MIN_LATENCY_SAMPLES ? $this->latency_percentile($backup_times, 50) : 0;
+
+        return $delay + $backup_median < $budget ? $delay : null;
+    }
+
+    /**
+     * Whether the cost and rate caps allow firing a backup request
+     *
+     * @since    1.3.0
+     * @param    string    $backup     Backup provider key.
+     * @param    string    $content    Source content.
+     * @param    array     $options    Request options.
+     * @return   bool                  Whether a hedge may be fired.
+     */
+    private function can_afford_hedge($backup, $content, $options) {
+        // Rough estimate: 1 token ≈ 4 characters, output about half the prompt
+        $estimated_cost = (strlen($content) / 4) * 1.5 * $this->providers[$backup]['cost_per_token'];
+        $max_cost = (float) ($options['max_hedge_cost'] ?? $this->options['hedge_max_cost'] ?? 0.05);
+        if ($estimated_cost > $max_cost) {
+            return false;
+        }
+
+        $window = get_option('hmg_ai_hedge_window', array());
+        if (count($window) < 10) {
+            return true;
+        }
+
+        $max_rate = (float) ($this->options['hedge_max_rate'] ?? 0.2);
+
+        return array_sum($window) / count($window) < $max_rate;
+    }
+
+    /**
+     * Record whether a hedge-eligible request fired its backup
+     *
+     * @since    1.3.0
+     * @param    string    $backup    Backup provider key.
+     * @param    bool      $hedged    Whether the backup was fired.
+     * @param    bool      $won       Whether the backup's response was used.
+     */
+    private function log_hedge_decision($backup, $hedged, $won) {
+        $window = get_option('hmg_ai_hedge_window', array());
+        $window[] = $hedged ? 1 : 0;
+        update_option('hmg_ai_hedge_window', array_slice($window, -self::HEDGE_WINDOW_SIZE), false);
+
+        if (!$hedged) {
+            return;
+        }
+
+        $metrics_key = 'hmg_ai_provider_metrics_' . $backup;
+        $metrics = get_option($metrics_key, array(
+            'total_requests' => 0,
+            'successful_requests' => 0,
+            'total_time' => 0,
+            'total_tokens' => 0
+        ));
+
+        $metrics['hedge_requests'] = ($metrics['hedge_requests'] ?? 0) + 1;
+        if ($won) {
+            $metrics['hedge_wins'] = ($metrics['hedge_wins'] ?? 0) + 1;
+        }
+
+        update_option($metrics_key, $metrics);
+    }
+
+    /**
+     * Get a percentile of a list of response times
+     *
+     * @since    1.3.0
+     * @param    array    $times         Response times in seconds.
+     * @param    float    $percentile    Percentile (0-100).
+     * @return   float                   Response time at the percentile.
+     */
+    private function latency_percentile($times, $percentile) {
+        sort($times);
+        $index = (int) ceil(($percentile / 100) * count($times)) - 1;
+
+        return (float) $times[max(0, min(count($times) - 1, $index))];
+    }
+
+    /**
+     * Build the response cache key for a generation request
+     *
+     * The key covers everything that changes the generated output: the
+     * normalized source content, content type, provider, the provider's
+     * configured model and the prompt options (including brand context).
+     *
+     * @since    1.3.0
+     * @param    string    $provider_key    Provider key.
+     * @param    string    $content_type    Type of content to generate.
+     * @param    string    $content         Source content.
+     * @param    array     $options         Additional options.
+     * @return   string|null                32 character cache key (RESPONSE_CACHE_KEY_PREFIX + hash) or null when caching is disabled.
+     */
+    private function get_response_cache_key($provider_key, $content_type, $content, $options) {
+        if (!($this->options['cache_enabled'] ?? true)) {
+            return null;
+        }
+
+        // Markup and whitespace differences don't change what the providers see
+        $normalized_content = trim(preg_replace('/\s+/u', ' ', wp_strip_all_tags($content)));
+        if ($normalized_content === '') {
+            return null;
+        }
+
+        // Request options that only steer routing or caching are not part of the prompt
+        $prompt_options = array_diff_key($options, array_flip(array(
+            'provider', 'optimize_for', 'force_regenerate', 'hedge', 'latency_budget', 'max_hedge_cost'
+        )));
+        ksort($prompt_options);
+
+        if ($this->context_analyzer && ($this->options['use_brand_context'] ?? false)) {
+            $prompt_options['brand_context'] = md5($this->context_analyzer->get_ai_context());
+        }
+
+        $hash = md5(wp_json_encode(array(
+            'content' => md5($normalized_content),
+            'content_type' => $content_type,
+            'provider' => $provider_key,
+            'model' => $this->options[$provider_key . '_model'] ?? '',
+            'options' => $prompt_options
+        )));
+
+        return self::RESPONSE_CACHE_KEY_PREFIX . substr($hash, 0, 32 - strlen(self::RESPONSE_CACHE_KEY_PREFIX));
+    }
+
+    /**
+     * Get a cached generation response
+     *
+     * @since    1.3.0
+     * @param    string    $cache_key    Cache key.
+     * @return   array|false             Cached generation result or false if not found.
+     */
+    private function get_cached_response($cache_key) {
+        global $wpdb;
+
+        $cache_table = $wpdb->prefix . 'hmg_ai_content_cache';
+
+        $cached = $wpdb->get_var($wpdb->prepare(
+            "SELECT content FROM {$cache_table} 
+            WHERE cache_key = %s 
+            AND expires_at > %s 
+            LIMIT 1",
+            $cache_key,
+            current_time('mysql')
+        ));
+
+        $result = $cached ? json_decode($cached, true) : null;
+        if (!is_array($result) || !isset($result['content'])) {
+            return false;
+        }
+
+        $result['success'] = true;
+        $result['cached'] = true;
+        $result['tokens_used'] = 0;
+        $result['generation_time'] = 0;
+        $result['message'] = __('Content retrieved from cache.', 'hmg-ai-blog-enhancer');
+
+        return $result;
+    }
+
+    /**
+     * Cache a successful generation response
+     *
+     * Expired entries are removed on write and the table is trimmed to the
+     * configured maximum number of entries, oldest first.
+     *
+     * @since    1.3.0
+     * @param    string    $cache_key       Cache key.
+     * @param    array     $result          Generation result.
+     * @param    string    $content_type    Type of content generated.
+     * @param    string    $provider_key    Provider the request was routed to.
+     * @return   bool                       Whether caching was successful.
+     */
+    private function cache_response($cache_key, $result, $content_type, $provider_key) {
+        global $wpdb;
+
+        $cache_table = $wpdb->prefix . 'hmg_ai_content_cache';
+        $cache_duration = (int) ($this->options['cache_duration'] ?? 3600);
+        $now = current_time('timestamp');
+
+        $cached = $wpdb->replace(
+            $cache_table,
+            array(
+                'cache_key' => $cache_key,
+                'content' => wp_json_encode(array(
+                    'content' => $result['content'],
+                    'provider_used' => $result['provider_used'] ?? $provider_key,
+                    'provider_name' => $result['provider_name'] ?? $this->providers[$provider_key]['name']
+                )),
+                'content_type' => $content_type,
+                'provider' => $result['provider_used'] ?? $provider_key,
+                'created_at' => date('Y-m-d H:i:s', $now),
+                'expires_at' => date('Y-m-d H:i:s', $now + $cache_duration)
+            ),
+            array('%s', '%s', '%s', '%s', '%s', '%s')
+        );
+
+        // Size bound: drop expired entries, then the oldest beyond the limit. Only
+        // this cache's own rows count, other writers share the table.
+        $key_pattern = $wpdb->esc_like(self::RESPONSE_CACHE_KEY_PREFIX) . '%';
+
+        $wpdb->query($wpdb->prepare(
+            "DELETE FROM {$cache_table} WHERE cache_key LIKE %s AND expires_at <= %s",
+            $key_pattern,
+            date('Y-m-d H:i:s', $now)
+        ));
+
+        // Bounded like the setting, for options saved before it was clamped
+        $max_entries = max(50, min(100000, (int) ($this->options['cache_max_entries'] ?? self::DEFAULT_CACHE_MAX_ENTRIES)));
+        $overflow = (int) $wpdb->get_var($wpdb->prepare(
+            "SELECT COUNT(*) FROM {$cache_table} WHERE cache_key LIKE %s",
+            $key_pattern
+        )) - $max_entries;
+        if ($overflow > 0) {
+            $wpdb->query($wpdb->prepare(
+                "DELETE FROM {$cache_table} WHERE cache_key LIKE %s ORDER BY created_at ASC, id ASC LIMIT %d",
+                $key_pattern,
+                $overflow
+            ));
+        }
+
+        return (bool) $cached;
+    }
+
+    /**
+     * Count a response cache hit or miss for a provider
+     *
+     * @since    1.3.0
+     * @param    string    $provider    Provider key.
+     * @param    bool      $hit         Whether the lookup was a hit.
+     */
+    private function log_cache_lookup($provider, $hit) {
+        $metrics_key = 'hmg_ai_provider_metrics_' . $provider;
+        $metrics = get_option($metrics_key, array(
+            'total_requests' => 0,
+            'successful_requests' => 0,
+            'total_time' => 0,
+            'total_tokens' => 0
+        ));
+
+        $counter = $hit ? 'cache_hits' : 'cache_misses';
+        $metrics[$counter] = ($metrics[$counter] ?? 0) + 1;
+
+        update_option($metrics_key, $metrics);
     }
 
     /**
@@ -300,6 +1008,11 @@ class HMG_AI_Service_Manager {
                 continue;
             }
 
+            // Skip providers that are failing right now
+            if (!$this->is_circuit_available($key)) {
+                continue;
+            }
+
             $available_providers[$key] = $provider;
         }
 
@@ -328,10 +1041,206 @@ class HMG_AI_Service_Manager {
             return $best_provider;
         }
 
-        // Default: return highest priority (lowest priority number)
+        // Default: highest priority provider unless its live latency and error rate
+        // are clearly worse than the best available provider's
+        $scores = array();
+        foreach (array_keys($available_providers) as $key) {
+            $scores[$key] = $this->get_provider_score($key);
+        }
+
+        $known_scores = array_filter($scores, function($score) {
+            return $score !== null;
+        });
+        if (empty($known_scores)) {
+            return array_key_first($available_providers);
+        }
+
+        $best_score = min($known_scores);
+        foreach ($scores as $key => $score) {
+            // Providers without history are given the benefit of the doubt
+            if ($score === null || $score <= $best_score * self::ROUTING_SCORE_TOLERANCE) {
+                return $key;
+            }
+        }
+
         return array_key_first($available_providers);
     }
 
+    /**
+     * Score a provider by its recent latency and error rate
+     *
+     * The score is the expected time to a successful response when failed
+     * requests have to be repeated: EWMA latency / (1 - EWMA error rate).
+     * Lower is better.
+     *
+     * @since    1.3.0
+     * @param    string    $provider_key    Provider key.
+     * @return   float|null                 Score in seconds, or null without latency history.
+     */
+    private function get_provider_score($provider_key) {
+        $circuit = $this->get_circuit($provider_key);
+        if ($circuit['ewma_latency'] === null) {
+            return null;
+        }
+
+        return $circuit['ewma_latency'] / max(0.05, 1 - $circuit['ewma_error_rate']);
+    }
+
+    /**
+     * Get a provider's circuit breaker state
+     *
+     * Circuit state lives in the object cache so every PHP worker sees the
+     * same state; without a persistent object cache it falls back to a
+     * transient.
+     *
+     * @since    1.3.0
+     * @param    string    $provider_key    Provider key.
+     * @return   array                      Circuit state.
+     */
+    private function get_circuit($provider_key) {
+        $cache_key = 'hmg_ai_circuit_' . $provider_key;
+        $circuit = wp_using_ext_object_cache()
+            ? wp_cache_get($cache_key, 'hmg_ai')
+            : get_transient($cache_key);
+
+        if (!is_array($circuit)) {
+            $circuit = array(
+                'state' => 'closed',
+                'consecutive_failures' => 0,
+                'opened_at' => 0,
+                'probe_started' => 0,
+                'ewma_latency' => null,
+                'ewma_error_rate' => 0
+            );
+        }
+
+        return $circuit;
+    }
+
+    /**
+     * Store a provider's circuit breaker state
+     *
+     * @since    1.3.0
+     * @param    string    $provider_key    Provider key.
+     * @param    array     $circuit         Circuit state.
+     */
+    private function save_circuit($provider_key, $circuit) {
+        $cache_key = 'hmg_ai_circuit_' . $provider_key;
+
+        if (wp_using_ext_object_cache()) {
+            wp_cache_set($cache_key, $circuit, 'hmg_ai', DAY_IN_SECONDS);
+        } else {
+            set_transient($cache_key, $circuit, DAY_IN_SECONDS);
+        }
+    }
+
+    /**
+     * Whether a provider's circuit would let a request through
+     *
+     * @since    1.3.0
+     * @param    string    $provider_key    Provider key.
+     * @return   bool                       Whether the provider can be tried.
+     */
+    private function is_circuit_available($provider_key) {
+        $circuit = $this->get_circuit($provider_key);
+
+        switch ($circuit['state']) {
+            case 'open':
+                return time() - $circuit['opened_at'] >= self::BREAKER_COOLDOWN;
+            case 'half_open':
+                // Only one probe at a time, unless the last one never reported back
+                return time() - $circuit['probe_started'] >= self::BREAKER_COOLDOWN;
+            default:
+                return true;
+        }
+    }
+
+    /**
+     * Claim a request slot from a provider's circuit breaker
+     *
+     * A closed circuit always lets requests through. Once an open circuit
+     * has cooled down it becomes half-open and lets a single probe through;
+     * the probe's outcome closes or re-opens it.
+     *
+     * @since    1.3.0
+     * @param    string    $provider_key    Provider key.
+     * @return   bool                       Whether the request may be sent.
+     */
+    private function acquire_circuit($provider_key) {
+        if (!$this->is_circuit_available($provider_key)) {
+            return false;
+        }
+
+        $circuit = $this->get_circuit($provider_key);
+        if ($circuit['state'] !== 'closed') {
+            $circuit['state'] = 'half_open';
+            $circuit['probe_started'] = time();
+            $this->save_circuit($provider_key, $circuit);
+            $this->held_probes[$provider_key] = true;
+        }
+
+        return true;
+    }
+
+    /**
+     * Give back a probe slot without reporting an outcome
+     *
+     * Used when this request's probe ends without telling us anything about
+     * the provider (a rejected request, or a hedge the backup won). The
+     * circuit goes back to open with its original opened_at, so the next
+     * request can probe straight away.
+     *
+     * @since    1.3.0
+     * @param    string    $provider_key    Provider key.
+     */
+    private function release_circuit($provider_key) {
+        if (empty($this->held_probes[$provider_key])) {
+            return;
+        }
+        unset($this->held_probes[$provider_key]);
+
+        $circuit = $this->get_circuit($provider_key);
+        if ($circuit['state'] === 'half_open') {
+            $circuit['state'] = 'open';
+            $circuit['probe_started'] = 0;
+            $this->save_circuit($provider_key, $circuit);
+        }
+    }
+
+    /**
+     * Feed a request outcome into a provider's circuit breaker and averages
+     *
+     * @since    1.3.0
+     * @param    string       $provider_key       Provider key.
+     * @param    bool         $success            Whether the request succeeded.
+     * @param    float|null   $generation_time    Response time of a successful request.
+     */
+    private function record_circuit_outcome($provider_key, $success, $generation_time = null) {
+        unset($this->held_probes[$provider_key]);
+        $circuit = $this->get_circuit($provider_key);
+
+        $circuit['ewma_error_rate'] = self::EWMA_ALPHA * ($success ? 0 : 1)
+            + (1 - self::EWMA_ALPHA) * $circuit['ewma_error_rate'];
+
+        if ($success) {
+            $circuit['ewma_latency'] = $circuit['ewma_latency'] === null
+                ? $generation_time
+                : self::EWMA_ALPHA * $generation_time + (1 - self::EWMA_ALPHA) * $circuit['ewma_latency'];
+            $circuit['consecutive_failures'] = 0;
+            $circuit['state'] = 'closed';
+        } else {
+            $circuit['consecutive_failures']++;
+
+            // A failed probe re-opens the circuit straight away
+            if ($circuit['state'] === 'half_open' || $circuit['consecutive_failures'] >= self::BREAKER_FAILURE_THRESHOLD) {
+                $circuit['state'] = 'open';
+                $circuit['opened_at'] = time();
+            }
+        }
+
+        $this->save_circuit($provider_key, $circuit);
+    }
+
     /**
      * Get fallback providers for a failed provider
      *
@@ -344,7 +1253,7 @@ class HMG_AI_Service_Manager {
         $fallbacks = array();
 
         foreach ($this->providers as $key => $provider) {
-            if ($key === $failed_provider || !$provider['enabled']) {
+            if ($key === $failed_provider || !$provider['enabled'] || !$this->is_circuit_available($key)) {
                 continue;
             }
 
@@ -494,7 +1403,13 @@ class HMG_AI_Service_Manager {
         $metrics['total_tokens'] += $tokens_used;
         $metrics['last_success'] = current_time('mysql');
 
+        // Keep recent response times for the hedge delay percentile
+        $metrics['recent_times'][] = round($generation_time, 3);
+        $metrics['recent_times'] = array_slice($metrics['recent_times'], -self::LATENCY_SAMPLE_SIZE);
+
         update_option($metrics_key, $metrics);
+
+        $this->record_circuit_outcome($provider, true, $generation_time);
     }
 
     /**
@@ -504,8 +1419,9 @@ class HMG_AI_Service_Manager {
      * @param    string    $provider        Provider key.
      * @param    string    $content_type    Content type attempted.
      * @param    string    $error           Error message.
+     * @param    bool      $provider_fault  Whether the provider itself failed (see is_provider_fault()).
      */
-    private function log_generation_failure($provider, $content_type, $error) {
+    private function log_generation_failure($provider, $content_type, $error, $provider_fault = false) {
         // Update provider performance metrics
         $metrics_key = 'hmg_ai_provider_metrics_' . $provider;
         $metrics = get_option($metrics_key, array(
@@ -522,6 +1438,34 @@ class HMG_AI_Service_Manager {
         $metrics['last_error'] = $error;
 
         update_option($metrics_key, $metrics);
+
+        // Bad requests and missing configuration say nothing about the provider's health
+        if ($provider_fault) {
+            $this->record_circuit_outcome($provider, false);
+        } else {
+            $this->release_circuit($provider);
+        }
+    }
+
+    /**
+     * Whether a failed result points at the provider rather than the request
+     *
+     * Transport errors and timeouts (status 0), rate limiting (429) and
+     * server errors (5xx) count toward the circuit breaker. Validation,
+     * configuration and other 4xx errors don't.
+     *
+     * @since    1.3.0
+     * @param    array    $result    Failed generation result.
+     * @return   bool                Whether the failure counts against the provider.
+     */
+    private function is_provider_fault($result) {
+        if (!isset($result['status_code'])) {
+            return false;
+        }
+
+        $status_code = (int) $result['status_code'];
+
+        return $status_code === 0 || $status_code === 429 || $status_code >= 500;
     }
 
     /**
@@ -535,6 +1479,7 @@ class HMG_AI_Service_Manager {
 
         foreach ($this->providers as $key => $provider) {
             $provider_metrics = get_option('hmg_ai_provider_metrics_' . $key, array());
+            $circuit = $this->get_circuit($key);
             
             if (!empty($provider_metrics)) {
                 $success_rate = $provider_metrics['total_requests'] > 0 
@@ -545,6 +1490,9 @@ class HMG_AI_Service_Manager {
                     ? $provider_metrics['total_time'] / $provider_metrics['successful_requests'] 
                     : 0;
 
+                $cache_hits = $provider_metrics['cache_hits'] ?? 0;
+                $cache_lookups = $cache_hits + ($provider_metrics['cache_misses'] ?? 0);
+
                 $metrics[$key] = array(
                     'name' => $provider['name'],
                     'success_rate' => round($success_rate, 1),
@@ -554,7 +1502,15 @@ class HMG_AI_Service_Manager {
                     'total_tokens' => $provider_metrics['total_tokens'],
                     'last_success' => $provider_metrics['last_success'] ?? null,
                     'last_failure' => $provider_metrics['last_failure'] ?? null,
-                    'last_error' => $provider_metrics['last_error'] ?? null
+                    'last_error' => $provider_metrics['last_error'] ?? null,
+                    'cache_hits' => $cache_hits,
+                    'cache_misses' => $provider_metrics['cache_misses'] ?? 0,
+                    'cache_hit_rate' => $cache_lookups > 0 ? round(($cache_hits / $cache_lookups) * 100, 1) : 0,
+                    'hedge_requests' => $provider_metrics['hedge_requests'] ?? 0,
+                    'hedge_wins' => $provider_metrics['hedge_wins'] ?? 0,
+                    'circuit_state' => $circuit['state'],
+                    'ewma_latency' => $circuit['ewma_latency'] !== null ? round($circuit['ewma_latency'], 2) : null,
+                    'ewma_error_rate' => round($circuit['ewma_error_rate'] * 100, 1)
                 );
             } else {
                 $metrics[$key] = array(
@@ -566,7 +1522,15 @@ class HMG_AI_Service_Manager {
                     'total_tokens' => 0,
                     'last_success' => null,
                     'last_failure' => null,
-                    'last_error' => null
+                    'last_error' => null,
+                    'cache_hits' => 0,
+                    'cache_misses' => 0,
+                    'cache_hit_rate' => 0,
+                    'hedge_requests' => 0,
+                    'hedge_wins' => 0,
+                    'circuit_state' => $circuit['state'],
+                    'ewma_latency' => null,
+                    'ewma_error_rate' => 0
                 );
             }
         }
@@ -577,28 +1541,34 @@ class HMG_AI_Service_Manager {
     /**
      * Get all provider errors for debugging
      *
+     * Uses the errors collected while the providers were tried; providers
+     * that were skipped because their circuit is open are reported as such.
+     *
      * @since    1.0.0
-     * @param    string    $content_type    Content type.
-     * @param    string    $content         Source content.
-     * @param    int       $post_id         Post ID.
-     * @return   array                      All provider errors.
+     * @param    string    $content_type       Content type.
+     * @param    array     $provider_errors    Errors keyed by provider, collected during generation.
+     * @return   array                         All provider errors.
      */
-    private function get_all_provider_errors($content_type, $content, $post_id) {
+    private function get_all_provider_errors($content_type, $provider_errors) {
         $errors = array();
 
         foreach ($this->providers as $key => $provider) {
-            if (!$provider['enabled']) {
+            if (!$provider['enabled'] || !in_array($content_type, $provider['features'])) {
                 continue;
             }
 
-            $result = $this->try_provider($key, $content_type, $content, $post_id, array());
-            
-            if (!$result['success']) {
-                $errors[$key] = array(
-                    'name' => $provider['name'],
-                    'error' => $result['error']
-                );
+            if (isset($provider_errors[$key])) {
+                $error = $provider_errors[$key];
+            } elseif (!$this->is_circuit_available($key)) {
+                $error = __('Skipped after repeated failures; will be retried shortly.', 'hmg-ai-blog-enhancer');
+            } else {
+                continue;
             }
+
+            $errors[$key] = array(
+                'name' => $provider['name'],
+                'error' => $error
+            );
         }
 
         return $errors;
@@ -32,6 +32,38 @@ class HMG_AI_Context_Analyzer {
      */
     private $brand_profile;
 
+    /**
+     * Post meta key holding a post's cached feature vector
+     *
+     * @since    1.3.0
+     * @var      string
+     */
+    const FEATURES_META_KEY = '_hmg_ai_content_features';
+
+    /**
+     * Version of the feature vector format, bump when the analysis changes
+     *
+     * @since    1.3.0
+     * @var      int
+     */
+    const FEATURES_VERSION = 1;
+
+    /**
+     * Post meta key holding the aggregates generation a post is folded into
+     *
+     * @since    1.3.0
+     * @var      string
+     */
+    const GENERATION_META_KEY = '_hmg_ai_brand_generation';
+
+    /**
+     * Option holding the site-wide brand profile aggregates
+     *
+     * @since    1.3.0
+     * @var      string
+     */
+    const AGGREGATES_OPTION = 'hmg_ai_brand_aggregates';
+
     /**
      * Initialize the Context Analyzer
      *
@@ -45,77 +77,245 @@ class HMG_AI_Context_Analyzer {
     /**
      * Analyze website content to build brand profile
      *
+     * The profile is built from site-wide aggregates stored in an option.
+     * Once built, save_post keeps them current by taking a post's old
+     * feature vector out and folding its new one in, so each call here only
+     * has to fold in published posts the aggregates don't cover yet.
+     *
      * @since    1.2.0
-     * @param    int      $limit    Number of posts to analyze
+     * @param    int      $limit    Maximum number of new posts to analyze
      * @return   array              Analysis results
      */
     public function analyze_website_content($limit = 10) {
-        $results = array(
-            'posts_analyzed' => 0,
-            'brand_voice' => array(),
-            'common_topics' => array(),
-            'writing_style' => array(),
-            'vocabulary' => array(),
-            'content_patterns' => array()
-        );
+        $aggregates = $this->load_aggregates();
+        if ($aggregates === null) {
+            $aggregates = $this->create_aggregates();
+        }
 
-        // Get recent published posts
+        // Get recent published posts that are not part of the aggregates yet
         $args = array(
             'post_type' => 'post',
             'post_status' => 'publish',
             'posts_per_page' => $limit,
             'orderby' => 'date',
-            'order' => 'DESC'
+            'order' => 'DESC',
+            'meta_query' => array(
+                'relation' => 'OR',
+                array(
+                    'key' => self::GENERATION_META_KEY,
+                    'compare' => 'NOT EXISTS'
+                ),
+                array(
+                    'key' => self::GENERATION_META_KEY,
+                    'value' => $aggregates['generation'],
+                    'compare' => '!='
+                )
+            )
         );
 
-        $posts = get_posts($args);
+        foreach (get_posts($args) as $post) {
+            $this->fold_post($aggregates, $post);
+        }
 
-        if (empty($posts)) {
+        if ($aggregates['posts'] === 0) {
             return array(
                 'success' => false,
                 'message' => __('No posts found to analyze.', 'hmg-ai-blog-enhancer')
             );
         }
 
-        foreach ($posts as $post) {
-            $content = $post->post_content;
-            $title = $post->post_title;
-            
-            // Clean content
-            $clean_content = wp_strip_all_tags($content);
-            $clean_content = html_entity_decode($clean_content);
-            
-            // Analyze tone and style
-            $results['brand_voice'][] = $this->analyze_tone($clean_content);
-            
-            // Extract vocabulary patterns
-            $results['vocabulary'][] = $this->analyze_vocabulary($clean_content);
-            
-            // Identify content patterns
-            $results['content_patterns'][] = $this->analyze_content_patterns($content);
-            
-            // Extract topics and themes
-            $results['common_topics'][] = $this->extract_topics($title, $clean_content);
-            
-            // Analyze writing style
-            $results['writing_style'][] = $this->analyze_writing_style($clean_content);
-            
-            $results['posts_analyzed']++;
-        }
+        $this->save_aggregates($aggregates);
 
         // Aggregate and summarize findings
-        $brand_profile = $this->build_brand_profile($results);
+        $brand_profile = $this->build_brand_profile($aggregates);
         
         // Save to database
         $this->save_brand_profile($brand_profile);
         
         return array(
             'success' => true,
-            'posts_analyzed' => $results['posts_analyzed'],
+            'posts_analyzed' => $aggregates['posts'],
             'brand_profile' => $brand_profile
         );
     }
 
+    /**
+     * Update a post's feature vector and the brand profile when it is saved
+     *
+     * Hooked to save_post. The vector is only recomputed when the content
+     * hash changes. Once a brand profile exists, the post's contribution to
+     * it is replaced (or removed if the post is no longer published).
+     *
+     * @since    1.3.0
+     * @param    int        $post_id    The post ID.
+     * @param    WP_Post    $post       The post object.
+     */
+    public function update_post_features($post_id, $post) {
+        if (wp_is_post_revision($post_id) || wp_is_post_autosave($post_id)) {
+            return;
+        }
+
+        if ($post->post_type !== 'post') {
+            return;
+        }
+
+        $aggregates = $this->load_aggregates();
+
+        // No brand profile yet: just have the vector ready for the first analysis
+        if ($aggregates === null) {
+            if ($post->post_status === 'publish') {
+                $features = $this->get_post_features($post, get_post_meta($post_id, self::FEATURES_META_KEY, true));
+                update_post_meta($post_id, self::FEATURES_META_KEY, $features);
+            }
+            return;
+        }
+
+        if ($post->post_status === 'publish') {
+            $this->fold_post($aggregates, $post);
+        } elseif (!$this->unfold_post($aggregates, $post_id)) {
+            return;
+        }
+
+        $this->save_aggregates($aggregates);
+        $this->save_brand_profile($this->build_brand_profile($aggregates));
+    }
+
+    /**
+     * Take a post out of the brand profile before it is deleted
+     *
+     * @since    1.3.0
+     * @param    int    $post_id    The post ID.
+     */
+    public function handle_delete_post($post_id) {
+        $aggregates = $this->load_aggregates();
+
+        if ($aggregates !== null && $this->unfold_post($aggregates, $post_id)) {
+            $this->save_aggregates($aggregates);
+            $this->save_brand_profile($this->build_brand_profile($aggregates));
+        }
+    }
+
+    /**
+     * Replace a post's contribution to the aggregates with its current features
+     *
+     * Topics are refreshed too, since categories and tags can change
+     * without a content edit.
+     *
+     * @since    1.3.0
+     * @param    array      $aggregates    Running aggregates, updated in place
+     * @param    WP_Post    $post          Published post
+     */
+    private function fold_post(&$aggregates, $post) {
+        $features = get_post_meta($post->ID, self::FEATURES_META_KEY, true);
+
+        if (is_array($features) && get_post_meta($post->ID, self::GENERATION_META_KEY, true) === $aggregates['generation']) {
+            $this->unfold_features($aggregates, $features);
+        }
+
+        $features = $this->get_post_features($post, $features);
+        $features['topics'] = $this->extract_topics($post);
+
+        $this->fold_features($aggregates, $features);
+
+        // Keep exactly what was folded in, so it can be taken out again
+        update_post_meta($post->ID, self::FEATURES_META_KEY, $features);
+        update_post_meta($post->ID, self::GENERATION_META_KEY, $aggregates['generation']);
+    }
+
+    /**
+     * Take a post's contribution out of the aggregates
+     *
+     * @since    1.3.0
+     * @param    array    $aggregates    Running aggregates, updated in place
+     * @param    int      $post_id       The post ID.
+     * @return   bool                    Whether the post was part of the aggregates
+     */
+    private function unfold_post(&$aggregates, $post_id) {
+        if (get_post_meta($post_id, self::GENERATION_META_KEY, true) !== $aggregates['generation']) {
+            return false;
+        }
+
+        $features = get_post_meta($post_id, self::FEATURES_META_KEY, true);
+        if (is_array($features)) {
+            $this->unfold_features($aggregates, $features);
+        }
+
+        delete_post_meta($post_id, self::GENERATION_META_KEY);
+
+        return true;
+    }
+
+    /**
+     * Get a post's feature vector, recomputing it if the content changed
+     *
+     * @since    1.3.0
+     * @param    WP_Post    $post        Post to analyze
+     * @param    mixed      $features    Stored feature vector, if any
+     * @return   array                   Feature vector
+     */
+    private function get_post_features($post, $features) {
+        $hash = md5($post->post_content);
+
+        if (is_array($features)
+            && ($features['version'] ?? 0) === self::FEATURES_VERSION
+            && ($features['hash'] ?? '') === $hash) {
+            return $features;
+        }
+
+        $features = $this->analyze_post($post->post_content);
+        $features['version'] = self::FEATURES_VERSION;
+        $features['hash'] = $hash;
+
+        return $features;
+    }
+
+    /**
+     * Load the stored brand profile aggregates
+     *
+     * @since    1.3.0
+     * @return   array|null    Running aggregates, or null if there are none for the current feature format
+     */
+    private function load_aggregates() {
+        $aggregates = get_option(self::AGGREGATES_OPTION);
+
+        if (!is_array($aggregates) || ($aggregates['version'] ?? 0) !== self::FEATURES_VERSION) {
+            return null;
+        }
+
+        return $aggregates;
+    }
+
+    /**
+     * Store the brand profile aggregates
+     *
+     * @since    1.3.0
+     * @param    array    $aggregates    Running aggregates
+     * @return   bool                    Success status
+     */
+    private function save_aggregates($aggregates) {
+        return update_option(self::AGGREGATES_OPTION, $aggregates, false);
+    }
+
+    /**
+     * Compute the feature vector for one post
+     *
+     * @since    1.3.0
+     * @param    string    $content    HTML post content
+     * @return   array                 Feature vector
+     */
+    private function analyze_post($content) {
+        // Clean content
+        $clean_content = wp_strip_all_tags($content);
+        $clean_content = html_entity_decode($clean_content);
+
+        return array(
+            'tone' => $this->analyze_tone($clean_content),
+            'vocabulary' => $this->analyze_vocabulary($clean_content),
+            'patterns' => $this->analyze_content_patterns($content),
+            'style' => $this->analyze_writing_style($clean_content)
+        );
+    }
+
     /**
      * Analyze tone of content
      *
@@ -284,21 +484,20 @@ class HMG_AI_Context_Analyzer {
      * Extract topics and themes
      *
      * @since    1.2.0
-     * @param    string    $title      Post title
-     * @param    string    $content    Post content
-     * @return   array                 Extracted topics
+     * @param    WP_Post    $post    Post to extract topics from
+     * @return   array               Extracted topics
      */
-    private function extract_topics($title, $content) {
+    private function extract_topics($post) {
         $topics = array();
         
         // Get categories
-        $categories = get_the_category(get_the_ID());
+        $categories = get_the_category($post->ID);
         foreach ($categories as $category) {
             $topics[] = $category->name;
         }
         
         // Get tags
-        $tags = get_the_tags(get_the_ID());
+        $tags = get_the_tags($post->ID);
         if ($tags) {
             foreach ($tags as $tag) {
                 $topics[] = $tag->name;
@@ -306,9 +505,9 @@ class HMG_AI_Context_Analyzer {
         }
         
         // Extract key phrases from title
-        $title_words = explode(' ', $title);
+        $title_words = explode(' ', $post->post_title);
         if (count($title_words) > 2) {
-            $topics[] = $title;
+            $topics[] = $post->post_title;
         }
         
         return array_unique($topics);
@@ -340,35 +539,50 @@ class HMG_AI_Context_Analyzer {
         } else {
             $style = 'elaborate';
         }
+
+        $sentence_lengths = $this->get_sentence_length_stats($sentences);
         
         return array(
             'avg_sentence_length' => $avg_sentence_length,
             'style' => $style,
-            'sentence_variety' => $this->calculate_sentence_variety($sentences)
+            'sentence_variety' => $this->calculate_sentence_variety($sentence_lengths),
+            'sentence_lengths' => $sentence_lengths
         );
     }
 
     /**
-     * Calculate sentence variety
+     * Collect running statistics over sentence lengths
      *
-     * @since    1.2.0
+     * @since    1.3.0
      * @param    array    $sentences    Array of sentences
-     * @return   string                 Variety level
+     * @return   array                  Running statistics (count, mean, m2)
      */
-    private function calculate_sentence_variety($sentences) {
-        $lengths = array();
+    private function get_sentence_length_stats($sentences) {
+        $stats = $this->create_running_stats();
+
         foreach ($sentences as $sentence) {
             $word_count = str_word_count($sentence);
             if ($word_count > 0) {
-                $lengths[] = $word_count;
+                $this->add_sample($stats, $word_count);
             }
         }
-        
-        if (empty($lengths)) {
+
+        return $stats;
+    }
+
+    /**
+     * Calculate sentence variety
+     *
+     * @since    1.2.0
+     * @param    array    $stats    Running statistics over sentence lengths
+     * @return   string             Variety level
+     */
+    private function calculate_sentence_variety($stats) {
+        if ($stats['count'] === 0) {
             return 'none';
         }
         
-        $std_dev = $this->calculate_std_deviation($lengths);
+        $std_dev = $this->get_std_deviation($stats);
         
         if ($std_dev < 5) {
             return 'low';
@@ -379,44 +593,272 @@ class HMG_AI_Context_Analyzer {
         }
     }
 
+    /**
+     * Create empty running statistics
+     *
+     * @since    1.3.0
+     * @return   array    Running statistics (count, mean, m2)
+     */
+    private function create_running_stats() {
+        return array(
+            'count' => 0,
+            'mean' => 0.0,
+            'm2' => 0.0
+        );
+    }
+
+    /**
+     * Add one value to running statistics (Welford's algorithm)
+     *
+     * @since    1.3.0
+     * @param    array    $stats    Running statistics, updated in place
+     * @param    float    $value    Value to add
+     */
+    private function add_sample(&$stats, $value) {
+        $stats['count']++;
+        $delta = $value - $stats['mean'];
+        $stats['mean'] += $delta / $stats['count'];
+        $stats['m2'] += $delta * ($value - $stats['mean']);
+    }
+
+    /**
+     * Merge two sets of running statistics
+     *
+     * @since    1.3.0
+     * @param    array    $stats    Running statistics, updated in place
+     * @param    array    $other    Running statistics to merge in
+     */
+    private function merge_stats(&$stats, $other) {
+        if (empty($other['count'])) {
+            return;
+        }
+
+        $count = $stats['count'] + $other['count'];
+        $delta = $other['mean'] - $stats['mean'];
+
+        $stats['mean'] += $delta * $other['count'] / $count;
+        $stats['m2'] += $other['m2'] + $delta * $delta * $stats['count'] * $other['count'] / $count;
+        $stats['count'] = $count;
+    }
+
+    /**
+     * Remove one value from running statistics
+     *
+     * @since    1.3.0
+     * @param    array    $stats    Running statistics, updated in place
+     * @param    float    $value    Value previously added
+     */
+    private function remove_sample(&$stats, $value) {
+        if ($stats['count'] <= 1) {
+            $stats = $this->create_running_stats();
+            return;
+        }
+
+        $mean = ($stats['mean'] * $stats['count'] - $value) / ($stats['count'] - 1);
+        $stats['m2'] = max(0.0, $stats['m2'] - ($value - $mean) * ($value - $stats['mean']));
+        $stats['mean'] = $mean;
+        $stats['count']--;
+    }
+
+    /**
+     * Take previously merged running statistics back out
+     *
+     * @since    1.3.0
+     * @param    array    $stats    Running statistics, updated in place
+     * @param    array    $other    Running statistics previously merged in
+     */
+    private function unmerge_stats(&$stats, $other) {
+        if (empty($other['count'])) {
+            return;
+        }
+
+        $count = $stats['count'] - $other['count'];
+        if ($count <= 0) {
+            $stats = $this->create_running_stats();
+            return;
+        }
+
+        $mean = ($stats['mean'] * $stats['count'] - $other['mean'] * $other['count']) / $count;
+        $delta = $other['mean'] - $mean;
+
+        $stats['m2'] = max(0.0, $stats['m2'] - $other['m2'] - $delta * $delta * $count * $other['count'] / $stats['count']);
+        $stats['mean'] = $mean;
+        $stats['count'] = $count;
+    }
+
     /**
      * Calculate standard deviation
      *
      * @since    1.2.0
-     * @param    array    $values    Array of numeric values
-     * @return   float                Standard deviation
+     * @param    array    $stats    Running statistics (count, mean, m2)
+     * @return   float              Sample standard deviation
      */
-    private function calculate_std_deviation($values) {
-        $count = count($values);
-        if ($count < 2) {
+    private function get_std_deviation($stats) {
+        if ($stats['count'] < 2) {
             return 0;
         }
         
-        $mean = array_sum($values) / $count;
-        $variance = 0;
-        
-        foreach ($values as $value) {
-            $variance += pow($value - $mean, 2);
+        return sqrt($stats['m2'] / ($stats['count'] - 1));
+    }
+
+    /**
+     * Create empty brand profile aggregates
+     *
+     * @since    1.3.0
+     * @return   array    Running aggregates
+     */
+    private function create_aggregates() {
+        return array(
+            // Posts are only part of these aggregates if their generation meta matches
+            'generation' => uniqid('', true),
+            'version' => self::FEATURES_VERSION,
+            'posts' => 0,
+            'formality' => array(),
+            'emotion' => array(),
+            'perspective' => array(),
+            'style' => array(),
+            'sentence_variety' => array(),
+            'word_length' => $this->create_running_stats(),
+            'sentence_length' => $this->create_running_stats(),
+            'sentences' => $this->create_running_stats(),
+            'paragraph_length' => $this->create_running_stats(),
+            'top_words' => array(),
+            'topics' => array(),
+            'patterns' => array(
+                'has_lists' => 0,
+                'has_headings' => 0,
+                'has_quotes' => 0,
+                'has_images' => 0,
+                'has_links' => 0
+            )
+        );
+    }
+
+    /**
+     * Fold one post's feature vector into the running aggregates
+     *
+     * @since    1.3.0
+     * @param    array    $aggregates    Running aggregates, updated in place
+     * @param    array    $features      Feature vector
+     */
+    private function fold_features(&$aggregates, $features) {
+        $aggregates['posts']++;
+
+        foreach (array('formality', 'emotion', 'perspective') as $key) {
+            $this->increment_count($aggregates[$key], $features['tone'][$key]);
+        }
+        $this->increment_count($aggregates['style'], $features['style']['style']);
+        $this->increment_count($aggregates['sentence_variety'], $features['style']['sentence_variety']);
+
+        $this->add_sample($aggregates['word_length'], $features['vocabulary']['avg_word_length']);
+        $this->add_sample($aggregates['sentence_length'], $features['style']['avg_sentence_length']);
+        $this->add_sample($aggregates['paragraph_length'], $features['patterns']['avg_paragraph_length']);
+        $this->merge_stats($aggregates['sentences'], $features['style']['sentence_lengths']);
+
+        foreach ($features['vocabulary']['top_words'] as $word) {
+            $this->increment_count($aggregates['top_words'], $word);
+        }
+
+        foreach ($features['topics'] ?? array() as $topic) {
+            $this->increment_count($aggregates['topics'], $topic);
+        }
+
+        foreach (array_keys($aggregates['patterns']) as $pattern) {
+            if (!empty($features['patterns'][$pattern])) {
+                $aggregates['patterns'][$pattern]++;
+            }
         }
-        
-        $variance = $variance / ($count - 1);
-        return sqrt($variance);
+    }
+
+    /**
+     * Take one post's feature vector back out of the running aggregates
+     *
+     * @since    1.3.0
+     * @param    array    $aggregates    Running aggregates, updated in place
+     * @param    array    $features      Feature vector previously folded in
+     */
+    private function unfold_features(&$aggregates, $features) {
+        $aggregates['posts'] = max(0, $aggregates['posts'] - 1);
+
+        foreach (array('formality', 'emotion', 'perspective') as $key) {
+            $this->decrement_count($aggregates[$key], $features['tone'][$key]);
+        }
+        $this->decrement_count($aggregates['style'], $features['style']['style']);
+        $this->decrement_count($aggregates['sentence_variety'], $features['style']['sentence_variety']);
+
+        $this->remove_sample($aggregates['word_length'], $features['vocabulary']['avg_word_length']);
+        $this->remove_sample($aggregates['sentence_length'], $features['style']['avg_sentence_length']);
+        $this->remove_sample($aggregates['paragraph_length'], $features['patterns']['avg_paragraph_length']);
+        $this->unmerge_stats($aggregates['sentences'], $features['style']['sentence_lengths']);
+
+        foreach ($features['vocabulary']['top_words'] as $word) {
+            $this->decrement_count($aggregates['top_words'], $word);
+        }
+
+        foreach ($features['topics'] ?? array() as $topic) {
+            $this->decrement_count($aggregates['topics'], $topic);
+        }
+
+        foreach (array_keys($aggregates['patterns']) as $pattern) {
+            if (!empty($features['patterns'][$pattern])) {
+                $aggregates['patterns'][$pattern] = max(0, $aggregates['patterns'][$pattern] - 1);
+            }
+        }
+    }
+
+    /**
+     * Increment a value count
+     *
+     * @since    1.3.0
+     * @param    array     $counts    Value counts, updated in place
+     * @param    string    $value     Value to count
+     */
+    private function increment_count(&$counts, $value) {
+        $counts[$value] = ($counts[$value] ?? 0) + 1;
+    }
+
+    /**
+     * Decrement a value count, dropping it once it reaches zero
+     *
+     * @since    1.3.0
+     * @param    array     $counts    Value counts, updated in place
+     * @param    string    $value     Value to uncount
+     */
+    private function decrement_count(&$counts, $value) {
+        if (!isset($counts[$value])) {
+            return;
+        }
+
+        if (--$counts[$value] <= 0) {
+            unset($counts[$value]);
+        }
+    }
+
+    /**
+     * Get the most common value from value counts
+     *
+     * @since    1.3.0
+     * @param    array    $counts    Value counts
+     * @return   string              Most common value
+     */
+    private function get_most_common($counts) {
+        return array_search(max($counts), $counts);
     }
 
     /**
      * Build brand profile from analysis results
      *
      * @since    1.2.0
-     * @param    array    $results    Analysis results
-     * @return   array                Brand profile
+     * @param    array    $aggregates    Running aggregates over analyzed posts
+     * @return   array                   Brand profile
      */
-    private function build_brand_profile($results) {
+    private function build_brand_profile($aggregates) {
         $profile = array(
-            'tone' => $this->aggregate_tone($results['brand_voice']),
-            'vocabulary' => $this->aggregate_vocabulary($results['vocabulary']),
-            'style' => $this->aggregate_style($results['writing_style']),
-            'patterns' => $this->aggregate_patterns($results['content_patterns']),
-            'topics' => $this->aggregate_topics($results['common_topics']),
+            'tone' => $this->aggregate_tone($aggregates),
+            'vocabulary' => $this->aggregate_vocabulary($aggregates),
+            'style' => $this->aggregate_style($aggregates),
+            'patterns' => $this->aggregate_patterns($aggregates),
+            'topics' => $this->aggregate_topics($aggregates),
             'guidelines' => array(),
             'last_updated' => current_time('mysql')
         );
@@ -431,23 +873,19 @@ class HMG_AI_Context_Analyzer {
      * Aggregate tone characteristics
      *
      * @since    1.2.0
-     * @param    array    $tones    Array of tone analyses
-     * @return   array              Aggregated tone profile
+     * @param    array    $aggregates    Running aggregates
+     * @return   array                   Aggregated tone profile
      */
-    private function aggregate_tone($tones) {
-        if (empty($tones)) {
+    private function aggregate_tone($aggregates) {
+        if ($aggregates['posts'] === 0) {
             return array();
         }
         
-        $formality_counts = array_count_values(array_column($tones, 'formality'));
-        $emotion_counts = array_count_values(array_column($tones, 'emotion'));
-        $perspective_counts = array_count_values(array_column($tones, 'perspective'));
-        
         return array(
-            'primary_formality' => array_search(max($formality_counts), $formality_counts),
-            'primary_emotion' => array_search(max($emotion_counts), $emotion_counts),
-            'primary_perspective' => array_search(max($perspective_counts), $perspective_counts),
-            'consistency' => $this->calculate_consistency($formality_counts)
+            'primary_formality' => $this->get_most_common($aggregates['formality']),
+            'primary_emotion' => $this->get_most_common($aggregates['emotion']),
+            'primary_perspective' => $this->get_most_common($aggregates['perspective']),
+            'consistency' => $this->calculate_consistency($aggregates['formality'])
         );
     }
 
@@ -480,28 +918,21 @@ class HMG_AI_Context_Analyzer {
      * Aggregate vocabulary characteristics
      *
      * @since    1.2.0
-     * @param    array    $vocabularies    Array of vocabulary analyses
-     * @return   array                     Aggregated vocabulary profile
+     * @param    array    $aggregates    Running aggregates
+     * @return   array                   Aggregated vocabulary profile
      */
-    private function aggregate_vocabulary($vocabularies) {
-        if (empty($vocabularies)) {
+    private function aggregate_vocabulary($aggregates) {
+        if ($aggregates['posts'] === 0) {
             return array();
         }
         
-        $avg_word_lengths = array_column($vocabularies, 'avg_word_length');
-        $all_top_words = array();
-        
-        foreach ($vocabularies as $vocab) {
-            $all_top_words = array_merge($all_top_words, $vocab['top_words']);
-        }
-        
-        $word_frequency = array_count_values($all_top_words);
+        $word_frequency = $aggregates['top_words'];
         arsort($word_frequency);
         
         return array(
-            'avg_word_length' => round(array_sum($avg_word_lengths) / count($avg_word_lengths), 1),
+            'avg_word_length' => round($aggregates['word_length']['mean'], 1),
             'signature_words' => array_slice(array_keys($word_frequency), 0, 20),
-            'complexity' => $this->determine_complexity($avg_word_lengths)
+            'complexity' => $this->determine_complexity($aggregates['word_length']['mean'])
         );
     }
 
@@ -509,12 +940,10 @@ class HMG_AI_Context_Analyzer {
      * Determine complexity level
      *
      * @since    1.2.0
-     * @param    array    $lengths    Word lengths
-     * @return   string              Complexity level
+     * @param    float    $avg    Average word length
+     * @return   string           Complexity level
      */
-    private function determine_complexity($lengths) {
-        $avg = array_sum($lengths) / count($lengths);
-        
+    private function determine_complexity($avg) {
         if ($avg > 6) {
             return 'complex';
         } elseif ($avg > 4.5) {
@@ -528,84 +957,44 @@ class HMG_AI_Context_Analyzer {
      * Aggregate writing style
      *
      * @since    1.2.0
-     * @param    array    $styles    Array of style analyses
-     * @return   array               Aggregated style profile
+     * @param    array    $aggregates    Running aggregates
+     * @return   array                   Aggregated style profile
      */
-    private function aggregate_style($styles) {
-        if (empty($styles)) {
+    private function aggregate_style($aggregates) {
+        if ($aggregates['posts'] === 0) {
             return array();
         }
         
-        $sentence_lengths = array_column($styles, 'avg_sentence_length');
-        
         return array(
-            'avg_sentence_length' => round(array_sum($sentence_lengths) / count($sentence_lengths)),
-            'primary_style' => $this->determine_primary_style($styles),
-            'sentence_variety' => $this->determine_average_variety($styles)
+            'avg_sentence_length' => round($aggregates['sentence_length']['mean']),
+            'sentence_length_std_dev' => round($this->get_std_deviation($aggregates['sentences']), 1),
+            'primary_style' => $this->get_most_common($aggregates['style']),
+            'sentence_variety' => $this->get_most_common($aggregates['sentence_variety'])
         );
     }
 
-    /**
-     * Determine primary writing style
-     *
-     * @since    1.2.0
-     * @param    array    $styles    Style analyses
-     * @return   string              Primary style
-     */
-    private function determine_primary_style($styles) {
-        $style_counts = array_count_values(array_column($styles, 'style'));
-        return array_search(max($style_counts), $style_counts);
-    }
-
-    /**
-     * Determine average sentence variety
-     *
-     * @since    1.2.0
-     * @param    array    $styles    Style analyses
-     * @return   string              Average variety
-     */
-    private function determine_average_variety($styles) {
-        $variety_counts = array_count_values(array_column($styles, 'sentence_variety'));
-        return array_search(max($variety_counts), $variety_counts);
-    }
-
     /**
      * Aggregate content patterns
      *
      * @since    1.2.0
-     * @param    array    $patterns    Array of pattern analyses
-     * @return   array                 Aggregated patterns
+     * @param    array    $aggregates    Running aggregates
+     * @return   array                   Aggregated patterns
      */
-    private function aggregate_patterns($patterns) {
-        if (empty($patterns)) {
+    private function aggregate_patterns($aggregates) {
+        if ($aggregates['posts'] === 0) {
             return array();
         }
         
-        $uses_lists = 0;
-        $uses_headings = 0;
-        $uses_quotes = 0;
-        $uses_images = 0;
-        $uses_links = 0;
-        $paragraph_lengths = array();
-        
-        foreach ($patterns as $pattern) {
-            if ($pattern['has_lists']) $uses_lists++;
-            if ($pattern['has_headings']) $uses_headings++;
-            if ($pattern['has_quotes']) $uses_quotes++;
-            if ($pattern['has_images']) $uses_images++;
-            if ($pattern['has_links']) $uses_links++;
-            $paragraph_lengths[] = $pattern['avg_paragraph_length'];
-        }
-        
-        $total = count($patterns);
+        $uses = $aggregates['patterns'];
+        $total = $aggregates['posts'];
         
         return array(
-            'frequently_uses_lists' => ($uses_lists / $total) > 0.5,
-            'frequently_uses_headings' => ($uses_headings / $total) > 0.7,
-            'frequently_uses_quotes' => ($uses_quotes / $total) > 0.3,
-            'frequently_uses_images' => ($uses_images / $total) > 0.5,
-            'frequently_uses_links' => ($uses_links / $total) > 0.7,
-            'avg_paragraph_length' => round(array_sum($paragraph_lengths) / count($paragraph_lengths))
+            'frequently_uses_lists' => ($uses['has_lists'] / $total) > 0.5,
+            'frequently_uses_headings' => ($uses['has_headings'] / $total) > 0.7,
+            'frequently_uses_quotes' => ($uses['has_quotes'] / $total) > 0.3,
+            'frequently_uses_images' => ($uses['has_images'] / $total) > 0.5,
+            'frequently_uses_links' => ($uses['has_links'] / $total) > 0.7,
+            'avg_paragraph_length' => round($aggregates['paragraph_length']['mean'])
         );
     }
 
@@ -613,17 +1002,11 @@ class HMG_AI_Context_Analyzer {
      * Aggregate topics
      *
      * @since    1.2.0
-     * @param    array    $topics    Array of topic lists
-     * @return   array               Aggregated topics
+     * @param    array    $aggregates    Running aggregates
+     * @return   array                   Aggregated topics
      */
-    private function aggregate_topics($topics) {
-        $all_topics = array();
-        
-        foreach ($topics as $topic_list) {
-            $all_topics = array_merge($all_topics, $topic_list);
-        }
-        
-        $topic_frequency = array_count_values($all_topics);
+    private function aggregate_topics($aggregates) {
+        $topic_frequency = $aggregates['topics'];
         arsort($topic_frequency);
         
         return array_slice(array_keys($topic_frequency), 0, 10);
@@ -773,6 +1156,7 @@ class HMG_AI_Context_Analyzer {
     public function clear_brand_profile() {
         delete_option('hmg_ai_brand_profile');
         delete_option('hmg_ai_context_data');
+        delete_option(self::AGGREGATES_OPTION);
         $this->brand_profile = array();
         $this->context_data = array();
         return true;
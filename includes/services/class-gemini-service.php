@@ -76,7 +76,8 @@ class HMG_AI_Gemini_Service {
      * @since    1.0.0
      */
     public function __construct() {
-        $this->api_base_url = 'https://generativelanguage.googleapis.com/v1beta';
+        // Base URL can be overridden (e.g. to point at a local stand-in server for testing)
+        $this->api_base_url = rtrim(getenv('HMG_AI_GEMINI_BASE_URL') ?: 'https://generativelanguage.googleapis.com/v1beta', '/');
         $this->auth_service = new HMG_AI_Auth_Service();
         
         // Get API key and model from options
@@ -230,6 +231,52 @@ Please provide a clear, professional summary without HTML formatting.'
      * @return   array                      Generation result with content or error.
      */
     public function generate_content($content_type, $content, $post_id = 0, $options = array()) {
+        $request = $this->build_generation_request($content_type, $content, $post_id, $options);
+
+        // Validation errors and cached content are returned as finished results
+        if (isset($request['success'])) {
+            return $request;
+        }
+
+        $response = wp_remote_post($request['url'], array(
+            'method' => 'POST',
+            'timeout' => $request['timeout'],
+            'headers' => $request['headers'],
+            'body' => $request['body']
+        ));
+
+        if (is_wp_error($response)) {
+            return array(
+                'success' => false,
+                'error' => sprintf(
+                    __('API connection failed: %s', 'hmg-ai-blog-enhancer'),
+                    $response->get_error_message()
+                ),
+                'status_code' => 0 // No HTTP response
+            );
+        }
+
+        return $this->parse_generation_response(
+            $request,
+            wp_remote_retrieve_response_code($response),
+            wp_remote_retrieve_body($response)
+        );
+    }
+
+    /**
+     * Build the HTTP request for a content generation call
+     *
+     * Split from generate_content() so the service manager can send the
+     * request itself, e.g. in parallel with another provider.
+     *
+     * @since    1.3.0
+     * @param    string    $content_type    Type of content to generate.
+     * @param    string    $content         The source content to analyze.
+     * @param    int       $post_id         The post ID for tracking.
+     * @param    array     $options         Generation options.
+     * @return   array                      Request (url, headers, body, timeout) or a finished result with a success key.
+     */
+    public function build_generation_request($content_type, $content, $post_id = 0, $options = array()) {
         // Check authentication
         $auth_status = $this->auth_service->get_auth_status();
         if (!$auth_status['authenticated']) {
@@ -286,7 +333,7 @@ Please provide a clear, professional summary without HTML formatting.'
 
         // Check content cache first
         $cache_key = md5($content_type . $cleaned_content);
-        $cached_result = $this->get_cached_content($cache_key);
+        $cached_result = empty($options['force_regenerate']) ? $this->get_cached_content($cache_key) : false;
         if ($cached_result) {
             return array(
                 'success' => true,
@@ -296,50 +343,6 @@ Please provide a clear, professional summary without HTML formatting.'
             );
         }
 
-        // Generate content with Gemini
-        $result = $this->call_gemini_api($content_type, $cleaned_content, $options);
-        
-        if ($result['success']) {
-            // Cache the result with content type and provider
-            $this->cache_content($cache_key, $result['content'], $content_type, 'gemini');
-            
-            // Debug logging
-            error_log('HMG AI Gemini: Calling record_usage for ' . $content_type . ' with ' . ($result['tokens_used'] ?? 0) . ' tokens');
-            
-            // Record usage
-            $record_result = $this->auth_service->record_usage(
-                $post_id,
-                $content_type,
-                1, // API calls
-                $result['tokens_used'] ?? 0,
-                'gemini' // Provider name for cost tracking
-            );
-            
-            error_log('HMG AI Gemini: record_usage returned: ' . ($record_result ? 'success' : 'failure'));
-            
-            return array(
-                'success' => true,
-                'content' => $result['content'],
-                'tokens_used' => $result['tokens_used'] ?? 0,
-                'message' => sprintf(
-                    __('%s generated successfully!', 'hmg-ai-blog-enhancer'),
-                    ucfirst($content_type)
-                )
-            );
-        }
-
-        return $result;
-    }
-
-    /**
-     * Call Gemini API for content generation
-     *
-     * @since    1.0.0
-     * @param    string    $content_type    Type of content to generate.
-     * @param    string    $content         The cleaned content to analyze.
-     * @return   array                      API call result.
-     */
-    private function call_gemini_api($content_type, $content, $options = array()) {
         $prompt = $this->prompts[$content_type];
         
         // Add brand context if provided
@@ -347,7 +350,7 @@ Please provide a clear, professional summary without HTML formatting.'
         if (!empty($options['brand_context'])) {
             $user_prompt = "Important: " . $options['brand_context'] . "\n\n" . $user_prompt;
         }
-        $user_prompt = str_replace('{content}', $content, $user_prompt);
+        $user_prompt = str_replace('{content}', $cleaned_content, $user_prompt);
 
         // Build request data with 2025 API structure
         $request_data = array(
@@ -381,32 +384,35 @@ Please provide a clear, professional summary without HTML formatting.'
             )
         );
 
-        $request_args = array(
-            'method' => 'POST',
-            'timeout' => 120, // Increased timeout for thinking models
+        // Use proper 2025 API endpoint with models/ prefix
+        return array(
+            'url' => $this->api_base_url . '/models/' . $this->selected_model . ':generateContent?key=' . $this->api_key,
             'headers' => array(
                 'Content-Type' => 'application/json',
                 'User-Agent' => 'HMG-AI-Blog-Enhancer/' . HMG_AI_BLOG_ENHANCER_VERSION
             ),
-            'body' => wp_json_encode($request_data)
+            'body' => wp_json_encode($request_data),
+            'timeout' => 120, // Increased timeout for thinking models
+            'content_type' => $content_type,
+            'cleaned_content' => $cleaned_content,
+            'cache_key' => $cache_key,
+            'post_id' => $post_id
         );
+    }
 
-        // Use proper 2025 API endpoint with models/ prefix
-        $url = $this->api_base_url . '/models/' . $this->selected_model . ':generateContent?key=' . $this->api_key;
-        $response = wp_remote_post($url, $request_args);
-
-        if (is_wp_error($response)) {
-            return array(
-                'success' => false,
-                'error' => sprintf(
-                    __('API connection failed: %s', 'hmg-ai-blog-enhancer'),
-                    $response->get_error_message()
-                )
-            );
-        }
-
-        $response_code = wp_remote_retrieve_response_code($response);
-        $response_body = wp_remote_retrieve_body($response);
+    /**
+     * Turn a Gemini API response into a generation result
+     *
+     * Caches the content and records usage on success.
+     *
+     * @since    1.3.0
+     * @param    array     $request          Request returned by build_generation_request().
+     * @param    int       $response_code    HTTP status code.
+     * @param    string    $response_body    Raw response body.
+     * @return   array                       Generation result with content or error.
+     */
+    public function parse_generation_response($request, $response_code, $response_body) {
+        $content_type = $request['content_type'];
         $data = json_decode($response_body, true);
 
         if ($response_code !== 200) {
@@ -420,7 +426,8 @@ Please provide a clear, professional summary without HTML formatting.'
                     __('Gemini API error (%d): %s', 'hmg-ai-blog-enhancer'),
                     $response_code,
                     $error_message
-                )
+                ),
+                'status_code' => $response_code
             );
         }
 
@@ -444,17 +451,40 @@ Please provide a clear, professional summary without HTML formatting.'
         // If still no tokens, estimate based on content length
         if ($tokens_used === 0) {
             // Rough estimate: 1 token ≈ 4 characters
-            $total_chars = strlen($content) + strlen($generated_content);
+            $total_chars = strlen($request['cleaned_content']) + strlen($generated_content);
             $tokens_used = ceil($total_chars / 4);
             error_log('HMG AI Gemini: No token count from API, estimated ' . $tokens_used . ' tokens');
         } else {
             error_log('HMG AI Gemini: API returned ' . $tokens_used . ' tokens');
         }
 
+        $formatted_content = $this->format_generated_content($generated_content, $content_type);
+
+        // Cache the result with content type and provider
+        $this->cache_content($request['cache_key'], $formatted_content, $content_type, 'gemini');
+        
+        // Debug logging
+        error_log('HMG AI Gemini: Calling record_usage for ' . $content_type . ' with ' . $tokens_used . ' tokens');
+        
+        // Record usage
+        $record_result = $this->auth_service->record_usage(
+            $request['post_id'],
+            $content_type,
+            1, // API calls
+            $tokens_used,
+            'gemini' // Provider name for cost tracking
+        );
+        
+        error_log('HMG AI Gemini: record_usage returned: ' . ($record_result ? 'success' : 'failure'));
+        
         return array(
             'success' => true,
-            'content' => $this->format_generated_content($generated_content, $content_type),
-            'tokens_used' => $tokens_used
+            'content' => $formatted_content,
+            'tokens_used' => $tokens_used,
+            'message' => sprintf(
+                __('%s generated successfully!', 'hmg-ai-blog-enhancer'),
+                ucfirst($content_type)
+            )
         );
     }
 
@@ -0,0 +1,662 @@
+<?php
+/**
+ * Internal Link Index
+ *
+ * Persistent TF-IDF inverted index over published posts, used to find
+ * related posts for internal link suggestions without comparing the
+ * current post against the whole archive.
+ *
+ * @link       https://haleymarketing.com
+ * @since      1.3.0
+ *
+ * @package    HMG_AI_Blog_Enhancer
+ * @subpackage HMG_AI_Blog_Enhancer/includes/services
+ */
+
+class HMG_AI_Link_Index {
+
+    /**
+     * Schema version of the index tables
+     *
+     * @since    1.3.0
+     * @var      string
+     */
+    const DB_VERSION = '1.1.0';
+
+    /**
+     * Post meta key holding the content hash a post was indexed with
+     *
+     * @since    1.3.0
+     * @var      string
+     */
+    const HASH_META_KEY = '_hmg_ai_link_index_hash';
+
+    /**
+     * Cron hook that indexes posts published before the index existed
+     *
+     * @since    1.3.0
+     * @var      string
+     */
+    const BUILD_HOOK = 'hmg_ai_link_index_build';
+
+    /**
+     * Posts indexed per backfill run
+     *
+     * @since    1.3.0
+     * @var      int
+     */
+    const BUILD_BATCH_SIZE = 200;
+
+    /**
+     * Maximum terms kept per post, highest term frequency first
+     *
+     * @since    1.3.0
+     * @var      int
+     */
+    const MAX_DOC_TERMS = 200;
+
+    /**
+     * Maximum query terms scored, highest TF-IDF weight first
+     *
+     * @since    1.3.0
+     * @var      int
+     */
+    const MAX_QUERY_TERMS = 20;
+
+    /**
+     * Maximum postings read per query term, highest weight first
+     *
+     * @since    1.3.0
+     * @var      int
+     */
+    const MAX_POSTINGS_PER_TERM = 1000;
+
+    /**
+     * Terms found in more than this share of posts are skipped at query time
+     *
+     * @since    1.3.0
+     * @var      float
+     */
+    const MAX_DF_RATIO = 0.25;
+
+    /**
+     * Smallest index size at which MAX_DF_RATIO is applied
+     *
+     * @since    1.3.0
+     * @var      int
+     */
+    const MIN_DF_RATIO_DOCS = 50;
+
+    /**
+     * Words ignored when tokenizing
+     *
+     * @since    1.3.0
+     * @access   private
+     * @var      array    $stop_words    Stop words, as keys.
+     */
+    private static $stop_words = array(
+        'the', 'is', 'at', 'which', 'on', 'a', 'an', 'as', 'are', 'was', 'were',
+        'been', 'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+        'could', 'should', 'may', 'might', 'must', 'can', 'to', 'of', 'in', 'for',
+        'with', 'by', 'from', 'about', 'into', 'after', 'over', 'under', 'between',
+        'through', 'during', 'before', 'above', 'below', 'up', 'down', 'out', 'off',
+        'and', 'but', 'or', 'so', 'if', 'when', 'where', 'what', 'who', 'why', 'how',
+        'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
+        'them', 'their', 'our', 'your', 'its', 'my', 'me', 'him', 'her', 'us',
+        'also', 'than', 'then', 'there', 'here', 'just', 'more', 'most', 'some',
+        'such', 'only', 'other', 'very', 'each', 'both', 'into', 'while', 'because'
+    );
+
+    /**
+     * Postings table name
+     *
+     * @since    1.3.0
+     * @access   private
+     * @var      string    $postings_table    Term, post and weight rows.
+     */
+    private $postings_table;
+
+    /**
+     * Terms table name
+     *
+     * @since    1.3.0
+     * @access   private
+     * @var      string    $terms_table    Document frequency per term.
+     */
+    private $terms_table;
+
+    /**
+     * Initialize the Link Index
+     *
+     * @since    1.3.0
+     */
+    public function __construct() {
+        global $wpdb;
+
+        $this->postings_table = $wpdb->prefix . 'hmg_ai_link_postings';
+        $this->terms_table = $wpdb->prefix . 'hmg_ai_link_terms';
+    }
+
+    /**
+     * Create or update the index tables
+     *
+     * @since    1.3.0
+     */
+    public static function create_tables() {
+        global $wpdb;
+
+        $charset_collate = $wpdb->get_charset_collate();
+        $postings_table = $wpdb->prefix . 'hmg_ai_link_postings';
+        $terms_table = $wpdb->prefix . 'hmg_ai_link_terms';
+
+        $postings_sql = "CREATE TABLE $postings_table (
+            term varchar(64) NOT NULL,
+            post_id bigint(20) unsigned NOT NULL,
+            weight float NOT NULL,
+            PRIMARY KEY  (term, post_id),
+            KEY post_id (post_id),
+            KEY term_weight (term, weight)
+        ) $charset_collate;";
+
+        $terms_sql = "CREATE TABLE $terms_table (
+            term varchar(64) NOT NULL,
+            df int(11) unsigned NOT NULL DEFAULT 0,
+            PRIMARY KEY  (term)
+        ) $charset_collate;";
+
+        require_once(ABSPATH . 'wp-admin/includes/upgrade.php');
+        dbDelta($postings_sql);
+        dbDelta($terms_sql);
+
+        update_option('hmg_ai_link_index_db_version', self::DB_VERSION);
+    }
+
+    /**
+     * Drop the index tables and per-post index state
+     *
+     * @since    1.3.0
+     */
+    public static function drop_tables() {
+        global $wpdb;
+
+        $wpdb->query("DROP TABLE IF EXISTS {$wpdb->prefix}hmg_ai_link_postings");
+        $wpdb->query("DROP TABLE IF EXISTS {$wpdb->prefix}hmg_ai_link_terms");
+
+        delete_post_meta_by_key(self::HASH_META_KEY);
+        delete_option('hmg_ai_link_index_db_version');
+        delete_option('hmg_ai_link_index_doc_count');
+        delete_option('hmg_ai_link_index_complete');
+    }
+
+    /**
+     * Make sure the index tables exist for installs updated in place
+     *
+     * @since    1.3.0
+     * @access   private
+     */
+    private function maybe_create_tables() {
+        if (get_option('hmg_ai_link_index_db_version') !== self::DB_VERSION) {
+            self::create_tables();
+        }
+    }
+
+    /**
+     * Keep the index in step with a saved post
+     *
+     * Hooked to save_post. Published posts are (re)indexed when their
+     * content hash changes; any other status removes the post.
+     *
+     * @since    1.3.0
+     * @param    int        $post_id    The post ID.
+     * @param    WP_Post    $post       The post object.
+     */
+    public function handle_save_post($post_id, $post) {
+        if (wp_is_post_revision($post_id) || wp_is_post_autosave($post_id)) {
+            return;
+        }
+
+        if ($post->post_type !== 'post') {
+            return;
+        }
+
+        if ($post->post_status === 'publish') {
+            $this->index_post($post);
+        } else {
+            $this->remove_post($post_id);
+        }
+    }
+
+    /**
+     * Remove a post from the index before it is deleted
+     *
+     * @since    1.3.0
+     * @param    int    $post_id    The post ID.
+     */
+    public function handle_delete_post($post_id) {
+        $this->remove_post($post_id);
+    }
+
+    /**
+     * Add or refresh one post in the index
+     *
+     * @since    1.3.0
+     * @param    WP_Post    $post    Published post
+     * @return   bool                Whether the index changed
+     */
+    public function index_post($post) {
+        global $wpdb;
+
+        $hash = md5($post->post_title . "\n" . $post->post_content);
+        if (get_post_meta($post->ID, self::HASH_META_KEY, true) === $hash) {
+            return false;
+        }
+
+        $this->maybe_create_tables();
+        $was_indexed = $this->remove_postings($post->ID);
+
+        $weights = $this->get_document_weights($post->post_title . ' ' . $post->post_content);
+
+        if (!empty($weights)) {
+            $postings = array();
+            $terms = array();
+            foreach ($weights as $term => $weight) {
+                $postings[] = $wpdb->prepare('(%s, %d, %f)', $term, $post->ID, $weight);
+                $terms[] = $wpdb->prepare('(%s, 1)', $term);
+            }
+
+            $wpdb->query("INSERT INTO {$this->postings_table} (term, post_id, weight) VALUES " . implode(', ', $postings));
+            $wpdb->query(
+                "INSERT INTO {$this->terms_table} (term, df) VALUES " . implode(', ', $terms) .
+                " ON DUPLICATE KEY UPDATE df = df + 1"
+            );
+        }
+
+        if (!$was_indexed) {
+            update_option('hmg_ai_link_index_doc_count', $this->get_document_count() + 1, false);
+        }
+
+        update_post_meta($post->ID, self::HASH_META_KEY, $hash);
+
+        return true;
+    }
+
+    /**
+     * Remove one post from the index
+     *
+     * @since    1.3.0
+     * @param    int    $post_id    The post ID.
+     * @return   bool               Whether the post was indexed
+     */
+    public function remove_post($post_id) {
+        if (get_post_meta($post_id, self::HASH_META_KEY, true) === '') {
+            return false;
+        }
+
+        $this->maybe_create_tables();
+        $this->remove_postings($post_id);
+
+        update_option('hmg_ai_link_index_doc_count', max(0, $this->get_document_count() - 1), false);
+        delete_post_meta($post_id, self::HASH_META_KEY);
+
+        return true;
+    }
+
+    /**
+     * Delete a post's postings and release its document frequencies
+     *
+     * @since    1.3.0
+     * @access   private
+     * @param    int    $post_id    The post ID.
+     * @return   bool               Whether the post was indexed before
+     */
+    private function remove_postings($post_id) {
+        global $wpdb;
+
+        if (get_post_meta($post_id, self::HASH_META_KEY, true) === '') {
+            return false;
+        }
+
+        $terms = $wpdb->get_col($wpdb->prepare(
+            "SELECT term FROM {$this->postings_table} WHERE post_id = %d",
+            $post_id
+        ));
+
+        if (!empty($terms)) {
+            $placeholders = implode(', ', array_fill(0, count($terms), '%s'));
+
+            $wpdb->query($wpdb->prepare(
+                "UPDATE {$this->terms_table} SET df = df - 1 WHERE df > 0 AND term IN ($placeholders)",
+                $terms
+            ));
+            $wpdb->query("DELETE FROM {$this->terms_table} WHERE df = 0");
+            $wpdb->query($wpdb->prepare(
+                "DELETE FROM {$this->postings_table} WHERE post_id = %d",
+                $post_id
+            ));
+        }
+
+        return true;
+    }
+
+    /**
+     * Index a batch of published posts that are not in the index yet
+     *
+     * Runs from cron and reschedules itself until every published post
+     * has been indexed.
+     *
+     * @since    1.3.0
+     * @return   int    Number of posts indexed
+     */
+    public function build_batch() {
+        global $wpdb;
+
+        $this->maybe_create_tables();
+
+        $post_ids = $wpdb->get_col($wpdb->prepare(
+            "SELECT p.ID FROM {$wpdb->posts} p
+             LEFT JOIN {$wpdb->postmeta} m ON m.post_id = p.ID AND m.meta_key = %s
+             WHERE p.post_type = 'post' AND p.post_status = 'publish' AND m.post_id IS NULL
+             ORDER BY p.ID DESC
+             LIMIT %d",
+            self::HASH_META_KEY,
+            self::BUILD_BATCH_SIZE
+        ));
+
+        foreach ($post_ids as $post_id) {
+            $post = get_post($post_id);
+            if ($post) {
+                $this->index_post($post);
+            }
+        }
+
+        if (count($post_ids) < self::BUILD_BATCH_SIZE) {
+            update_option('hmg_ai_link_index_complete', 1);
+        } else {
+            wp_schedule_single_event(time() + 10, self::BUILD_HOOK);
+        }
+
+        return count($post_ids);
+    }
+
+    /**
+     * Schedule a backfill run unless the index is complete or one is queued
+     *
+     * @since    1.3.0
+     */
+    public function maybe_schedule_build() {
+        if (!get_option('hmg_ai_link_index_complete') && !wp_next_scheduled(self::BUILD_HOOK)) {
+            wp_schedule_single_event(time(), self::BUILD_HOOK);
+        }
+    }
+
+    /**
+     * Find the posts most related to a piece of content
+     *
+     * Scores term-at-a-time with max-score pruning. Query terms are visited
+     * in order of their highest possible contribution, and each posting list
+     * is read highest weight first. Once the best $limit scores are known,
+     * only postings that could still lift a post into them are read: new
+     * posts need a weight above a floor, and posts that can no longer make
+     * it are dropped. A bounded min-heap then keeps the best $limit posts.
+     * Weights follow the lnc.ltc scheme, so stored postings never need
+     * rewriting when the archive grows and scores are cosine similarities
+     * in [0, 1].
+     *
+     * @since    1.3.0
+     * @param    string    $content       Content to find related posts for
+     * @param    int       $limit         Number of posts to return
+     * @param    array     $exclude_ids   Post IDs to leave out
+     * @return   array                    Related posts, best first, each with post_id, score and term
+     */
+    public function find_related($content, $limit = 5, $exclude_ids = array()) {
+        global $wpdb;
+
+        $this->maybe_create_tables();
+
+        $doc_count = $this->get_document_count();
+        $term_counts = $this->get_term_counts($content);
+
+        if ($doc_count === 0 || empty($term_counts)) {
+            return array();
+        }
+
+        $placeholders = implode(', ', array_fill(0, count($term_counts), '%s'));
+        $dfs = $wpdb->get_results($wpdb->prepare(
+            "SELECT term, df FROM {$this->terms_table} WHERE term IN ($placeholders)",
+            array_keys($term_counts)
+        ), OBJECT_K);
+
+        // Query weights: log tf x smoothed idf. On larger sites, terms too common to
+        // discriminate are dropped; small sites keep them so shared terms still match.
+        $apply_df_ratio = $doc_count >= self::MIN_DF_RATIO_DOCS;
+        $query_weights = array();
+        foreach ($dfs as $term => $row) {
+            $df = (int) $row->df;
+            if ($df < 1 || ($apply_df_ratio && $df > $doc_count * self::MAX_DF_RATIO)) {
+                continue;
+            }
+            $query_weights[$term] = (1 + log($term_counts[$term])) * log(1 + $doc_count / $df);
+        }
+
+        if (empty($query_weights)) {
+            return array();
+        }
+
+        arsort($query_weights);
+        $query_weights = array_slice($query_weights, 0, self::MAX_QUERY_TERMS, true);
+        $query_weights = $this->normalize($query_weights);
+
+        // Highest stored weight per term, read from the (term, weight) index
+        $placeholders = implode(', ', array_fill(0, count($query_weights), '%s'));
+        $max_weights = $wpdb->get_results($wpdb->prepare(
+            "SELECT term, MAX(weight) AS max_weight FROM {$this->postings_table} WHERE term IN ($placeholders) GROUP BY term",
+            array_keys($query_weights)
+        ), OBJECT_K);
+
+        // Most a term can add to any post's score
+        $bounds = array();
+        foreach ($query_weights as $term => $query_weight) {
+            if (isset($max_weights[$term])) {
+                $bounds[$term] = $query_weight * (float) $max_weights[$term]->max_weight;
+            }
+        }
+        arsort($bounds);
+        $remaining = array_sum($bounds);
+
+        $exclude = array_flip(array_map('intval', $exclude_ids));
+        $scores = array();
+        $best_terms = array();
+
+        foreach ($bounds as $term => $bound) {
+            $remaining -= $bound;
+            $query_weight = $query_weights[$term];
+            $threshold = $this->get_kth_score($scores, $limit);
+
+            // Drop posts that can't reach the current top $limit even with every remaining term
+            if ($threshold > 0) {
+                foreach ($scores as $post_id => $score) {
+                    if ($score + $bound + $remaining < $threshold) {
+                        unset($scores[$post_id], $best_terms[$post_id]);
+                    }
+                }
+            }
+
+            // A post not seen yet needs a weight above this floor to still make the top $limit
+            $floor = ($threshold - $remaining) / $query_weight;
+
+            $postings = array();
+            if ($bound + $remaining > $threshold) {
+                $postings = $wpdb->get_results($wpdb->prepare(
+                    "SELECT post_id, weight FROM {$this->postings_table}
+                     WHERE term = %s AND weight > %f
+                     ORDER BY weight DESC
+                     LIMIT %d",
+                    $term,
+                    max(0, $floor),
+                    self::MAX_POSTINGS_PER_TERM
+                ), ARRAY_N);
+            }
+
+            // Posts already being scored need this term's weight even below the floor
+            if ($threshold > 0 || count($postings) >= self::MAX_POSTINGS_PER_TERM) {
+                $read = array();
+                foreach ($postings as $posting) {
+                    $read[(int) $posting[0]] = true;
+                }
+
+                foreach (array_chunk(array_keys(array_diff_key($scores, $read)), 500) as $post_ids) {
+                    $id_placeholders = implode(', ', array_fill(0, count($post_ids), '%d'));
+                    $postings = array_merge($postings, $wpdb->get_results($wpdb->prepare(
+                        "SELECT post_id, weight FROM {$this->postings_table} WHERE term = %s AND post_id IN ($id_placeholders)",
+                        array_merge(array($term), $post_ids)
+                    ), ARRAY_N));
+                }
+            }
+
+            foreach ($postings as $posting) {
+                $post_id = (int) $posting[0];
+                if (isset($exclude[$post_id])) {
+                    continue;
+                }
+
+                $contribution = $query_weight * $posting[1];
+                if (!isset($scores[$post_id])) {
+                    $scores[$post_id] = $contribution;
+                    $best_terms[$post_id] = array($term, $contribution);
+                } else {
+                    $scores[$post_id] += $contribution;
+                    if ($contribution > $best_terms[$post_id][1]) {
+                        $best_terms[$post_id] = array($term, $contribution);
+                    }
+                }
+            }
+        }
+
+        $heap = new SplMinHeap();
+        foreach ($scores as $post_id => $score) {
+            if ($heap->count() < $limit) {
+                $heap->insert(array($score, $post_id));
+            } elseif ($score > $heap->top()[0]) {
+                $heap->extract();
+                $heap->insert(array($score, $post_id));
+            }
+        }
+
+        $related = array();
+        foreach ($heap as $entry) {
+            $related[] = array(
+                'post_id' => $entry[1],
+                'score' => round(min(1, $entry[0]), 4),
+                'term' => (string) $best_terms[$entry[1]][0]
+            );
+        }
+
+        // The min-heap iterates lowest score first
+        return array_reverse($related);
+    }
+
+    /**
+     * Lowest score among the best $k accumulated scores
+     *
+     * @since    1.3.0
+     * @access   private
+     * @param    array    $scores    Post ID => partial score
+     * @param    int      $k         Number of top scores
+     * @return   float               K-th best score, or 0 while fewer than $k posts are scored
+     */
+    private function get_kth_score($scores, $k) {
+        if ($k < 1 || count($scores) < $k) {
+            return 0;
+        }
+
+        $heap = new SplMinHeap();
+        foreach ($scores as $score) {
+            if ($heap->count() < $k) {
+                $heap->insert($score);
+            } elseif ($score > $heap->top()) {
+                $heap->extract();
+                $heap->insert($score);
+            }
+        }
+
+        return $heap->top();
+    }
+
+    /**
+     * Number of posts in the index
+     *
+     * @since    1.3.0
+     * @return   int    Indexed post count
+     */
+    public function get_document_count() {
+        return (int) get_option('hmg_ai_link_index_doc_count', 0);
+    }
+
+    /**
+     * Stored weights for a document: log tf, cosine normalized
+     *
+     * @since    1.3.0
+     * @access   private
+     * @param    string    $text    Post title and content
+     * @return   array              Term => weight
+     */
+    private function get_document_weights($text) {
+        $term_counts = $this->get_term_counts($text);
+        arsort($term_counts);
+        $term_counts = array_slice($term_counts, 0, self::MAX_DOC_TERMS, true);
+
+        $weights = array();
+        foreach ($term_counts as $term => $count) {
+            $weights[$term] = 1 + log($count);
+        }
+
+        return $this->normalize($weights);
+    }
+
+    /**
+     * Count indexable terms in a piece of content
+     *
+     * @since    1.3.0
+     * @access   private
+     * @param    string    $text    HTML or plain text
+     * @return   array              Term => occurrences
+     */
+    private function get_term_counts($text) {
+        $words = str_word_count(strtolower(wp_strip_all_tags($text)), 1);
+        $stop_words = array_flip(self::$stop_words);
+
+        $counts = array();
+        foreach ($words as $word) {
+            if (strlen($word) <= 3 || strlen($word) > 64 || isset($stop_words[$word])) {
+                continue;
+            }
+            $counts[$word] = ($counts[$word] ?? 0) + 1;
+        }
+
+        return $counts;
+    }
+
+    /**
+     * Scale weights to unit length
+     *
+     * @since    1.3.0
+     * @access   private
+     * @param    array    $weights    Term => weight
+     * @return   array                Term => normalized weight
+     */
+    private function normalize($weights) {
+        $norm = sqrt(array_sum(array_map(function($weight) {
+            return $weight * $weight;
+        }, $weights)));
+
+        if ($norm == 0) {
+            return array();
+        }
+
+        foreach ($weights as $term => $weight) {
+            $weights[$term] = $weight / $norm;
+        }
+
+        return $weights;
+    }
+}
@@ -85,7 +85,8 @@ class HMG_AI_OpenAI_Service {
      * @since    1.1.0
      */
     public function __construct() {
-        $this->api_base_url = 'https://api.openai.com/v1';
+        // Base URL can be overridden (e.g. to point at a local stand-in server for testing)
+        $this->api_base_url = rtrim(getenv('HMG_AI_OPENAI_BASE_URL') ?: 'https://api.openai.com/v1', '/');
         
         // Get API key and model from options
         $options = get_option('hmg_ai_blog_enhancer_options', array());
@@ -236,6 +237,54 @@ Content:
      * @return   array                      Result array with success status and generated content or error message.
      */
     public function generate_content($content_type, $content, $post_id = 0, $options = array()) {
+        $request = $this->build_generation_request($content_type, $content, $post_id, $options);
+
+        // Validation errors and cached content are returned as finished results
+        if (isset($request['success'])) {
+            return $request;
+        }
+
+        // Make API call
+        $response = wp_remote_post(
+            $request['url'],
+            array(
+                'headers' => $request['headers'],
+                'body' => $request['body'],
+                'timeout' => $request['timeout'],
+                'sslverify' => true
+            )
+        );
+
+        // Handle errors
+        if (is_wp_error($response)) {
+            return array(
+                'success' => false,
+                'error' => sprintf(__('API request failed: %s', 'hmg-ai-blog-enhancer'), $response->get_error_message()),
+                'status_code' => 0 // No HTTP response
+            );
+        }
+
+        return $this->parse_generation_response(
+            $request,
+            wp_remote_retrieve_response_code($response),
+            wp_remote_retrieve_body($response)
+        );
+    }
+
+    /**
+     * Build the HTTP request for a content generation call
+     *
+     * Split from generate_content() so the service manager can send the
+     * request itself, e.g. in parallel with another provider.
+     *
+     * @since    1.3.0
+     * @param    string    $content_type    The type of content to generate.
+     * @param    string    $content         The source content.
+     * @param    int       $post_id         Optional. The post ID for caching.
+     * @param    array     $options         Generation options.
+     * @return   array                      Request (url, headers, body, timeout) or a finished result with a success key.
+     */
+    public function build_generation_request($content_type, $content, $post_id = 0, $options = array()) {
         // Check if API key is configured
         if (empty($this->api_key)) {
             return array(
@@ -261,9 +310,10 @@ Content:
         }
 
         // Check cache if post_id is provided
+        $cache_key = null;
         if ($post_id) {
             $cache_key = 'hmg_ai_openai_' . $content_type . '_' . $post_id . '_' . md5($content);
-            $cached_content = get_transient($cache_key);
+            $cached_content = empty($options['force_regenerate']) ? get_transient($cache_key) : false;
             
             if ($cached_content !== false) {
                 return array(
@@ -311,30 +361,30 @@ Content:
             'presence_penalty' => 0.3
         );
 
-        // Make API call
-        $response = wp_remote_post(
-            $this->api_base_url . '/chat/completions',
-            array(
-                'headers' => array(
-                    'Authorization' => 'Bearer ' . $this->api_key,
-                    'Content-Type' => 'application/json'
-                ),
-                'body' => json_encode($request_body),
-                'timeout' => 30,
-                'sslverify' => true
-            )
+        return array(
+            'url' => $this->api_base_url . '/chat/completions',
+            'headers' => array(
+                'Authorization' => 'Bearer ' . $this->api_key,
+                'Content-Type' => 'application/json'
+            ),
+            'body' => json_encode($request_body),
+            'timeout' => 30,
+            'content_type' => $content_type,
+            'cache_key' => $cache_key
         );
+    }
 
-        // Handle errors
-        if (is_wp_error($response)) {
-            return array(
-                'success' => false,
-                'error' => sprintf(__('API request failed: %s', 'hmg-ai-blog-enhancer'), $response->get_error_message())
-            );
-        }
-
-        $response_code = wp_remote_retrieve_response_code($response);
-        $response_body = wp_remote_retrieve_body($response);
+    /**
+     * Turn an API response into a generation result
+     *
+     * @since    1.3.0
+     * @param    array     $request          Request returned by build_generation_request().
+     * @param    int       $response_code    HTTP status code.
+     * @param    string    $response_body    Raw response body.
+     * @return   array                       Result array with success status and generated content or error message.
+     */
+    public function parse_generation_response($request, $response_code, $response_body) {
+        $content_type = $request['content_type'];
 
         if ($response_code !== 200) {
             $error_data = json_decode($response_body, true);
@@ -344,7 +394,8 @@ Content:
             
             return array(
                 'success' => false,
-                'error' => $error_message
+                'error' => $error_message,
+                'status_code' => $response_code
             );
         }
 
@@ -364,8 +415,8 @@ Content:
         $formatted_content = $this->format_content_for_type($generated_content, $content_type);
 
         // Cache the result if post_id is provided
-        if ($post_id && !empty($cache_key)) {
-            set_transient($cache_key, $formatted_content, DAY_IN_SECONDS);
+        if (!empty($request['cache_key'])) {
+            set_transient($request['cache_key'], $formatted_content, DAY_IN_SECONDS);
         }
 
         // Track usage if auth service is available and has track_usage method
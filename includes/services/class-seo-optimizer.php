@@ -32,6 +32,33 @@ class HMG_AI_SEO_Optimizer {
      */
     private $seo_options;
 
+    /**
+     * Per-section timings of the current optimize_content call
+     *
+     * @since    1.3.0
+     * @access   private
+     * @var      array    $timings    Section => milliseconds and cache status.
+     */
+    private $timings = array();
+
+    /**
+     * Whether the current call bypasses memoized section results
+     *
+     * @since    1.3.0
+     * @access   private
+     * @var      bool    $force_regenerate    Skip memo lookups.
+     */
+    private $force_regenerate = false;
+
+    /**
+     * Whether the section being computed produced a result that must not be memoized
+     *
+     * @since    1.3.0
+     * @access   private
+     * @var      bool    $skip_memo    Set by a section that fell back after a transient failure.
+     */
+    private $skip_memo = false;
+
     /**
      * Initialize the SEO Optimizer
      *
@@ -82,15 +109,22 @@ class HMG_AI_SEO_Optimizer {
             'suggestions' => array()
         );
 
+        $this->timings = array();
+        $this->force_regenerate = !empty($options['force_regenerate']);
+
         try {
             // 1. Generate meta description
             if ($this->seo_options['enable_meta_generation']) {
-                $results['meta_description'] = $this->generate_meta_description($content, $title);
+                $results['meta_description'] = $this->run_section('meta_description', function() use ($content, $title) {
+                    return $this->generate_meta_description($content, $title);
+                }, array($content, $title, $this->seo_options['meta_description_length'], (bool) $this->ai_service));
             }
 
             // 2. Extract and optimize keywords
             if ($this->seo_options['enable_keyword_optimization']) {
-                $keyword_data = $this->optimize_keywords($content, $title);
+                $keyword_data = $this->run_section('keywords', function() use ($content, $title) {
+                    return $this->optimize_keywords($content, $title);
+                }, array($content, $title, $this->seo_options['target_keyword_density']));
                 $results['keywords'] = $keyword_data['keywords'];
                 $results['optimized_content'] = $keyword_data['optimized_content'];
                 $results['keyword_density'] = $keyword_data['density'];
@@ -98,27 +132,47 @@ class HMG_AI_SEO_Optimizer {
 
             // 3. Generate schema markup
             if ($this->seo_options['enable_schema_markup']) {
-                $results['schema_markup'] = $this->generate_schema_markup($content, $title, $post_id);
+                $results['schema_markup'] = $this->run_section('schema_markup', function() use ($content, $title, $post_id) {
+                    return $this->generate_schema_markup($content, $title, $post_id);
+                }, array(
+                    $content,
+                    $title,
+                    $post_id,
+                    get_the_date('c', $post_id),
+                    get_the_modified_date('c', $post_id),
+                    $post_id ? get_post_thumbnail_id($post_id) : 0,
+                    get_site_url()
+                ));
             }
 
             // 4. Calculate readability score
             if ($this->seo_options['enable_readability_scoring']) {
-                $readability_data = $this->calculate_readability($content);
+                $readability_data = $this->run_section('readability', function() use ($content) {
+                    return $this->calculate_readability($content);
+                }, array($content));
                 $results['readability_score'] = $readability_data['score'];
                 $results['readability_grade'] = $readability_data['grade'];
                 $results['readability_issues'] = $readability_data['issues'];
             }
 
-            // 5. Suggest internal links
+            // 5. Suggest internal links (already served from the link index)
             if ($this->seo_options['enable_internal_linking']) {
-                $results['internal_links'] = $this->suggest_internal_links($content, $post_id);
+                $results['internal_links'] = $this->run_section('internal_links', function() use ($content, $post_id) {
+                    return $this->suggest_internal_links($content, $post_id);
+                });
             }
 
             // 6. Optimize title for SEO
-            $results['seo_title'] = $this->optimize_title($title, $results['keywords']);
+            $results['seo_title'] = $this->run_section('seo_title', function() use ($title, $results) {
+                return $this->optimize_title($title, $results['keywords']);
+            });
 
             // 7. Generate SEO suggestions
-            $results['suggestions'] = $this->generate_seo_suggestions($results);
+            $results['suggestions'] = $this->run_section('suggestions', function() use ($results) {
+                return $this->generate_seo_suggestions($results);
+            });
+
+            $results['timings'] = $this->timings;
 
             // Save SEO data as post meta
             if ($post_id > 0) {
@@ -133,6 +187,46 @@ class HMG_AI_SEO_Optimizer {
         return $results;
     }
 
+    /**
+     * Run one section of the analysis, timing it and memoizing its result
+     *
+     * Sections with inputs are cached under a hash of exactly those inputs,
+     * so a section is only recomputed when something it depends on changes.
+     *
+     * @since    1.3.0
+     * @param    string      $section     Section name used in the timing breakdown
+     * @param    callable    $callback    Computes the section result
+     * @param    array       $inputs      Everything the result depends on, or null to skip memoization
+     * @return   mixed                    Section result
+     */
+    private function run_section($section, $callback, $inputs = null) {
+        $started = microtime(true);
+        $cached = false;
+
+        if ($inputs === null) {
+            $result = call_user_func($callback);
+        } else {
+            $memo_key = 'hmg_ai_seo_' . $section . '_' . md5(wp_json_encode($inputs));
+            $result = $this->force_regenerate ? false : get_transient($memo_key);
+            $cached = $result !== false;
+
+            if (!$cached) {
+                $this->skip_memo = false;
+                $result = call_user_func($callback);
+                if (!$this->skip_memo) {
+                    set_transient($memo_key, $result, DAY_IN_SECONDS);
+                }
+            }
+        }
+
+        $this->timings[$section] = array(
+            'ms' => round((microtime(true) - $started) * 1000, 2),
+            'cached' => $cached
+        );
+
+        return $result;
+    }
+
     /**
      * Generate meta description using AI
      *
@@ -169,6 +263,8 @@ class HMG_AI_SEO_Optimizer {
             return $meta_desc;
         }
 
+        // The AI call failed; serve the extractive description but retry AI next time
+        $this->skip_memo = true;
         return $this->generate_fallback_meta_description($content);
     }
 
@@ -521,73 +617,54 @@ class HMG_AI_SEO_Optimizer {
     /**
      * Suggest internal links
      *
+     * Related posts come from the persistent TF-IDF link index, so the
+     * cost depends on the query's posting lists rather than archive size.
+     *
      * @since    1.3.0
      * @param    string    $content    Content to analyze
      * @param    int       $post_id    Current post ID
      * @return   array                 Suggested links
      */
     private function suggest_internal_links($content, $post_id = 0) {
+        if (!class_exists('HMG_AI_Link_Index')) {
+            require_once HMG_AI_BLOG_ENHANCER_PLUGIN_DIR . 'includes/services/class-link-index.php';
+        }
+
+        $link_index = new HMG_AI_Link_Index();
+        $link_index->maybe_schedule_build();
+
+        $related = $link_index->find_related($content, 5, array($post_id));
+        if (empty($related)) {
+            return array();
+        }
+
+        // Load the matched posts in one query
+        $posts = get_posts(array(
+            'post_type' => 'post',
+            'post_status' => 'publish',
+            'post__in' => array_column($related, 'post_id'),
+            'posts_per_page' => count($related),
+            'orderby' => 'post__in'
+        ));
+
+        $titles = wp_list_pluck($posts, 'post_title', 'ID');
         $suggestions = array();
-        
-        // Extract keywords from content
-        $keywords = $this->extract_keywords(wp_strip_all_tags($content));
-        
-        foreach ($keywords as $keyword) {
-            // Search for related posts
-            $args = array(
-                's' => $keyword,
-                'post_type' => 'post',
-                'post_status' => 'publish',
-                'posts_per_page' => 3,
-                'post__not_in' => array($post_id),
-                'orderby' => 'relevance'
-            );
-            
-            $related_posts = get_posts($args);
-            
-            foreach ($related_posts as $post) {
-                // Check if this keyword appears in the content
-                if (stripos($content, $keyword) !== false) {
-                    $suggestions[] = array(
-                        'keyword' => $keyword,
-                        'post_id' => $post->ID,
-                        'title' => $post->post_title,
-                        'url' => get_permalink($post->ID),
-                        'relevance' => $this->calculate_relevance($content, $post->post_content)
-                    );
-                }
+
+        foreach ($related as $match) {
+            if (!isset($titles[$match['post_id']])) {
+                continue;
             }
-        }
-        
-        // Sort by relevance
-        usort($suggestions, function($a, $b) {
-            return $b['relevance'] <=> $a['relevance'];
-        });
-        
-        // Return top 5 suggestions
-        return array_slice($suggestions, 0, 5);
-    }
 
-    /**
-     * Calculate relevance between two pieces of content
-     *
-     * @since    1.3.0
-     * @param    string    $content1    First content
-     * @param    string    $content2    Second content
-     * @return   float                  Relevance score
-     */
-    private function calculate_relevance($content1, $content2) {
-        $words1 = array_unique(str_word_count(strtolower($content1), 1));
-        $words2 = array_unique(str_word_count(strtolower($content2), 1));
-        
-        $common_words = array_intersect($words1, $words2);
-        $total_words = count(array_unique(array_merge($words1, $words2)));
-        
-        if ($total_words == 0) {
-            return 0;
+            $suggestions[] = array(
+                'keyword' => $match['term'],
+                'post_id' => $match['post_id'],
+                'title' => $titles[$match['post_id']],
+                'url' => get_permalink($match['post_id']),
+                'relevance' => $match['score']
+            );
         }
         
-        return count($common_words) / $total_words;
+        return $suggestions;
     }
 
     /**
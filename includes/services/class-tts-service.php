@@ -76,6 +76,11 @@ class HMG_AI_TTS_Service {
      * Constructor
      */
     public function __construct() {
+        // Base URL can be overridden (e.g. to point at a local stand-in server for testing)
+        if (getenv('HMG_AI_ELEVENLABS_BASE_URL')) {
+            $this->api_base = rtrim(getenv('HMG_AI_ELEVENLABS_BASE_URL'), '/');
+        }
+        
         // Initialize any required services
         add_action('init', array($this, 'maybe_refresh_voice_cache'));
     }
@@ -94,7 +99,8 @@ class HMG_AI_TTS_Service {
             'similarity_boost' => get_option('hmg_ai_tts_similarity', 0.75),
             'style' => get_option('hmg_ai_tts_style', 0.0),
             'use_speaker_boost' => get_option('hmg_ai_tts_speaker_boost', true),
-            'post_id' => 0
+            'post_id' => 0,
+            'skip_cache' => false // Always call Eleven Labs instead of reusing cached chunk audio
         );
         
         $options = wp_parse_args($options, $defaults);
@@ -102,16 +108,15 @@ class HMG_AI_TTS_Service {
         // Clean and prepare text
         $text = $this->prepare_text($text);
         
-        // Check text length limits (Eleven Labs supports up to 5000 characters per request)
-        $text_length = strlen($text);
-        if ($text_length > 5000) {
-            // For now, truncate to 5000 characters with ellipsis
-            // TODO: Implement chunking for longer texts in a future update
-            $text = substr($text, 0, 4997) . '...';
+        // Chunk boundaries depend only on the text, so a short article and a longer
+        // version of it share cached chunk audio
+        $chunks = $this->split_text_into_chunks($text, 4500);
+        if (count($chunks) > 1) {
+            return $this->generate_long_audio($text, $options);
         }
         
         // Generate with Eleven Labs
-        return $this->generate_elevenlabs_tts($text, $options);
+        return $this->generate_elevenlabs_tts(empty($chunks) ? $text : $chunks[0], $options);
     }
     
     /**
@@ -120,57 +125,39 @@ class HMG_AI_TTS_Service {
     private function generate_elevenlabs_tts($text, $options) {
         $api_key = get_option('hmg_ai_elevenlabs_api_key');
         
-        if (!$api_key) {
-            return array(
-                'error' => true,
-                'message' => __('Eleven Labs API key not configured. Please add your API key in settings.', 'hmg-ai-blog-enhancer')
-            );
-        }
-        
-        // Validate API key format (should be at least 32 characters)
-        if (strlen($api_key) < 32) {
-            return array(
-                'error' => true,
-                'message' => __('Invalid Eleven Labs API key format. Please check your API key in settings.', 'hmg-ai-blog-enhancer')
-            );
+        $key_error = $this->validate_api_key($api_key);
+        if ($key_error) {
+            return $key_error;
         }
         
         // Get voice ID
-        $voice_id = $options['voice'];
-        
-        // Check text length (Eleven Labs has character limits)
-        $text_length = strlen($text);
-        if ($text_length > 5000) {
-            // For now, truncate to 5000 chars with ellipsis
-            // TODO: Implement proper chunking
-            $text = substr($text, 0, 4997) . '...';
-        }
-        
-        // Get available voices to validate
-        $available_voices = $this->get_available_voices();
-        
-        // Validate voice exists
-        if (!isset($available_voices[$voice_id])) {
-            // Use default voice if invalid
-            $voice_id = 'EXAVITQu4vr4xnSDxMaL'; // Sarah
-            // If default not available, use first available voice
-            if (!isset($available_voices[$voice_id]) && !empty($available_voices)) {
-                $voice_id = array_key_first($available_voices);
+        $voice_id = $this->resolve_voice_id($options['voice']);
+        
+        // Reuse audio cached for this text, whether it was synthesized alone or as a chunk
+        $cache_path = $this->get_chunk_cache_path($text, $voice_id, $options);
+        $cached = empty($options['skip_cache']) ? $this->open_cached_chunk($cache_path) : false;
+        if ($cached) {
+            $audio_url = $this->save_audio_file(stream_get_contents($cached), $options['post_id'], false);
+            fclose($cached);
+            
+            if ($audio_url) {
+                $available_voices = $this->get_available_voices();
+                $voice_info = isset($available_voices[$voice_id]) ? $available_voices[$voice_id] : array('name' => 'Unknown Voice');
+                
+                return array(
+                    'audio_url' => $audio_url,
+                    'total_chunks' => 1,
+                    'cached_chunks' => 1,
+                    'duration' => $this->estimate_duration($text),
+                    'voice' => $voice_info['name'],
+                    'provider' => 'Eleven Labs',
+                    'model' => 'eleven_multilingual_v2'
+                );
             }
         }
         
         // Prepare request data for Eleven Labs
-        $request_data = array(
-            'text' => $text,
-            'model_id' => 'eleven_multilingual_v2', // Latest and best model
-            'voice_settings' => array(
-                'stability' => floatval($options['stability'] ?? 0.5),
-                'similarity_boost' => floatval($options['similarity_boost'] ?? 0.75),
-                'style' => floatval($options['style'] ?? 0.0),
-                'use_speaker_boost' => (bool)($options['speaker_boost'] ?? true)  // Fixed key name
-            ),
-            'output_format' => 'mp3_44100' // Standard MP3 format for better compatibility
-        );
+        $request_data = $this->build_tts_request_data($text, $options);
         
         // Log request details for debugging
         error_log('HMG AI Eleven Labs - Request URL: ' . $this->api_base . '/text-to-speech/' . $voice_id);
@@ -185,11 +172,7 @@ class HMG_AI_TTS_Service {
         $response = wp_remote_post(
             $this->api_base . '/text-to-speech/' . $voice_id,
             array(
-                'headers' => array(
-                    'Accept' => 'audio/mpeg',
-                    'Content-Type' => 'application/json',
-                    'xi-api-key' => $api_key
-                ),
+                'headers' => $this->get_tts_headers($api_key),
                 'body' => json_encode($request_data),
                 'timeout' => 120, // Increased timeout for longer texts
                 'sslverify' => false
@@ -222,64 +205,7 @@ class HMG_AI_TTS_Service {
         $response_code = wp_remote_retrieve_response_code($response);
         
         if ($response_code !== 200) {
-            $body = wp_remote_retrieve_body($response);
-            $error_data = json_decode($body, true);
-            
-            error_log('HMG AI Eleven Labs API Error Response Code: ' . $response_code);
-            error_log('HMG AI Eleven Labs API Error Body: ' . $body);
-            error_log('HMG AI Eleven Labs API Error Data: ' . json_encode($error_data));
-            
-            // Handle specific error codes as per Eleven Labs documentation
-            if ($response_code === 401) {
-                return array(
-                    'error' => true,
-                    'message' => __('Authentication failed: Invalid Eleven Labs API key. Please check your settings.', 'hmg-ai-blog-enhancer')
-                );
-            } elseif ($response_code === 422) {
-                // Unprocessable Entity - typically invalid voice ID or model
-                $detail = isset($error_data['detail']) ? 
-                         (is_array($error_data['detail']) ? json_encode($error_data['detail']) : $error_data['detail']) : 
-                         'Invalid voice or model specified';
-                return array(
-                    'error' => true,
-                    'message' => sprintf(__('Invalid request: %s', 'hmg-ai-blog-enhancer'), $detail)
-                );
-            } elseif ($response_code === 429) {
-                // Rate limit or quota exceeded
-                return array(
-                    'error' => true,
-                    'message' => __('Eleven Labs quota exceeded or rate limit reached. Check your usage at elevenlabs.io/app/usage', 'hmg-ai-blog-enhancer')
-                );
-            } elseif ($response_code === 400) {
-                // Bad request - check for specific error types
-                $message = 'Bad request';
-                if (isset($error_data['detail'])) {
-                    if (is_string($error_data['detail'])) {
-                        $message = $error_data['detail'];
-                    } elseif (isset($error_data['detail']['message'])) {
-                        $message = $error_data['detail']['message'];
-                    }
-                }
-                return array(
-                    'error' => true,
-                    'message' => sprintf(__('Request error: %s', 'hmg-ai-blog-enhancer'), $message)
-                );
-            } elseif ($response_code === 500 || $response_code === 503) {
-                // Server error or service unavailable
-                return array(
-                    'error' => true,
-                    'message' => __('Eleven Labs service is temporarily unavailable. Please try again in a few minutes.', 'hmg-ai-blog-enhancer')
-                );
-            }
-            
-            $message = isset($error_data['detail']) ? 
-                      (is_string($error_data['detail']) ? $error_data['detail'] : json_encode($error_data['detail'])) : 
-                      'Unknown error (Code: ' . $response_code . ')';
-                      
-            return array(
-                'error' => true,
-                'message' => sprintf(__('Eleven Labs API error: %s', 'hmg-ai-blog-enhancer'), $message)
-            );
+            return $this->get_api_error($response_code, wp_remote_retrieve_body($response));
         }
         
         // Get the audio data
@@ -296,22 +222,25 @@ class HMG_AI_TTS_Service {
         $audio_url = $this->save_audio_file($audio_data, $options['post_id'], false);
         
         if ($audio_url) {
+                // Keep the audio in the chunk cache for the next regeneration
+                if ($cache_path) {
+                    $buffer = fopen('php://temp', 'w+b');
+                    fwrite($buffer, $audio_data);
+                    $this->store_cached_chunk($buffer, $cache_path);
+                    fclose($buffer);
+                    $this->prune_chunk_cache();
+                }
+                
                 // Record usage if auth service is available
                 if (class_exists('HMG_AI_Auth_Service')) {
                     $auth_service = new HMG_AI_Auth_Service();
-                    $char_count = strlen($text);
-                    
-                    // Eleven Labs pricing (approximate)
-                    // $0.30 per 1,000 characters for standard voices
-                    $cost = ($char_count / 1000) * 0.30;
                     
                     $auth_service->record_usage(
                         $options['post_id'],
                         'audio',
-                        'elevenlabs_tts',
                         1,
-                        $char_count,
-                        $cost
+                        strlen($text),
+                        'elevenlabs'
                     );
                 }
                 
@@ -323,6 +252,8 @@ class HMG_AI_TTS_Service {
                 // The AJAX handler checks for 'error' => true, not 'success'
                 return array(
                     'audio_url' => $audio_url,
+                    'total_chunks' => 1,
+                    'cached_chunks' => 0,
                     'duration' => $this->estimate_duration($text),
                     'voice' => $voice_info['name'],
                     'provider' => 'Eleven Labs',
@@ -338,84 +269,557 @@ class HMG_AI_TTS_Service {
     
     /**
      * Generate audio for long text by chunking
+     *
+     * Chunks are synthesized concurrently, up to the configured number of
+     * parallel requests, and appended to a single MP3 file in order as soon
+     * as each one (and every chunk before it) has arrived. Chunk audio is
+     * buffered in temporary files, so memory use stays around one chunk.
+     *
+     * Each chunk's audio is also kept in a chunk cache, so regenerating an
+     * edited article only synthesizes the chunks whose text changed.
      */
     private function generate_long_audio($text, $options) {
+        $api_key = get_option('hmg_ai_elevenlabs_api_key');
+        
+        $key_error = $this->validate_api_key($api_key);
+        if ($key_error) {
+            return $key_error;
+        }
+        
+        $voice_id = $this->resolve_voice_id($options['voice']);
+        
         // Split text into manageable chunks
         $chunks = $this->split_text_into_chunks($text, 4500);
-        $audio_files = array();
-        $total_duration = array('seconds' => 0, 'formatted' => '00:00');
+        if (empty($chunks)) {
+            return array(
+                'error' => true,
+                'message' => __('Failed to generate audio chunks', 'hmg-ai-blog-enhancer')
+            );
+        }
+        
+        $target = $this->create_audio_file_path($options['post_id']);
+        $file = $target ? @fopen($target['path'], 'wb') : false;
+        if (!$file) {
+            return array(
+                'error' => true,
+                'message' => __('Failed to save audio file. Please check server permissions for wp-content/uploads/hmg-ai-audio/', 'hmg-ai-blog-enhancer')
+            );
+        }
         
+        // Reuse audio for chunks that were synthesized before with the same voice and settings
+        $cache_paths = array();
+        $cached_chunks = 0;
+        $synthesized_chars = 0;
         foreach ($chunks as $index => $chunk) {
-            // Add slight pause between chunks for natural flow
-            if ($index > 0) {
-                $chunk = ' ' . $chunk;
-            }
-            
-            $result = $this->generate_elevenlabs_tts($chunk, $options);
-            
-            if (isset($result['audio_url'])) {
-                $audio_files[] = $result['audio_url'];
-                $total_duration['seconds'] += $result['duration']['seconds'] ?? 0;
+            $cache_paths[$index] = $this->get_chunk_cache_path($chunk, $voice_id, $options);
+            if (empty($options['skip_cache']) && $this->is_chunk_cached($cache_paths[$index])) {
+                $cached_chunks++;
             } else {
-                // If any chunk fails, return error
-                return $result;
+                $synthesized_chars += strlen($chunk);
             }
         }
+        $api_calls = count($chunks) - $cached_chunks;
         
-        // Check if we have any audio files
-        if (empty($audio_files)) {
-            return array(
+        if (function_exists('curl_multi_init')) {
+            $result = $this->synthesize_chunks_concurrently($chunks, $voice_id, $options, $api_key, $file, $cache_paths);
+        } else {
+            $result = $this->synthesize_chunks_sequentially($chunks, $voice_id, $options, $api_key, $file, $cache_paths);
+        }
+        
+        fclose($file);
+        
+        clearstatcache(true, $target['path']);
+        if ($result !== true || !file_exists($target['path']) || filesize($target['path']) === 0) {
+            @unlink($target['path']);
+            return is_array($result) ? $result : array(
                 'error' => true,
-                'message' => __('Failed to generate audio chunks', 'hmg-ai-blog-enhancer')
+                'message' => __('No audio data received from Eleven Labs', 'hmg-ai-blog-enhancer')
             );
         }
         
-        // Format total duration
-        $total_duration['formatted'] = gmdate('i:s', $total_duration['seconds']);
+        @chmod($target['path'], 0644);
+        
+        $this->prune_chunk_cache();
+        
+        // Record usage for the characters that were actually synthesized
+        if ($api_calls > 0 && class_exists('HMG_AI_Auth_Service')) {
+            $auth_service = new HMG_AI_Auth_Service();
+            
+            $auth_service->record_usage(
+                $options['post_id'],
+                'audio',
+                $api_calls,
+                $synthesized_chars,
+                'elevenlabs'
+            );
+        }
         
         // Get voice info
         $available_voices = $this->get_available_voices();
-        $voice_info = isset($available_voices[$options['voice']]) ? $available_voices[$options['voice']] : array('name' => 'Unknown Voice');
+        $voice_info = isset($available_voices[$voice_id]) ? $available_voices[$voice_id] : array('name' => 'Unknown Voice');
         
-        // For now, return the first chunk with a note
-        // In the future, could merge audio files server-side
         // Important: Do NOT return 'success' => true as it causes issues with error checking
         return array(
-            'audio_url' => $audio_files[0],
-            'chunks' => $audio_files,
-            'total_chunks' => count($audio_files),
-            'duration' => $total_duration,
-            'message' => sprintf(__('Generated %d audio segments. Showing first segment.', 'hmg-ai-blog-enhancer'), count($audio_files)),
+            'audio_url' => $target['url'],
+            'total_chunks' => count($chunks),
+            'cached_chunks' => $cached_chunks,
+            'duration' => $this->estimate_duration($text),
             'voice' => $voice_info['name'],
-            'provider' => 'Eleven Labs'
+            'provider' => 'Eleven Labs',
+            'model' => 'eleven_multilingual_v2'
         );
     }
     
     /**
-     * Save audio file to WordPress uploads
+     * Synthesize chunks in parallel and append them to the file in order
+     *
+     * At most hmg_ai_tts_max_concurrency requests are in flight. When Eleven
+     * Labs answers 429 because too many requests are running, the chunk is
+     * retried after a backoff and the parallelism limit is lowered for the
+     * rest of the run.
+     *
+     * @return true|array True on success, error array otherwise
      */
-    private function save_audio_file($audio_data, $post_id = 0, $is_base64 = true) {
-        $upload_dir = wp_upload_dir();
+    private function synthesize_chunks_concurrently($chunks, $voice_id, $options, $api_key, $file, $cache_paths = array()) {
+        $max_parallel = max(1, (int) get_option('hmg_ai_tts_max_concurrency', 3));
+        $multi_handle = curl_multi_init();
+        $pending = array();
+        $retry_at = array();
+        $retries = array();
+        $in_flight = array();
+        $completed = array();
+        $next_index = 0;
+        $error = null;
+        
+        // Cached chunks are ready straight away; only the rest are requested
+        foreach (array_keys($chunks) as $index) {
+            $cached = empty($options['skip_cache']) ? $this->open_cached_chunk($cache_paths[$index] ?? null) : false;
+            if ($cached) {
+                $completed[$index] = $cached;
+            } else {
+                $pending[] = $index;
+            }
+        }
         
-        // Check if there's an error with the upload directory
+        while ($error === null && $next_index < count($chunks)) {
+            // Fill free slots with chunks that aren't waiting out a backoff
+            foreach ($pending as $position => $index) {
+                if (count($in_flight) >= $max_parallel) {
+                    break;
+                }
+                if (($retry_at[$index] ?? 0) > microtime(true)) {
+                    continue;
+                }
+                
+                $buffer = tmpfile();
+                if (!$buffer) {
+                    $error = array(
+                        'error' => true,
+                        'message' => __('Failed to create a temporary file for audio chunks.', 'hmg-ai-blog-enhancer')
+                    );
+                    break;
+                }
+                
+                unset($pending[$position]);
+                $handle = $this->create_tts_handle($chunks[$index], $voice_id, $options, $api_key, $buffer);
+                curl_multi_add_handle($multi_handle, $handle);
+                $in_flight[$index] = array('handle' => $handle, 'buffer' => $buffer);
+            }
+            
+            curl_multi_exec($multi_handle, $running);
+            
+            while ($error === null && ($info = curl_multi_info_read($multi_handle))) {
+                foreach ($in_flight as $index => $request) {
+                    if ($request['handle'] !== $info['handle']) {
+                        continue;
+                    }
+                    
+                    $response_code = (int) curl_getinfo($request['handle'], CURLINFO_HTTP_CODE);
+                    $curl_error = curl_error($request['handle']);
+                    curl_multi_remove_handle($multi_handle, $request['handle']);
+                    curl_close($request['handle']);
+                    unset($in_flight[$index]);
+                    
+                    if ($info['result'] !== CURLE_OK) {
+                        fclose($request['buffer']);
+                        error_log('HMG AI Eleven Labs Error: ' . $curl_error);
+                        $error = array(
+                            'error' => true,
+                            'message' => sprintf(__('Failed to generate audio with Eleven Labs: %s', 'hmg-ai-blog-enhancer'), $curl_error)
+                        );
+                        break;
+                    }
+                    
+                    if ($response_code !== 200) {
+                        rewind($request['buffer']);
+                        $body = stream_get_contents($request['buffer']);
+                        fclose($request['buffer']);
+                        
+                        // Too many concurrent requests: back off and send fewer at once
+                        if ($response_code === 429 && strpos($body, 'quota_exceeded') === false && ($retries[$index] ?? 0) < 3) {
+                            $retries[$index] = ($retries[$index] ?? 0) + 1;
+                            $retry_at[$index] = microtime(true) + pow(2, $retries[$index]);
+                            $max_parallel = max(1, $max_parallel - 1);
+                            $pending[] = $index;
+                            break;
+                        }
+                        
+                        $error = $this->get_api_error($response_code, $body);
+                        break;
+                    }
+                    
+                    if (!empty($cache_paths[$index])) {
+                        $this->store_cached_chunk($request['buffer'], $cache_paths[$index]);
+                    }
+                    
+                    $completed[$index] = $request['buffer'];
+                    break;
+                }
+            }
+            
+            // Append every chunk that is next in line
+            while ($error === null && isset($completed[$next_index])) {
+                rewind($completed[$next_index]);
+                if (stream_copy_to_stream($completed[$next_index], $file) === false) {
+                    $error = array(
+                        'error' => true,
+                        'message' => __('Failed to save audio file. Please check server permissions for wp-content/uploads/hmg-ai-audio/', 'hmg-ai-blog-enhancer')
+                    );
+                }
+                fclose($completed[$next_index]);
+                unset($completed[$next_index]);
+                $next_index++;
+            }
+            
+            if (!empty($in_flight)) {
+                if (curl_multi_select($multi_handle, 0.1) === -1) {
+                    usleep(10000);
+                }
+            } elseif ($error === null && $next_index < count($chunks)) {
+                // Everything left is waiting out a backoff
+                usleep(100000);
+            }
+        }
+        
+        foreach ($in_flight as $request) {
+            curl_multi_remove_handle($multi_handle, $request['handle']);
+            curl_close($request['handle']);
+            fclose($request['buffer']);
+        }
+        foreach ($completed as $buffer) {
+            fclose($buffer);
+        }
+        curl_multi_close($multi_handle);
+        
+        return $error ?? true;
+    }
+    
+    /**
+     * Synthesize chunks one at a time when curl_multi is not available
+     *
+     * @return true|array True on success, error array otherwise
+     */
+    private function synthesize_chunks_sequentially($chunks, $voice_id, $options, $api_key, $file, $cache_paths = array()) {
+        foreach ($chunks as $index => $chunk) {
+            $cached = empty($options['skip_cache']) ? $this->open_cached_chunk($cache_paths[$index] ?? null) : false;
+            if ($cached) {
+                stream_copy_to_stream($cached, $file);
+                fclose($cached);
+                continue;
+            }
+            
+            $response = wp_remote_post(
+                $this->api_base . '/text-to-speech/' . $voice_id,
+                array(
+                    'headers' => $this->get_tts_headers($api_key),
+                    'body' => json_encode($this->build_tts_request_data($chunk, $options)),
+                    'timeout' => 120,
+                    'sslverify' => false
+                )
+            );
+            
+            if (is_wp_error($response)) {
+                return array(
+                    'error' => true,
+                    'message' => sprintf(__('Failed to generate audio with Eleven Labs: %s', 'hmg-ai-blog-enhancer'), $response->get_error_message())
+                );
+            }
+            
+            $response_code = wp_remote_retrieve_response_code($response);
+            if ($response_code !== 200) {
+                return $this->get_api_error($response_code, wp_remote_retrieve_body($response));
+            }
+            
+            $audio_data = wp_remote_retrieve_body($response);
+            fwrite($file, $audio_data);
+            
+            if (!empty($cache_paths[$index]) && @file_put_contents($cache_paths[$index] . '.tmp', $audio_data)) {
+                @rename($cache_paths[$index] . '.tmp', $cache_paths[$index]);
+            }
+            unset($response, $audio_data);
+        }
+        
+        return true;
+    }
+    
+    /**
+     * Path of a chunk's cached audio
+     *
+     * The key covers the normalized chunk text, the voice and everything else
+     * sent to Eleven Labs (model, voice settings, output format).
+     *
+     * @return string|null Cache file path, or null if the cache directory is not writable
+     */
+    private function get_chunk_cache_path($chunk, $voice_id, $options) {
+        $upload_dir = wp_upload_dir();
         if (!empty($upload_dir['error'])) {
+            return null;
+        }
+        
+        $cache_dir = $upload_dir['basedir'] . '/hmg-ai-audio/chunks';
+        if (!file_exists($cache_dir) && !wp_mkdir_p($cache_dir)) {
+            return null;
+        }
+        
+        $request_data = $this->build_tts_request_data(trim(preg_replace('/\s+/', ' ', $chunk)), $options);
+        
+        return $cache_dir . '/' . md5($voice_id . '|' . wp_json_encode($request_data)) . '.mp3';
+    }
+    
+    /**
+     * Whether a chunk has usable cached audio
+     *
+     * Empty files (e.g. left by an interrupted write) don't count.
+     */
+    private function is_chunk_cached($path) {
+        return $path && file_exists($path) && filesize($path) > 0;
+    }
+    
+    /**
+     * Open a cached chunk for reading
+     *
+     * @return resource|false File handle, or false on a cache miss
+     */
+    private function open_cached_chunk($path) {
+        if (!$this->is_chunk_cached($path)) {
             return false;
         }
         
-        $audio_dir = $upload_dir['basedir'] . '/hmg-ai-audio';
+        // Keep recently used chunks from being pruned
+        @touch($path);
         
-        // Create directory if it doesn't exist
-        if (!file_exists($audio_dir)) {
-            if (!wp_mkdir_p($audio_dir)) {
-                return false;
+        return @fopen($path, 'rb');
+    }
+    
+    /**
+     * Copy a synthesized chunk from its buffer into the chunk cache
+     */
+    private function store_cached_chunk($buffer, $path) {
+        $cache_file = @fopen($path . '.tmp', 'wb');
+        if (!$cache_file) {
+            return;
+        }
+        
+        rewind($buffer);
+        $copied = stream_copy_to_stream($buffer, $cache_file);
+        fclose($cache_file);
+        
+        // Rename so a half-written file is never read as a cache hit
+        if ($copied) {
+            @rename($path . '.tmp', $path);
+        } else {
+            @unlink($path . '.tmp');
+        }
+    }
+    
+    /**
+     * Delete cached chunks that haven't been used for a while
+     *
+     * Runs at most once a day.
+     */
+    private function prune_chunk_cache() {
+        if (get_transient('hmg_ai_tts_chunk_cache_pruned')) {
+            return;
+        }
+        set_transient('hmg_ai_tts_chunk_cache_pruned', 1, DAY_IN_SECONDS);
+        
+        $upload_dir = wp_upload_dir();
+        $max_age = (int) get_option('hmg_ai_tts_chunk_cache_days', 30) * DAY_IN_SECONDS;
+        
+        foreach (glob($upload_dir['basedir'] . '/hmg-ai-audio/chunks/*.mp3*') ?: array() as $path) {
+            if (time() - filemtime($path) > $max_age) {
+                @unlink($path);
             }
-            // Set proper permissions
-            @chmod($audio_dir, 0755);
+        }
+    }
+    
+    /**
+     * Create a curl handle that writes one chunk's audio to a buffer file
+     */
+    private function create_tts_handle($text, $voice_id, $options, $api_key, $buffer) {
+        $headers = array();
+        foreach ($this->get_tts_headers($api_key) as $name => $value) {
+            $headers[] = $name . ': ' . $value;
         }
         
-        // Generate unique filename with microseconds for better uniqueness
-        $filename = 'elevenlabs-audio-' . ($post_id > 0 ? $post_id . '-' : '') . time() . '-' . substr(microtime(), 2, 6) . '.mp3';
-        $filepath = $audio_dir . '/' . $filename;
+        $handle = curl_init($this->api_base . '/text-to-speech/' . $voice_id);
+        curl_setopt_array($handle, array(
+            CURLOPT_POST => true,
+            CURLOPT_POSTFIELDS => json_encode($this->build_tts_request_data($text, $options)),
+            CURLOPT_HTTPHEADER => $headers,
+            CURLOPT_FILE => $buffer,
+            CURLOPT_TIMEOUT => 120,
+            CURLOPT_CONNECTTIMEOUT => 10,
+            CURLOPT_SSL_VERIFYPEER => false
+        ));
+        
+        return $handle;
+    }
+    
+    /**
+     * Validate the Eleven Labs API key
+     *
+     * @return array|null Error array, or null if the key looks valid
+     */
+    private function validate_api_key($api_key) {
+        if (!$api_key) {
+            return array(
+                'error' => true,
+                'message' => __('Eleven Labs API key not configured. Please add your API key in settings.', 'hmg-ai-blog-enhancer')
+            );
+        }
+        
+        // Validate API key format (should be at least 32 characters)
+        if (strlen($api_key) < 32) {
+            return array(
+                'error' => true,
+                'message' => __('Invalid Eleven Labs API key format. Please check your API key in settings.', 'hmg-ai-blog-enhancer')
+            );
+        }
+        
+        return null;
+    }
+    
+    /**
+     * Fall back to a known voice if the requested one isn't available
+     */
+    private function resolve_voice_id($voice_id) {
+        // Get available voices to validate
+        $available_voices = $this->get_available_voices();
+        
+        // Validate voice exists
+        if (!isset($available_voices[$voice_id])) {
+            // Use default voice if invalid
+            $voice_id = 'EXAVITQu4vr4xnSDxMaL'; // Sarah
+            // If default not available, use first available voice
+            if (!isset($available_voices[$voice_id]) && !empty($available_voices)) {
+                $voice_id = array_key_first($available_voices);
+            }
+        }
+        
+        return $voice_id;
+    }
+    
+    /**
+     * Request headers for the text-to-speech endpoint
+     */
+    private function get_tts_headers($api_key) {
+        return array(
+            'Accept' => 'audio/mpeg',
+            'Content-Type' => 'application/json',
+            'xi-api-key' => $api_key
+        );
+    }
+    
+    /**
+     * Request body for the text-to-speech endpoint
+     */
+    private function build_tts_request_data($text, $options) {
+        return array(
+            'text' => $text,
+            'model_id' => 'eleven_multilingual_v2', // Latest and best model
+            'voice_settings' => array(
+                'stability' => floatval($options['stability'] ?? 0.5),
+                'similarity_boost' => floatval($options['similarity_boost'] ?? 0.75),
+                'style' => floatval($options['style'] ?? 0.0),
+                'use_speaker_boost' => (bool)($options['speaker_boost'] ?? true)  // Fixed key name
+            ),
+            'output_format' => 'mp3_44100' // Standard MP3 format for better compatibility
+        );
+    }
+    
+    /**
+     * Turn an Eleven Labs error response into an error array
+     */
+    private function get_api_error($response_code, $body) {
+        $error_data = json_decode($body, true);
+        
+        error_log('HMG AI Eleven Labs API Error Response Code: ' . $response_code);
+        error_log('HMG AI Eleven Labs API Error Body: ' . $body);
+        error_log('HMG AI Eleven Labs API Error Data: ' . json_encode($error_data));
+        
+        // Handle specific error codes as per Eleven Labs documentation
+        if ($response_code === 401) {
+            return array(
+                'error' => true,
+                'message' => __('Authentication failed: Invalid Eleven Labs API key. Please check your settings.', 'hmg-ai-blog-enhancer')
+            );
+        } elseif ($response_code === 422) {
+            // Unprocessable Entity - typically invalid voice ID or model
+            $detail = isset($error_data['detail']) ? 
+                     (is_array($error_data['detail']) ? json_encode($error_data['detail']) : $error_data['detail']) : 
+                     'Invalid voice or model specified';
+            return array(
+                'error' => true,
+                'message' => sprintf(__('Invalid request: %s', 'hmg-ai-blog-enhancer'), $detail)
+            );
+        } elseif ($response_code === 429) {
+            // Rate limit or quota exceeded
+            return array(
+                'error' => true,
+                'message' => __('Eleven Labs quota exceeded or rate limit reached. Check your usage at elevenlabs.io/app/usage', 'hmg-ai-blog-enhancer')
+            );
+        } elseif ($response_code === 400) {
+            // Bad request - check for specific error types
+            $message = 'Bad request';
+            if (isset($error_data['detail'])) {
+                if (is_string($error_data['detail'])) {
+                    $message = $error_data['detail'];
+                } elseif (isset($error_data['detail']['message'])) {
+                    $message = $error_data['detail']['message'];
+                }
+            }
+            return array(
+                'error' => true,
+                'message' => sprintf(__('Request error: %s', 'hmg-ai-blog-enhancer'), $message)
+            );
+        } elseif ($response_code === 500 || $response_code === 503) {
+            // Server error or service unavailable
+            return array(
+                'error' => true,
+                'message' => __('Eleven Labs service is temporarily unavailable. Please try again in a few minutes.', 'hmg-ai-blog-enhancer')
+            );
+        }
+        
+        $message = isset($error_data['detail']) ? 
+                  (is_string($error_data['detail']) ? $error_data['detail'] : json_encode($error_data['detail'])) : 
+                  'Unknown error (Code: ' . $response_code . ')';
+                  
+        return array(
+            'error' => true,
+            'message' => sprintf(__('Eleven Labs API error: %s', 'hmg-ai-blog-enhancer'), $message)
+        );
+    }
+    
+    /**
+     * Save audio file to WordPress uploads
+     */
+    private function save_audio_file($audio_data, $post_id = 0, $is_base64 = true) {
+        $target = $this->create_audio_file_path($post_id);
+        if (!$target) {
+            return false;
+        }
+        $filepath = $target['path'];
         
         // Decode if base64, otherwise use raw data
         if ($is_base64) {
@@ -453,7 +857,40 @@ class HMG_AI_TTS_Service {
         }
         
         // Return URL
-        return $upload_dir['baseurl'] . '/hmg-ai-audio/' . $filename;
+        return $target['url'];
+    }
+    
+    /**
+     * Pick a new audio file path in the uploads directory
+     *
+     * @return array|false Array with path and url, or false if the directory is not writable
+     */
+    private function create_audio_file_path($post_id = 0) {
+        $upload_dir = wp_upload_dir();
+        
+        // Check if there's an error with the upload directory
+        if (!empty($upload_dir['error'])) {
+            return false;
+        }
+        
+        $audio_dir = $upload_dir['basedir'] . '/hmg-ai-audio';
+        
+        // Create directory if it doesn't exist
+        if (!file_exists($audio_dir)) {
+            if (!wp_mkdir_p($audio_dir)) {
+                return false;
+            }
+            // Set proper permissions
+            @chmod($audio_dir, 0755);
+        }
+        
+        // Generate unique filename with microseconds for better uniqueness
+        $filename = 'elevenlabs-audio-' . ($post_id > 0 ? $post_id . '-' : '') . time() . '-' . substr(microtime(), 2, 6) . '.mp3';
+        
+        return array(
+            'path' => $audio_dir . '/' . $filename,
+            'url' => $upload_dir['baseurl'] . '/hmg-ai-audio/' . $filename
+        );
     }
     
     /**
@@ -469,8 +906,11 @@ class HMG_AI_TTS_Service {
         // Remove shortcodes
         $text = strip_shortcodes($text);
         
-        // Clean up whitespace
-        $text = preg_replace('/\s+/', ' ', $text);
+        // Clean up whitespace, keeping paragraph breaks (chunk boundaries are anchored on them)
+        $text = preg_replace('/[^\S\n]+/', ' ', $text);
+        $text = preg_replace('/ *\n */', "\n", $text);
+        $text = preg_replace('/\n{2,}/', "\n\n", $text);
+        $text = preg_replace('/(?<!\n)\n(?!\n)/', ' ', $text);
         
         // Add natural pauses for better speech
         $text = preg_replace('/\. ([A-Z])/', '. $1', $text); // Ensure space after periods
@@ -489,11 +929,61 @@ class HMG_AI_TTS_Service {
     }
     
     /**
-     * Split text into chunks at sentence boundaries
+     * Split text into chunks at paragraph boundaries
+     *
+     * Whole paragraphs are packed into chunks of up to $max_length characters.
+     * A chunk also ends after any paragraph whose content hash is a multiple of
+     * four (once the chunk is a quarter full), so boundaries depend on the text
+     * itself rather than on everything before it: editing one paragraph changes
+     * its own chunk and at most the chunks up to the next such boundary, and
+     * the chunk cache covers the rest.
      */
     private function split_text_into_chunks($text, $max_length = 4500) {
         $chunks = array();
-        $sentences = preg_split('/(?<=[.!?])\s+/', $text);
+        $current_chunk = '';
+        
+        foreach (preg_split('/\n{2,}/', $text, -1, PREG_SPLIT_NO_EMPTY) as $paragraph) {
+            $paragraph = trim($paragraph);
+            if ($paragraph === '') {
+                continue;
+            }
+            
+            // Paragraphs longer than a chunk are split at sentence boundaries
+            $pieces = strlen($paragraph) > $max_length
+                ? $this->split_paragraph_into_sentences($paragraph, $max_length)
+                : array($paragraph);
+            
+            foreach ($pieces as $piece_index => $piece) {
+                $separator = $piece_index === 0 ? "\n\n" : ' ';
+                
+                if ($current_chunk !== '' && strlen($current_chunk) + strlen($separator) + strlen($piece) > $max_length) {
+                    $chunks[] = $current_chunk;
+                    $current_chunk = '';
+                }
+                
+                $current_chunk .= ($current_chunk !== '' ? $separator : '') . $piece;
+            }
+            
+            // Content-defined boundary
+            if (strlen($current_chunk) >= $max_length / 4 && crc32($paragraph) % 4 === 0) {
+                $chunks[] = $current_chunk;
+                $current_chunk = '';
+            }
+        }
+        
+        if ($current_chunk !== '') {
+            $chunks[] = $current_chunk;
+        }
+        
+        return $chunks;
+    }
+    
+    /**
+     * Split a long paragraph into pieces at sentence boundaries
+     */
+    private function split_paragraph_into_sentences($paragraph, $max_length) {
+        $chunks = array();
+        $sentences = preg_split('/(?<=[.!?])\s+/', $paragraph);
         $current_chunk = '';
         
         foreach ($sentences as $sentence) {
@@ -709,7 +1199,8 @@ class HMG_AI_TTS_Service {
     public function test_connection($provider = 'elevenlabs') {
         $test_text = 'Hello, this is a test of the Eleven Labs text to speech system.';
         $result = $this->generate_audio($test_text, array(
-            'voice' => 'EXAVITQu4vr4xnSDxMaL' // Use Sarah for test
+            'voice' => 'EXAVITQu4vr4xnSDxMaL', // Use Sarah for test
+            'skip_cache' => true // A cached clip would hide a revoked or over-quota key
         ));
         
         return !isset($result['error']);
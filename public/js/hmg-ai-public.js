@@ -921,15 +921,27 @@
         }
     };
 
+    // Expose for debugging and performance tests
+    window.HMGAIPublic = HMGAIPublic;
+
     /**
      * Initialize when document is ready
      */
     $(document).ready(function() {
+        // User Timing marks so initialization cost shows up in performance tools
+        const perf = window.performance && window.performance.mark ? window.performance : null;
+        if (perf) perf.mark('hmg-ai-public-init-start');
+
         HMGAIPublic.init();
         HMGAIPublic.initAudioPlayer();
         HMGAIPublic.initPrintOptimization();
         HMGAIPublic.initResponsiveBehavior();
         HMGAIPublic.initAnalytics();
+
+        if (perf) {
+            perf.mark('hmg-ai-public-init-end');
+            perf.measure('hmg-ai-public-init', 'hmg-ai-public-init-start', 'hmg-ai-public-init-end');
+        }
     });
 
 })(jQuery); 
\ No newline at end of file
@@ -10,13 +10,23 @@ import sys
 import subprocess
 import time
 import argparse
+import heapq
+import html
+import json
+import re
 from pathlib import Path
 
+GRID_STATUS_URL = 'http://localhost:4444/status'
+SHORTCODE_TESTS = 'tests/visual/test_shortcode_visual.py'
+REPORTS_DIR = 'tests/reports'
+DURATIONS_FILE = 'tests/reports/test_durations.json'
+SHORTCODE_REPORT = 'tests/reports/shortcode_visual_report.html'
+
 def check_selenium_grid():
     """Check if Selenium Grid is running"""
     try:
         import requests
-        response = requests.get('http://localhost:4444/status', timeout=5)
+        response = requests.get(GRID_STATUS_URL, timeout=5)
         if response.status_code == 200:
             print("✅ Selenium Grid is running")
             return True
@@ -65,34 +75,262 @@ def setup_test_environment():
     
     print("✅ Environment variables set")
 
-def run_visual_tests(test_filter=None, verbose=False):
+def get_grid_free_slots(browser_name='chrome'):
+    """Count idle grid slots for browser_name from the hub's /status endpoint"""
+    try:
+        import requests
+        response = requests.get(GRID_STATUS_URL, timeout=5)
+        nodes = response.json().get('value', {}).get('nodes', [])
+    except Exception:
+        return 0
+    
+    free_slots = 0
+    for node in nodes:
+        if node.get('availability', 'UP') != 'UP':
+            continue
+        
+        for slot in node.get('slots', []):
+            stereotype = slot.get('stereotype', {})
+            if slot.get('session') is None and stereotype.get('browserName') == browser_name:
+                free_slots += 1
+    
+    return free_slots
+
+def parse_parallel(value):
+    """argparse type for --parallel: "auto" or a positive worker count"""
+    if value == 'auto':
+        return value
+    
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    
+    if workers < 1:
+        raise argparse.ArgumentTypeError(f'expected "auto" or a positive integer, got {value!r}')
+    
+    return workers
+
+def resolve_worker_count(parallel, test_count):
+    """Turn the --parallel value into a worker count bounded by the number of tests"""
+    if not parallel:
+        return 1
+    
+    if parallel == 'auto':
+        workers = get_grid_free_slots()
+        print(f"🔍 Selenium Grid reports {workers} free Chrome slot(s)")
+    else:
+        workers = int(parallel)
+    
+    return max(1, min(workers, test_count))
+
+def collect_test_ids(test_filter=None):
+    """Collect shortcode test node ids without running them"""
+    cmd = ['python', '-m', 'pytest', SHORTCODE_TESTS, '--collect-only', '-q']
+    if test_filter:
+        cmd.extend(['-k', test_filter])
+    
+    result = subprocess.run(cmd, cwd=os.getcwd(), capture_output=True, text=True, check=False)
+    return [line.strip() for line in result.stdout.splitlines() if '::' in line]
+
+def load_durations():
+    """Load recorded per-test durations from previous runs"""
+    try:
+        with open(DURATIONS_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def record_durations(run_files):
+    """Merge the durations written by test runs into DURATIONS_FILE"""
+    durations = load_durations()
+    
+    for path in run_files:
+        try:
+            with open(path) as f:
+                durations.update(json.load(f))
+        except (OSError, ValueError):
+            continue
+        os.remove(path)
+    
+    Path(REPORTS_DIR).mkdir(parents=True, exist_ok=True)
+    with open(DURATIONS_FILE, 'w') as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+
+def shard_tests(test_ids, durations, workers):
+    """Split tests into balanced shards, longest tests first
+
+    Greedy longest-processing-time scheduling: each test, from slowest to
+    fastest, goes to the shard with the least total recorded time. Tests
+    without a recorded duration are assumed to take the average.
+    """
+    known = [durations[test_id] for test_id in test_ids if test_id in durations]
+    default = sum(known) / len(known) if known else 1.0
+    
+    ordered = sorted(test_ids, key=lambda test_id: durations.get(test_id, default), reverse=True)
+    
+    shards = [[] for _ in range(workers)]
+    heap = [(0.0, index) for index in range(workers)]
+    for test_id in ordered:
+        total, index = heapq.heappop(heap)
+        shards[index].append(test_id)
+        heapq.heappush(heap, (total + durations.get(test_id, default), index))
+    
+    return [shard for shard in shards if shard]
+
+def merge_html_reports(report_paths, output_path, elapsed):
+    """Merge per-worker pytest-html reports into a single report
+
+    pytest-html 4 keeps every result in a JSON blob on #data-container, so the
+    blobs are merged into the first report and its summary counts updated.
+    Falls back to an index page linking the worker reports.
+    """
+    blob_pattern = re.compile(r'data-jsonblob="([^"]*)"')
+    base_html = None
+    merged = None
+    
+    for path in report_paths:
+        if not os.path.exists(path):
+            continue
+        
+        with open(path, encoding='utf-8') as f:
+            report_html = f.read()
+        
+        match = blob_pattern.search(report_html)
+        if not match:
+            continue
+        
+        blob = json.loads(html.unescape(match.group(1)))
+        if merged is None:
+            base_html, merged = report_html, blob
+        else:
+            merged.setdefault('tests', {}).update(blob.get('tests', {}))
+    
+    if merged is None:
+        links = ''.join(
+            f'<li><a href="{os.path.basename(path)}">{os.path.basename(path)}</a></li>'
+            for path in report_paths if os.path.exists(path)
+        )
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(f"<!DOCTYPE html><html><body><h1>Shortcode Visual Test Reports</h1><ul>{links}</ul></body></html>")
+        return
+    
+    outcomes = {}
+    for results in merged.get('tests', {}).values():
+        for result in results:
+            outcome = str(result.get('result', '')).lower()
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    
+    test_count = len(merged.get('tests', {}))
+    merged_json = html.escape(json.dumps(merged), quote=True)
+    merged_html = blob_pattern.sub(lambda m: f'data-jsonblob="{merged_json}"', base_html, count=1)
+    merged_html = re.sub(
+        r'(<p class="run-count">)[^<]*(</p>)',
+        lambda m: f"{m.group(1)}{test_count} tests took {time.strftime('%H:%M:%S', time.gmtime(elapsed))}.{m.group(2)}",
+        merged_html
+    )
+    merged_html = re.sub(
+        r'(<span class="(passed|failed|skipped|xfailed|xpassed|error|rerun)">)\d+',
+        lambda m: f"{m.group(1)}{outcomes.get(m.group(2), 0)}",
+        merged_html
+    )
+    
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(merged_html)
+
+def run_visual_tests(test_filter=None, verbose=False, parallel=None):
     """Run visual tests"""
     print("🧪 Running shortcode visual tests...")
     
     # Build pytest command
     cmd = [
         'python', '-m', 'pytest',
-        'tests/visual/test_shortcode_visual.py',
+        SHORTCODE_TESTS,
         '-v' if verbose else '-q',
         '--tb=short',
         '--capture=no' if verbose else '--capture=sys'
     ]
     
+    if parallel:
+        test_ids = collect_test_ids(test_filter)
+        workers = resolve_worker_count(parallel, len(test_ids))
+        if workers > 1:
+            return run_sharded_tests(cmd, test_ids, workers)
+    
     if test_filter:
         cmd.extend(['-k', test_filter])
     
     # Add HTML report
-    cmd.extend(['--html=tests/reports/shortcode_visual_report.html', '--self-contained-html'])
+    cmd.extend([f'--html={SHORTCODE_REPORT}', '--self-contained-html'])
     
     print(f"Running: {' '.join(cmd)}")
     
+    env = dict(os.environ, HMG_TEST_DURATIONS=os.path.join(REPORTS_DIR, 'durations_serial.json'))
+    
     try:
-        result = subprocess.run(cmd, cwd=os.getcwd(), check=False)
+        result = subprocess.run(cmd, cwd=os.getcwd(), env=env, check=False)
+        record_durations([env['HMG_TEST_DURATIONS']])
         return result.returncode == 0
     except Exception as e:
         print(f"❌ Error running tests: {e}")
         return False
 
+def run_sharded_tests(cmd, test_ids, workers):
+    """Run test shards as parallel pytest processes and merge their reports"""
+    shards = shard_tests(test_ids, load_durations(), workers)
+    print(f"⚡ Running {len(test_ids)} tests across {len(shards)} workers")
+    
+    Path(REPORTS_DIR).mkdir(parents=True, exist_ok=True)
+    start = time.time()
+    processes = []
+    
+    for index, shard in enumerate(shards):
+        report_path = os.path.join(REPORTS_DIR, f'shortcode_visual_report_w{index}.html')
+        durations_path = os.path.join(REPORTS_DIR, f'durations_w{index}.json')
+        log_path = os.path.join(REPORTS_DIR, f'shortcode_visual_w{index}.log')
+        
+        worker_cmd = cmd + shard + [f'--html={report_path}', '--self-contained-html']
+        env = dict(os.environ, HMG_TEST_DURATIONS=durations_path)
+        
+        log_file = open(log_path, 'w')
+        process = subprocess.Popen(worker_cmd, cwd=os.getcwd(), env=env, stdout=log_file, stderr=subprocess.STDOUT)
+        processes.append((index, process, log_file, log_path, report_path, durations_path))
+        print(f"   Worker {index}: {len(shard)} tests → {log_path}")
+    
+    success = True
+    for index, process, log_file, log_path, report_path, durations_path in processes:
+        returncode = process.wait()
+        log_file.close()
+        success = success and returncode == 0
+        
+        with open(log_path) as f:
+            lines = [line.strip() for line in f if line.strip()]
+        print(f"{'✅' if returncode == 0 else '❌'} Worker {index}: {lines[-1] if lines else 'no output'}")
+    
+    elapsed = time.time() - start
+    record_durations([entry[5] for entry in processes])
+    merge_html_reports([entry[4] for entry in processes], SHORTCODE_REPORT, elapsed)
+    
+    for entry in processes:
+        if os.path.exists(entry[4]):
+            os.remove(entry[4])
+    
+    print(f"⏱️  Parallel run finished in {elapsed:.1f}s")
+    return success
+
+def approve_baselines(pattern=None):
+    """Promote the latest captures in tests/screenshots/current to baselines"""
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'visual', 'utils'))
+    from baseline_store import BaselineStore
+    
+    store = BaselineStore('tests/screenshots/baseline', 'tests/screenshots/current')
+    approved = store.approve(pattern)
+    
+    for key in approved:
+        print(f"✅ Approved: {key}")
+    print(f"📸 {len(approved)} baseline(s) updated")
+    return approved
+
 def generate_visual_report():
     """Generate visual comparison report"""
     print("📊 Generating visual comparison report...")
@@ -191,6 +429,12 @@ def generate_visual_report():
             
             <p>To run with verbose output:</p>
             <pre><code>python run_shortcode_tests.py --verbose</code></pre>
+            
+            <p>To accept the latest captures as the new baselines:</p>
+            <pre><code>python run_shortcode_tests.py --approve [PATTERN]</code></pre>
+            
+            <p>To run in parallel across free Selenium Grid slots:</p>
+            <pre><code>python run_shortcode_tests.py --parallel auto</code></pre>
         </div>
     </body>
     </html>
@@ -211,9 +455,19 @@ def main():
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--skip-checks', action='store_true', help='Skip environment checks')
     parser.add_argument('--report-only', action='store_true', help='Generate report only')
+    parser.add_argument('--parallel', metavar='N|auto', type=parse_parallel,
+                        help='Run tests in N parallel workers, or "auto" to use the free Chrome slots on the grid')
+    parser.add_argument('--wordpress', action='store_true',
+                        help='Run against the live WordPress install, including integration tests')
+    parser.add_argument('--approve', nargs='?', const='', metavar='PATTERN',
+                        help='Approve current captures as baselines (optionally only keys containing PATTERN)')
     
     args = parser.parse_args()
     
+    if args.approve is not None:
+        approve_baselines(args.approve or None)
+        return 0
+    
     if args.report_only:
         generate_visual_report()
         return
@@ -230,20 +484,21 @@ def main():
             print("   docker run -d -p 4444:4444 --shm-size=2g selenium/standalone-chrome:latest")
             return 1
         
-        if not check_wordpress():
+        if args.wordpress and not check_wordpress():
             print("\n💡 To start WordPress:")
             print("   docker-compose up -d wordpress")
             return 1
     
     # Setup
     setup_test_environment()
+    os.environ['HMG_TEST_TARGET'] = 'wordpress' if args.wordpress else 'fixtures'
     
     # Run tests
     test_filter = args.filter if args.filter else None
     if args.all:
         test_filter = None
     
-    success = run_visual_tests(test_filter, args.verbose)
+    success = run_visual_tests(test_filter, args.verbose, args.parallel)
     
     # Generate report
     generate_visual_report()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+HMG AI Blog Enhancer - Generation AJAX Load Driver
+
+Logs in to WordPress once, then fires open-loop traffic at the admin-ajax
+generation actions used by admin/js/hmg-ai-admin.js (hmg_generate_takeaways,
+hmg_generate_faq, hmg_generate_toc, hmg_generate_audio) and reports
+throughput, latency percentiles and the error mix per content type.
+
+Arrivals follow a Poisson process at --rate requests per second regardless of
+how fast responses come back, the way independent editors pressing "Generate"
+behave. Run it against the local WordPress container with the stand-in AI
+backend (tests/standin/ai_provider_server.py) to avoid paid API calls:
+
+    python tests/load/ajax_generation_load.py --rate 2 --duration 60 --post-id 10 \\
+        --standin-url http://localhost:8090
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import sys
+import time
+
+import aiohttp
+
+CONTENT_TYPES = ('takeaways', 'faq', 'toc', 'audio')
+
+SAMPLE_PARAGRAPH = (
+    "Recruiting teams that publish consistently attract more qualified candidates. "
+    "AI-assisted drafting, summaries and FAQs help marketers keep a steady cadence "
+    "while editors keep control of tone, accuracy and brand voice. "
+)
+
+NONCE_PATTERN = re.compile(r'hmg_ai_ajax\s*=\s*\{.*?"nonce":"([0-9a-f]+)"', re.S)
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return round(ordered[index], 1)
+
+
+def parse_mix(value):
+    """'takeaways=3,faq=2,toc=1' -> {'takeaways': 3.0, ...}"""
+    mix = {}
+    for part in filter(None, value.split(',')):
+        content_type, _, weight = part.partition('=')
+        if content_type not in CONTENT_TYPES:
+            raise argparse.ArgumentTypeError(f"Unknown content type: {content_type}")
+        mix[content_type] = float(weight or 1)
+    return mix
+
+
+def classify_error(message):
+    """Group plugin error messages so the mix stays readable"""
+    lowered = (message or '').lower()
+    for needle, label in (('rate limit', 'rate_limited'), ('quota', 'rate_limited'), ('timed out', 'timeout'),
+                          ('timeout', 'timeout'), ('security check', 'nonce'), ('permission', 'permissions'),
+                          ('limit', 'usage_limit'), ('format', 'malformed_response')):
+        if needle in lowered:
+            return f"app:{label}"
+    return 'app:other'
+
+
+class GenerationLoadTest:
+    """Open-loop load against the generation actions with one logged-in session"""
+
+    def __init__(self, args):
+        self.args = args
+        self.base_url = args.wordpress_url.rstrip('/')
+        self.rng = random.Random(args.seed)
+        self.results = {content_type: [] for content_type in args.mix}
+        self.skipped = 0
+        self.in_flight = 0
+
+    async def login(self, session):
+        """Log in once; the session's cookie jar carries the auth cookies for every request"""
+        login_url = f"{self.base_url}/wp-login.php"
+        # wp-login.php refuses logins unless its test cookie was set first
+        async with session.get(login_url) as response:
+            await response.read()
+
+        form = {
+            'log': self.args.user,
+            'pwd': self.args.password,
+            'wp-submit': 'Log In',
+            'redirect_to': f"{self.base_url}/wp-admin/",
+            'testcookie': '1'
+        }
+        async with session.post(login_url, data=form) as response:
+            await response.read()
+
+        if not any(cookie.key.startswith('wordpress_logged_in') for cookie in session.cookie_jar):
+            raise RuntimeError(f"Login failed for {self.args.user} at {login_url}")
+
+    async def fetch_nonce(self, session):
+        """Read the hmg-ai-ajax-nonce the admin script is localized with"""
+        edit_url = f"{self.base_url}/wp-admin/post.php?post={self.args.post_id}&action=edit"
+        async with session.get(edit_url) as response:
+            page = await response.text()
+
+        match = NONCE_PATTERN.search(page)
+        if not match:
+            raise RuntimeError(f"No hmg_ai_ajax nonce found on {edit_url}; is the plugin active?")
+        return match.group(1)
+
+    def request_data(self, content_type, nonce, sequence):
+        content = SAMPLE_PARAGRAPH * self.args.paragraphs
+        if self.args.unique_content:
+            # Defeat content caching so every request reaches the AI backend
+            content += f" Load test request {sequence}."
+
+        data = {
+            'action': f"hmg_generate_{content_type}",
+            'nonce': nonce,
+            'content': content,
+            'post_id': str(self.args.post_id)
+        }
+        if content_type == 'audio':
+            data['voice'] = self.args.voice
+        else:
+            data['provider'] = self.args.provider
+        return data
+
+    async def fire(self, session, content_type, nonce, sequence):
+        started = time.monotonic()
+        outcome = 'ok'
+        try:
+            async with session.post(f"{self.base_url}/wp-admin/admin-ajax.php",
+                                    data=self.request_data(content_type, nonce, sequence)) as response:
+                body = await response.text()
+
+            if response.status != 200:
+                outcome = f"http:{response.status}"
+            else:
+                try:
+                    payload = json.loads(body)
+                except ValueError:
+                    # PHP notices or a fatal error page instead of JSON
+                    outcome = 'invalid_json'
+                else:
+                    if not payload.get('success'):
+                        data = payload.get('data')
+                        message = data.get('message') if isinstance(data, dict) else data
+                        outcome = classify_error(message if isinstance(message, str) else '')
+        except asyncio.TimeoutError:
+            outcome = 'client_timeout'
+        except aiohttp.ClientError as e:
+            outcome = f"connection:{type(e).__name__}"
+        finally:
+            self.in_flight -= 1
+
+        self.results[content_type].append((outcome, (time.monotonic() - started) * 1000))
+
+    async def run(self):
+        timeout = aiohttp.ClientTimeout(total=self.args.timeout)
+        connector = aiohttp.TCPConnector(limit=self.args.max_in_flight)
+
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            await self.login(session)
+            nonce = await self.fetch_nonce(session)
+            print(f"✅ Logged in as {self.args.user}, nonce {nonce}")
+
+            if self.args.standin_url:
+                await self.standin(session, 'POST', '/_control/reset')
+
+            types = list(self.args.mix)
+            weights = [self.args.mix[content_type] for content_type in types]
+            tasks = []
+            started = time.monotonic()
+            deadline = started + self.args.duration
+            next_arrival = started
+            sequence = 0
+
+            print(f"🚀 {self.args.rate:g} req/s for {self.args.duration:g}s, mix {self.args.mix}")
+            while True:
+                next_arrival += self.rng.expovariate(self.args.rate)
+                if next_arrival >= deadline:
+                    break
+                await asyncio.sleep(max(0.0, next_arrival - time.monotonic()))
+
+                if self.in_flight >= self.args.max_in_flight:
+                    # Open loop: an arrival that can't be sent is counted, not delayed
+                    self.skipped += 1
+                    continue
+
+                sequence += 1
+                self.in_flight += 1
+                content_type = self.rng.choices(types, weights)[0]
+                tasks.append(asyncio.create_task(self.fire(session, content_type, nonce, sequence)))
+
+            await asyncio.gather(*tasks)
+            elapsed = time.monotonic() - started
+
+            standin_stats = None
+            if self.args.standin_url:
+                standin_stats = await self.standin(session, 'GET', '/_control/stats')
+
+        return self.report(elapsed, standin_stats)
+
+    async def standin(self, session, method, path):
+        try:
+            async with session.request(method, self.args.standin_url.rstrip('/') + path) as response:
+                return await response.json()
+        except (aiohttp.ClientError, ValueError) as e:
+            print(f"⚠️  Stand-in server not reachable: {e}")
+            return None
+
+    def report(self, elapsed, standin_stats):
+        report = {'elapsed_seconds': round(elapsed, 1), 'skipped_arrivals': self.skipped, 'content_types': {}}
+
+        for content_type, samples in self.results.items():
+            latencies = [latency for _, latency in samples]
+            ok_latencies = [latency for outcome, latency in samples if outcome == 'ok']
+            outcomes = {}
+            for outcome, _ in samples:
+                outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+            report['content_types'][content_type] = {
+                'requests': len(samples),
+                'succeeded': outcomes.get('ok', 0),
+                'throughput_rps': round(outcomes.get('ok', 0) / elapsed, 2) if elapsed else 0.0,
+                'p50_ms': percentile(latencies, 0.50),
+                'p95_ms': percentile(latencies, 0.95),
+                'p99_ms': percentile(latencies, 0.99),
+                'success_p95_ms': percentile(ok_latencies, 0.95),
+                'outcomes': outcomes
+            }
+
+        if standin_stats is not None:
+            report['standin'] = standin_stats
+        return report
+
+
+def print_report(report):
+    print("\n📊 Generation load results")
+    print("=" * 96)
+    print(f"{'Type':<11}{'Requests':>9}{'OK':>6}{'OK/s':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}  Outcomes")
+    print("-" * 96)
+    for content_type, stats in report['content_types'].items():
+        outcomes = ', '.join(f"{name}={count}" for name, count in sorted(stats['outcomes'].items()))
+        print(f"{content_type:<11}{stats['requests']:>9}{stats['succeeded']:>6}{stats['throughput_rps']:>7}"
+              f"{stats['p50_ms'] or '-':>10}{stats['p95_ms'] or '-':>10}{stats['p99_ms'] or '-':>10}  {outcomes}")
+    print("-" * 96)
+    print(f"Elapsed {report['elapsed_seconds']}s, skipped arrivals (max in flight reached): {report['skipped_arrivals']}")
+
+    for provider, stats in (report.get('standin') or {}).items():
+        if stats['requests']:
+            print(f"   stand-in {provider}: {stats['requests']} requests, p95 {stats['p95_ms']}ms, {stats['outcomes']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Open-loop load test for the HMG AI generation AJAX actions')
+    parser.add_argument('--wordpress-url', default='http://localhost:8085', help='WordPress base URL')
+    parser.add_argument('--user', default='admin', help='WordPress user with edit_posts')
+    parser.add_argument('--password', default='admin123', help='Password for --user')
+    parser.add_argument('--post-id', type=int, required=True, help='Post whose edit screen provides the nonce')
+    parser.add_argument('--rate', type=float, default=1.0, help='Mean arrivals per second (Poisson)')
+    parser.add_argument('--duration', type=float, default=60.0, help='Seconds to generate arrivals for')
+    parser.add_argument('--mix', type=parse_mix, default=parse_mix('takeaways=1,faq=1,toc=1'),
+                        help='Weighted content types, e.g. takeaways=3,faq=2,toc=1,audio=1')
+    parser.add_argument('--provider', default='auto', help='Provider sent with text generation requests')
+    parser.add_argument('--voice', default='EXAVITQu4vr4xnSDxMaL', help='Voice sent with audio requests')
+    parser.add_argument('--paragraphs', type=int, default=20, help='Size of the submitted post content')
+    parser.add_argument('--unique-content', action='store_true', help='Make every request body unique (no cache hits)')
+    parser.add_argument('--max-in-flight', type=int, default=200, help='Safety cap on concurrent requests')
+    parser.add_argument('--timeout', type=float, default=180.0, help='Client timeout per request in seconds')
+    parser.add_argument('--seed', type=int, help='Seed for arrivals and the content-type mix')
+    parser.add_argument('--standin-url', help='Stand-in AI server to reset before and read stats from after')
+    parser.add_argument('--json', metavar='PATH', help='Also write the report as JSON')
+
+    args = parser.parse_args()
+
+    try:
+        report = asyncio.run(GenerationLoadTest(args).run())
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"✅ Report written to {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+HMG AI Blog Enhancer - Stand-in AI Provider Server
+
+Mimics the Claude, OpenAI, Gemini and ElevenLabs HTTP APIs used by the plugin's
+services, with configurable latency and fault injection, so provider fallback
+and generation latency can be measured offline without paid API calls.
+
+Point the plugin at it with environment variables in the WordPress container:
+
+    HMG_AI_CLAUDE_BASE_URL=http://ai-standin:8090/claude/v1
+    HMG_AI_OPENAI_BASE_URL=http://ai-standin:8090/openai/v1
+    HMG_AI_GEMINI_BASE_URL=http://ai-standin:8090/gemini/v1beta
+    HMG_AI_ELEVENLABS_BASE_URL=http://ai-standin:8090/elevenlabs/v1
+
+Profiles can be changed while running through the control endpoints:
+
+    GET  /_control/profiles             current profile per provider
+    PUT  /_control/profiles/<provider>  merge JSON settings into a profile
+    GET  /_control/stats                request counts, outcomes and latency percentiles
+    POST /_control/reset                clear stats
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import sys
+import time
+from urllib.parse import urlsplit
+
+PROVIDERS = ('claude', 'openai', 'gemini', 'elevenlabs')
+
+# Settings every provider profile understands. Fault rates are probabilities
+# per request and are drawn in the order listed in FAULTS.
+DEFAULT_PROFILE = {
+    'latency': 'lognormal:800:0.4',
+    'rate_limit': 0.0,
+    'server_error': 0.0,
+    'timeout': 0.0,
+    'malformed': 0.0,
+    # How long a "timeout" request hangs before the connection is dropped;
+    # longer than the plugin's own request timeouts
+    'hang_seconds': 130.0,
+    'retry_after': 20
+}
+
+FAULTS = ('rate_limit', 'server_error', 'timeout', 'malformed')
+
+# Latency per 1,000 characters of generated audio, on top of the base latency
+TTS_MS_PER_1K_CHARS = 400
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 429: 'Too Many Requests',
+               500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+# One silent MPEG-1 Layer III frame (128 kbps, 44.1 kHz, 417 bytes, ~26 ms)
+MP3_FRAME = bytes([0xFF, 0xFB, 0x90, 0x64]) + bytes(413)
+
+
+def parse_latency(spec):
+    """Turn 'fixed:MS', 'uniform:LO:HI', 'normal:MEAN:SD' or 'lognormal:MEDIAN:SIGMA' into a sampler (ms)"""
+    kind, *values = spec.split(':')
+    values = [float(value) for value in values]
+
+    if kind == 'fixed':
+        return lambda rng: values[0]
+    if kind == 'uniform':
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == 'normal':
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1]))
+    if kind == 'lognormal':
+        mu = math.log(values[0])
+        return lambda rng: rng.lognormvariate(mu, values[1])
+
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return round(ordered[index], 1)
+
+
+class ProviderStandin:
+    """Routes requests to provider handlers and applies each provider's profile"""
+
+    def __init__(self, profiles=None, seed=None):
+        self.rng = random.Random(seed)
+        self.profiles = {provider: dict(DEFAULT_PROFILE) for provider in PROVIDERS}
+        for provider, settings in (profiles or {}).items():
+            self.update_profile(provider, settings)
+        self.reset_stats()
+
+    def update_profile(self, provider, settings):
+        if provider not in self.profiles:
+            raise ValueError(f"Unknown provider: {provider}")
+
+        profile = dict(self.profiles[provider], **settings)
+        parse_latency(profile['latency'])
+        self.profiles[provider] = profile
+        return profile
+
+    def reset_stats(self):
+        self.stats = {provider: {'requests': 0, 'outcomes': {}, 'latencies_ms': []} for provider in PROVIDERS}
+
+    def stats_report(self):
+        report = {}
+        for provider, stats in self.stats.items():
+            latencies = stats['latencies_ms']
+            report[provider] = {
+                'requests': stats['requests'],
+                'outcomes': dict(stats['outcomes']),
+                'p50_ms': percentile(latencies, 0.50),
+                'p95_ms': percentile(latencies, 0.95),
+                'p99_ms': percentile(latencies, 0.99)
+            }
+        return report
+
+    async def handle(self, method, path, query, headers, body):
+        """Return (status, headers, body) for one request, or None to drop the connection"""
+        if path.startswith('/_control/'):
+            return self.control(method, path, body)
+
+        route = self.route(method, path)
+        if route is None:
+            return self.json_response(404, {'error': {'message': f"No stand-in route for {method} {path}"}})
+
+        provider, handler = route
+        profile = self.profiles[provider]
+        stats = self.stats[provider]
+        stats['requests'] += 1
+        started = time.monotonic()
+
+        fault = self.draw_fault(profile)
+        delay_ms = parse_latency(profile['latency'])(self.rng)
+        try:
+            payload = json.loads(body or b'{}')
+        except ValueError:
+            payload = {}
+
+        if handler == self.elevenlabs_tts and fault is None:
+            delay_ms += TTS_MS_PER_1K_CHARS * len(payload.get('text', '')) / 1000
+
+        if fault == 'timeout':
+            self.record(stats, 'timeout', None)
+            await asyncio.sleep(float(profile['hang_seconds']))
+            return None
+
+        await asyncio.sleep(delay_ms / 1000)
+
+        if fault == 'rate_limit':
+            response = self.error_response(provider, 429, 'Rate limit exceeded (stand-in)')
+            response[1]['Retry-After'] = str(profile['retry_after'])
+        elif fault == 'server_error':
+            response = self.error_response(provider, self.rng.choice((500, 503)), 'Overloaded (stand-in)')
+        elif fault == 'malformed':
+            response = self.malformed_response()
+        else:
+            response = handler(payload, path, query)
+
+        self.record(stats, fault or 'ok', started)
+        return response
+
+    def route(self, method, path):
+        if method == 'POST' and path == '/claude/v1/messages':
+            return 'claude', self.claude_messages
+        if method == 'POST' and path == '/openai/v1/chat/completions':
+            return 'openai', self.openai_chat
+        if method == 'POST' and re.fullmatch(r'/gemini/v1beta/models/[^/:]+:generateContent', path):
+            return 'gemini', self.gemini_generate
+        if method == 'POST' and path.startswith('/elevenlabs/v1/text-to-speech/'):
+            return 'elevenlabs', self.elevenlabs_tts
+        if method == 'GET' and path == '/elevenlabs/v1/voices':
+            return 'elevenlabs', self.elevenlabs_voices
+        return None
+
+    def draw_fault(self, profile):
+        roll = self.rng.random()
+        for fault in FAULTS:
+            rate = float(profile[fault])
+            if roll < rate:
+                return fault
+            roll -= rate
+        return None
+
+    def record(self, stats, outcome, started):
+        stats['outcomes'][outcome] = stats['outcomes'].get(outcome, 0) + 1
+        # Dropped (timeout) requests have no response latency to report
+        if started is not None:
+            stats['latencies_ms'].append((time.monotonic() - started) * 1000)
+
+    def control(self, method, path, body):
+        if method == 'GET' and path == '/_control/stats':
+            return self.json_response(200, self.stats_report())
+        if method == 'POST' and path == '/_control/reset':
+            self.reset_stats()
+            return self.json_response(200, {'reset': True})
+        if method == 'GET' and path == '/_control/profiles':
+            return self.json_response(200, self.profiles)
+
+        match = re.fullmatch(r'/_control/profiles/(\w+)', path)
+        if method == 'PUT' and match:
+            try:
+                profile = self.update_profile(match.group(1), json.loads(body or b'{}'))
+            except ValueError as e:
+                return self.json_response(400, {'error': str(e)})
+            return self.json_response(200, profile)
+
+        return self.json_response(404, {'error': f"Unknown control endpoint {method} {path}"})
+
+    # Provider responses, shaped the way the plugin's services parse them
+
+    def claude_messages(self, payload, path, query):
+        prompt = ' '.join(message.get('content', '') for message in payload.get('messages', [])
+                          if isinstance(message.get('content'), str))
+        text = generated_text(prompt)
+        return self.json_response(200, {
+            'id': f"msg_standin_{self.rng.randrange(10 ** 8)}",
+            'type': 'message',
+            'role': 'assistant',
+            'model': payload.get('model', 'claude-standin'),
+            'content': [{'type': 'text', 'text': text}],
+            'stop_reason': 'end_turn',
+            'usage': {'input_tokens': token_estimate(prompt), 'output_tokens': token_estimate(text)}
+        })
+
+    def openai_chat(self, payload, path, query):
+        prompt = ' '.join(message.get('content', '') for message in payload.get('messages', []))
+        text = generated_text(prompt)
+        usage = {'prompt_tokens': token_estimate(prompt), 'completion_tokens': token_estimate(text)}
+        usage['total_tokens'] = usage['prompt_tokens'] + usage['completion_tokens']
+        return self.json_response(200, {
+            'id': f"chatcmpl-standin{self.rng.randrange(10 ** 8)}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': payload.get('model', 'gpt-standin'),
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text}, 'finish_reason': 'stop'}],
+            'usage': usage
+        })
+
+    def gemini_generate(self, payload, path, query):
+        prompt = ' '.join(part.get('text', '') for content in payload.get('contents', [])
+                          for part in content.get('parts', []))
+        text = generated_text(prompt)
+        prompt_tokens, output_tokens = token_estimate(prompt), token_estimate(text)
+        return self.json_response(200, {
+            'candidates': [{'content': {'role': 'model', 'parts': [{'text': text}]}, 'finishReason': 'STOP'}],
+            'usageMetadata': {
+                'promptTokenCount': prompt_tokens,
+                'candidatesTokenCount': output_tokens,
+                'totalTokenCount': prompt_tokens + output_tokens
+            }
+        })
+
+    def elevenlabs_tts(self, payload, path, query):
+        # Roughly 15 characters of speech per second, ~38 frames per second
+        seconds = max(1, len(payload.get('text', '')) // 15)
+        return 200, {'Content-Type': 'audio/mpeg'}, MP3_FRAME * (seconds * 38)
+
+    def elevenlabs_voices(self, payload, path, query):
+        voices = [
+            ('JBFqnCBsd6RMkjVDRZzb', 'George', 'male'),
+            ('EXAVITQu4vr4xnSDxMaL', 'Sarah', 'female'),
+            ('21m00Tcm4TlvDq8ikWAM', 'Rachel', 'female'),
+            ('pNInz6obpgDQGcFmaJgB', 'Adam', 'male')
+        ]
+        return self.json_response(200, {'voices': [
+            {'voice_id': voice_id, 'name': name, 'category': 'premade',
+             'labels': {'gender': gender, 'accent': 'american'}}
+            for voice_id, name, gender in voices
+        ]})
+
+    def error_response(self, provider, status, message):
+        if provider == 'elevenlabs':
+            return self.json_response(status, {'detail': {'status': 'standin_error', 'message': message}})
+        return self.json_response(status, {'error': {'type': 'standin_error', 'message': message, 'code': status}})
+
+    def malformed_response(self):
+        body = self.rng.choice([b'{"content": [', b'<html><body>Bad gateway</body></html>', b'{"unexpected": true}'])
+        return 200, {'Content-Type': 'application/json'}, body
+
+    def json_response(self, status, data):
+        return status, {'Content-Type': 'application/json'}, json.dumps(data).encode('utf-8')
+
+
+def generated_text(prompt):
+    """Plausible output for the content type the prompt asks for"""
+    lowered = prompt.lower()
+    if 'takeaway' in lowered:
+        return '\n'.join(f"• Stand-in takeaway {i}: AI-assisted workflows help recruiters publish faster."
+                         for i in range(1, 6))
+    if 'faq' in lowered or 'frequently asked' in lowered:
+        return '\n\n'.join(f"Q: Stand-in question {i}?\nA: Stand-in answer {i} with enough detail to render."
+                           for i in range(1, 6))
+    if 'table of contents' in lowered or 'toc' in lowered:
+        return '\n'.join(f"{i}. Stand-in section {i}" for i in range(1, 8))
+    return "Stand-in summary of the submitted content, generated locally for testing."
+
+
+def token_estimate(text):
+    # Same heuristic the Gemini service uses when usage is missing
+    return max(1, len(text) // 4)
+
+
+async def read_request(reader):
+    """Parse one HTTP/1.1 request; returns None at end of stream"""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+
+    method, target, _ = request_line.decode('latin-1').split(' ', 2)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get('content-length', 0) or 0)
+    body = await reader.readexactly(length) if length else b''
+    url = urlsplit(target)
+    return method.upper(), url.path, url.query, headers, body
+
+
+def make_connection_handler(standin):
+    async def handle_connection(reader, writer):
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+
+                response = await standin.handle(*request)
+                if response is None:
+                    # Injected timeout: drop the connection without answering
+                    break
+
+                status, headers, body = response
+                keep_alive = request[3].get('connection', '').lower() != 'close'
+                head = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'Unknown')}",
+                        f"Content-Length: {len(body)}",
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+                head += [f"{name}: {value}" for name, value in headers.items()]
+                writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    return handle_connection
+
+
+async def serve(standin, host, port):
+    server = await asyncio.start_server(make_connection_handler(standin), host, port)
+    print(f"🤖 Stand-in AI providers listening on http://{host}:{port}")
+    for provider, prefix in (('claude', '/claude/v1'), ('openai', '/openai/v1'),
+                             ('gemini', '/gemini/v1beta'), ('elevenlabs', '/elevenlabs/v1')):
+        print(f"   HMG_AI_{provider.upper()}_BASE_URL=http://<host>:{port}{prefix}")
+    async with server:
+        await server.serve_forever()
+
+
+def parse_profile_args(values):
+    """--profile claude:latency=fixed:200,rate_limit=0.1 -> {'claude': {...}}"""
+    profiles = {}
+    for value in values or []:
+        provider, _, settings = value.partition(':')
+        targets = PROVIDERS if provider == 'all' else (provider,)
+        for setting in filter(None, settings.split(',')):
+            key, _, raw = setting.partition('=')
+            if key not in DEFAULT_PROFILE:
+                raise ValueError(f"Unknown profile setting: {key}")
+            parsed = raw if key == 'latency' else float(raw)
+            for target in targets:
+                profiles.setdefault(target, {})[key] = parsed
+    return profiles
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stand-in AI provider APIs for offline testing')
+    parser.add_argument('--host', default='0.0.0.0', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=8090, help='Port to listen on')
+    parser.add_argument('--seed', type=int, help='Seed for latency and fault draws (reproducible runs)')
+    parser.add_argument('--config', help='JSON file mapping providers to profile settings')
+    parser.add_argument('--profile', action='append', metavar='PROVIDER:KEY=VALUE,...',
+                        help='Profile overrides, e.g. claude:latency=uniform:200:900,rate_limit=0.2 '
+                             '(PROVIDER may be "all")')
+
+    args = parser.parse_args()
+
+    profiles = {}
+    if args.config:
+        with open(args.config) as f:
+            profiles = json.load(f)
+    for provider, settings in parse_profile_args(args.profile).items():
+        profiles.setdefault(provider, {}).update(settings)
+
+    standin = ProviderStandin(profiles, seed=args.seed)
+    try:
+        asyncio.run(serve(standin, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,13 +1,82 @@
 import pytest
 import os
+import json
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
 
+from driver_pool import DriverPool, summarize_pool_stats
+from fixture_server import FixtureServer
 from selenium_helper import SeleniumHelper
-from wordpress_helper import WordPressHelper
+from wordpress_helper import ShortcodeTestPost, WordPressHelper
+
+# Driver pool counters for this process (merged from xdist workers on the controller)
+_pool_stats = {}
+
+# 'fixtures' serves shortcode pages from the local fixture server; 'wordpress'
+# also runs the integration tier against a live WordPress install
+TEST_TARGET = os.getenv('HMG_TEST_TARGET', 'fixtures')
+
+# Per-test wall time (setup + call + teardown), used by run_shortcode_tests.py to shard
+_test_durations = {}
+
+def pytest_configure(config):
+    # Registered here rather than in pytest.ini, whose [tool:pytest] section pytest doesn't read
+    config.addinivalue_line('markers', 'fresh_browser: runs the test in a new browser session instead of a pooled one')
+
+def pytest_runtest_logreport(report):
+    _test_durations[report.nodeid] = _test_durations.get(report.nodeid, 0.0) + report.duration
+
+def pytest_sessionfinish(session):
+    # Ship this worker's pool counters back to the xdist controller
+    if hasattr(session.config, 'workeroutput'):
+        session.config.workeroutput['driver_pool'] = dict(_pool_stats)
+        return
+    
+    durations_file = os.getenv('HMG_TEST_DURATIONS')
+    if durations_file and _test_durations:
+        os.makedirs(os.path.dirname(durations_file) or '.', exist_ok=True)
+        with open(durations_file, 'w') as f:
+            json.dump(_test_durations, f, indent=2, sort_keys=True)
+
+def pytest_collection_modifyitems(config, items):
+    if TEST_TARGET == 'wordpress':
+        return
+    
+    skip = pytest.mark.skip(reason="needs WordPress (set HMG_TEST_TARGET=wordpress)")
+    for item in items:
+        if item.get_closest_marker('integration'):
+            item.add_marker(skip)
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Expose setup/call/teardown reports to fixtures as item.rep_<phase>
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f'rep_{report.when}', report)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    for key, value in getattr(node, 'workeroutput', {}).get('driver_pool', {}).items():
+        _pool_stats[key] = _pool_stats.get(key, 0) + value
+
+def pytest_terminal_summary(terminalreporter):
+    if not _pool_stats.get('created'):
+        return
+    
+    report = summarize_pool_stats(_pool_stats)
+    terminalreporter.write_sep('-', 'WebDriver pool')
+    terminalreporter.write_line(
+        f"Sessions created: {report['sessions_created']}, reused: {report['sessions_reused']}, "
+        f"discarded: {report['sessions_discarded']}"
+    )
+    terminalreporter.write_line(
+        f"Average session setup: {report['avg_session_setup']:.2f}s, "
+        f"reset overhead: {report['reset_seconds']:.2f}s"
+    )
+    terminalreporter.write_line(f"Estimated session setup time saved: {report['saved_seconds']:.1f}s")
 
 @pytest.fixture(scope="session")
 def test_config():
@@ -17,40 +86,96 @@ def test_config():
     
     return {
         'wordpress_url': wordpress_url,
+        'test_target': TEST_TARGET,
+        # Host the grid's browsers use to reach the fixture server on this machine
+        'fixture_host': os.getenv('FIXTURE_HOST', 'host.docker.internal'),
+        'fixture_port': int(os.getenv('FIXTURE_PORT', '0')),
         'admin_user': os.getenv('WP_ADMIN_USER', 'admin'),
         'admin_pass': os.getenv('WP_ADMIN_PASS', 'admin123'),
         'selenium_hub': os.getenv('SELENIUM_HUB', 'http://localhost:4444/wd/hub'),
         'screenshot_dir': 'tests/screenshots',
         'baseline_dir': 'tests/screenshots/baseline',
         'current_dir': 'tests/screenshots/current',
-        'diff_dir': 'tests/screenshots/diff'
+        'diff_dir': 'tests/screenshots/diff',
+        'performance_budgets': os.path.join(os.path.dirname(__file__), 'performance_budgets.json'),
+        'performance_history': 'tests/reports/performance_history.jsonl',
+        'scaling_history': 'tests/reports/scaling_history.jsonl',
+        'scaling_summary': 'tests/reports/scaling_summary.json'
     }
 
-@pytest.fixture(params=['chrome'])  # Start with Chrome only
-def browser(request, test_config):
-    """Browser fixture"""
-    browser_name = request.param
-    
+def _create_driver(browser_name, config):
+    """Start a new remote WebDriver session on the grid"""
     if browser_name == 'chrome':
         options = ChromeOptions()
         options.add_argument('--headless')
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--window-size=1920,1080')
-        
-        driver = webdriver.Remote(
-            command_executor=test_config['selenium_hub'],
-            options=options
-        )
+    elif browser_name == 'firefox':
+        options = FirefoxOptions()
+        options.add_argument('--headless')
+        options.add_argument('--width=1920')
+        options.add_argument('--height=1080')
+    else:
+        raise ValueError(f"Unsupported browser: {browser_name}")
+    
+    return webdriver.Remote(
+        command_executor=config['selenium_hub'],
+        options=options
+    )
+
+@pytest.fixture(scope="session")
+def driver_pool(test_config):
+    """Warm WebDriver sessions shared by the tests of this worker"""
+    pool = DriverPool(lambda browser_name: _create_driver(browser_name, test_config))
+    yield pool
+    pool.close()
+    
+    for key, value in pool.stats.items():
+        _pool_stats[key] = _pool_stats.get(key, 0) + value
+
+@pytest.fixture(params=['chrome'])  # Start with Chrome only
+def browser(request, driver_pool):
+    """Browser fixture, served from the session pool unless marked fresh_browser"""
+    browser_name = request.param
     
-    driver.implicitly_wait(10)
+    if request.node.get_closest_marker('fresh_browser'):
+        driver = driver_pool.create(browser_name)
+        yield driver
+        driver.quit()
+        return
+    
+    driver = driver_pool.acquire(browser_name)
     yield driver
-    driver.quit()
+    driver_pool.release(browser_name, driver)
+
+@pytest.fixture(scope="session")
+def fixture_server(test_config):
+    """Local HTTP server for fixture pages and the plugin's public assets"""
+    here = os.path.dirname(__file__)
+    server = FixtureServer(
+        repo_root=os.path.abspath(os.path.join(here, '..', '..')),
+        fixtures_dir=os.path.join(here, 'fixtures'),
+        public_host=test_config['fixture_host'],
+        port=test_config['fixture_port']
+    ).start()
+    yield server
+    server.stop()
+
+@pytest.fixture(scope="session")
+def shortcode_test_post(test_config, fixture_server):
+    """Shortcode test post URL, resolved once per session (or xdist worker)"""
+    fixture_url = fixture_server.url('fixtures/shortcodes.html')
+    if test_config['test_target'] == 'fixtures':
+        return ShortcodeTestPost(fixture_url)
+    return ShortcodeTestPost(fallback_url=fixture_url)
 
 @pytest.fixture
-def selenium_helper(browser, test_config):
+def selenium_helper(request, browser, test_config):
     """Selenium helper utilities"""
-    return SeleniumHelper(browser, test_config)
+    helper = SeleniumHelper(browser, test_config, test_id=request.node.nodeid)
+    yield helper
+    helper.flush_screenshots()
 
 @pytest.fixture
 def wordpress_helper(browser, test_config):
@@ -7,6 +7,7 @@ from selenium.webdriver.support import expected_conditions as EC
 class TestSetupVerification:
     """Basic tests to verify the testing environment is working"""
     
+    @pytest.mark.integration
     def test_wordpress_is_accessible(self, selenium_helper, wordpress_helper):
         """Verify WordPress site is accessible"""
         selenium_helper.driver.get(wordpress_helper.wp_url)
@@ -22,6 +23,7 @@ class TestSetupVerification:
         assert os.path.exists(screenshot_path), "Screenshot should be created"
         print(f"✅ WordPress accessible at {wordpress_helper.wp_url}")
     
+    @pytest.mark.integration
     def test_admin_login_works(self, selenium_helper, wordpress_helper):
         """Verify admin login functionality"""
         wordpress_helper.login_to_admin()
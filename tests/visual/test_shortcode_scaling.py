@@ -0,0 +1,144 @@
+"""
+Scaling tests for HMG AI Blog Enhancer shortcodes
+Renders every list-based shortcode style at 10/100/1000 items on generated
+fixture pages and records how render, layout and interaction time grow, and
+benchmarks the TOC sidebar scroll handlers against heading count
+"""
+
+import json
+import os
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from page_metrics import PageMetricsCollector, load_budgets, record_metrics
+from scroll_benchmark import ScrollBenchmark, handler_cost
+from shortcode_generator import (
+    INTERACTION_TARGETS, ITEM_SELECTORS, STYLES, page_name, render_page, render_sidebar_page
+)
+
+ITEM_COUNTS = [10, 100, pytest.param(1000, marks=pytest.mark.slow)]
+
+# Heading levels the generated TOCs cycle through
+TOC_DEPTH = 3
+
+CASES = [(component, style) for component, styles in STYLES.items() for style in styles]
+
+
+@pytest.fixture(scope="module")
+def scaling_results(test_config):
+    """Collects measurements per style and writes the growth summary at the end"""
+    results = {}
+    yield results
+
+    summary = {}
+    for case, by_count in sorted(results.items()):
+        counts = sorted(by_count)
+        smallest, largest = by_count[counts[0]], by_count[counts[-1]]
+        summary[case] = {
+            'counts': {str(count): by_count[count] for count in counts},
+            # How many times slower the largest page is than the smallest
+            'growth': {
+                metric: round(largest[metric] / smallest[metric], 1)
+                for metric in ('render_ms', 'layout_ms', 'relayout_ms', 'interaction_ms',
+                               'script_ms_per_frame', 'forced_layouts', 'dropped_frames')
+                if largest.get(metric) is not None and smallest.get(metric)
+            }
+        }
+
+    if summary:
+        os.makedirs(os.path.dirname(test_config['scaling_summary']), exist_ok=True)
+        with open(test_config['scaling_summary'], 'w') as f:
+            json.dump(summary, f, indent=2, sort_keys=True)
+
+
+class TestShortcodeScaling:
+    """Render and interaction cost of shortcodes with many items"""
+
+    @pytest.mark.parametrize('count', ITEM_COUNTS)
+    @pytest.mark.parametrize('component,style', CASES, ids=[f"{c}_{s}" for c, s in CASES])
+    def test_interaction_scaling(self, request, browser, fixture_server, test_config, scaling_results,
+                                 component, style, count):
+        """Measure a generated page with count items of one shortcode style"""
+        depth = TOC_DEPTH if component == 'toc' else 1
+        url = fixture_server.add_page(
+            page_name(component, style, count, depth),
+            render_page(component, style, count, depth)
+        )
+
+        browser.get(url)
+
+        selector = f".hmg-ai-{component}.hmg-ai-{component}-{style}"
+        rendered = len(browser.find_elements(By.CSS_SELECTOR, f"{selector} :is({ITEM_SELECTORS[component]})"))
+        assert rendered == count, f"Expected {count} items, rendered {rendered}"
+
+        metrics = PageMetricsCollector(browser).collect_scaling(selector, INTERACTION_TARGETS[component])
+        metrics.update({'component': component, 'style': style, 'count': count, 'depth': depth})
+
+        record_metrics(test_config['scaling_history'], request.node.nodeid, url, metrics)
+        scaling_results.setdefault(f"{component}_{style}", {})[count] = metrics
+        print(f"Scaling metrics: {metrics}")
+
+        budget = load_budgets(test_config['performance_budgets']).get('scaling', {}).get('interaction_ms')
+        if budget is not None and metrics['interaction_ms'] is not None:
+            assert metrics['interaction_ms'] <= budget, \
+                f"Interaction took {metrics['interaction_ms']}ms with {count} items (budget {budget}ms)"
+
+
+class TestTocScrollCost:
+    """Cost of the sidebar progress and scroll-spy handlers in hmg-ai-public.js"""
+
+    # Scroll distance per gesture and number of gestures per run
+    SCROLL_DISTANCE = 6000
+    SCROLL_REPEAT = 2
+
+    @pytest.mark.parametrize('count', ITEM_COUNTS)
+    def test_toc_sidebar_scroll_cost(self, request, browser, fixture_server, test_config, scaling_results, count):
+        """Scroll a post with count headings with and without the scroll handlers"""
+        benchmark = ScrollBenchmark(browser)
+        if not benchmark.is_supported():
+            pytest.skip("Scroll benchmark needs Chrome DevTools Protocol access")
+
+        url = fixture_server.add_page(f"generated/toc-live-sidebar-{count}-d{TOC_DEPTH}.html",
+                                      render_sidebar_page(count, TOC_DEPTH))
+        browser.get(url)
+
+        assert browser.execute_script("return typeof HMGAIPublic !== 'undefined';"), \
+            "hmg-ai-public.js did not initialize"
+
+        # Warm up so one-off work (first layout, JIT) is not attributed to either run
+        benchmark.run(self.SCROLL_DISTANCE)
+        with_handlers = benchmark.run(self.SCROLL_DISTANCE, repeat=self.SCROLL_REPEAT)
+
+        progress_width = browser.execute_script(
+            "return document.querySelector('.hmg-ai-toc-progress-bar').style.width;"
+        )
+        assert progress_width, "Sidebar progress bar was never updated while scrolling"
+
+        browser.execute_script("jQuery(window).off('scroll');")
+        without_handlers = benchmark.run(self.SCROLL_DISTANCE, repeat=self.SCROLL_REPEAT)
+
+        cost = handler_cost(with_handlers, without_handlers)
+        metrics = {
+            'component': 'toc',
+            'style': 'sidebar_scroll',
+            'count': count,
+            'depth': TOC_DEPTH,
+            'with_handlers': with_handlers,
+            'without_handlers': without_handlers,
+            'handler_cost': cost,
+            # Headline numbers, attributed to the handlers
+            'script_ms_per_frame': with_handlers['script_ms_per_frame'],
+            'forced_layouts': cost['layouts'],
+            'dropped_frames': with_handlers['dropped_frames']
+        }
+
+        record_metrics(test_config['scaling_history'], request.node.nodeid, url, metrics)
+        scaling_results.setdefault('toc_sidebar_scroll', {})[count] = metrics
+        print(f"Scroll handler cost with {count} headings: {cost}")
+
+        budget = load_budgets(test_config['performance_budgets']).get('scaling', {}).get('scroll_script_ms_per_frame')
+        if budget is not None:
+            assert with_handlers['script_ms_per_frame'] <= budget, \
+                f"Scroll handlers took {with_handlers['script_ms_per_frame']}ms of script per frame " \
+                f"with {count} headings (budget {budget}ms)"
@@ -13,16 +13,40 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+from page_metrics import PageMetricsCollector, check_budgets, load_budgets, record_metrics
+
+# Every shortcode style rendered on the test post
+SHORTCODE_STYLES = {
+    'takeaways_default': '.hmg-ai-takeaways.hmg-ai-takeaways-default',
+    'takeaways_numbered': '.hmg-ai-takeaways.hmg-ai-takeaways-numbered',
+    'takeaways_cards': '.hmg-ai-takeaways.hmg-ai-takeaways-cards',
+    'takeaways_highlights': '.hmg-ai-takeaways.hmg-ai-takeaways-highlights',
+    'faq_accordion': '.hmg-ai-faq.hmg-ai-faq-accordion',
+    'faq_list': '.hmg-ai-faq.hmg-ai-faq-list',
+    'faq_cards': '.hmg-ai-faq.hmg-ai-faq-cards',
+    'toc_numbered': '.hmg-ai-toc.hmg-ai-toc-numbered',
+    'toc_horizontal': '.hmg-ai-toc.hmg-ai-toc-horizontal',
+    'toc_minimal': '.hmg-ai-toc.hmg-ai-toc-minimal',
+    'toc_sidebar': '.hmg-ai-toc.hmg-ai-toc-sidebar',
+    'audio_player': '.hmg-ai-audio.hmg-ai-audio-player',
+    'audio_compact': '.hmg-ai-audio.hmg-ai-audio-compact',
+    'audio_minimal': '.hmg-ai-audio.hmg-ai-audio-minimal',
+    'audio_card': '.hmg-ai-audio.hmg-ai-audio-card'
+}
+
 
 class TestShortcodeVisual:
     """Visual tests for shortcode functionality"""
     
     @pytest.fixture(autouse=True)
-    def setup_test_post(self, wordpress_helper):
-        """Create test post with shortcodes before each test"""
-        self.test_post_url = wordpress_helper.create_shortcode_test_post()
+    def setup_test_post(self, request, shortcode_test_post, wordpress_helper):
+        """Resolve the shared shortcode test post (probed once per session)"""
+        self.test_post_url = shortcode_test_post.get(wordpress_helper)
         yield
-        # Cleanup after test if needed
+        # Re-validate the test post before the next test if this one failed
+        report = getattr(request.node, 'rep_call', None)
+        if report is not None and report.failed:
+            shortcode_test_post.invalidate()
     
     def test_takeaways_default_style(self, selenium_helper, browser):
         """Test takeaways shortcode default style"""
@@ -35,10 +59,10 @@ class TestShortcodeVisual:
         
         # Scroll to element
         browser.execute_script("arguments[0].scrollIntoView(true);", takeaways)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(takeaways)
         
         # Take screenshot
-        screenshot_path = selenium_helper.take_screenshot('takeaways_default')
+        selenium_helper.capture_element(takeaways, 'takeaways_default', save=True)
         
         # Visual checks
         assert takeaways.is_displayed()
@@ -57,10 +81,10 @@ class TestShortcodeVisual:
         # Test hover effects
         actions = ActionChains(browser)
         actions.move_to_element(items[0]).perform()
-        time.sleep(0.5)
+        selenium_helper.wait_until_settled(items[0])
         
         # Take hover screenshot
-        selenium_helper.take_screenshot('takeaways_default_hover')
+        selenium_helper.capture_element(takeaways, 'takeaways_default_hover', save=True)
     
     def test_takeaways_cards_style(self, selenium_helper, browser):
         """Test takeaways shortcode cards style"""
@@ -72,10 +96,14 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", cards_section)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(cards_section)
         
         # Take screenshot
-        selenium_helper.take_screenshot('takeaways_cards')
+        cards_image = selenium_helper.capture_element(cards_section, 'takeaways_cards', save=True)
+        
+        # Compare only the component's pixels against its baseline
+        is_similar, similarity, diff_path = selenium_helper.compare_with_baseline('takeaways_cards', cards_image)
+        assert is_similar, f"Takeaways cards differ from baseline (similarity {similarity:.3f}): {diff_path}"
         
         # Check grid layout
         grid = cards_section.find_element(By.CSS_SELECTOR, '.hmg-ai-takeaways-grid')
@@ -87,7 +115,7 @@ class TestShortcodeVisual:
         for i, card in enumerate(cards[:2]):  # Test first 2 cards
             actions = ActionChains(browser)
             actions.move_to_element(card).perform()
-            time.sleep(0.3)
+            selenium_helper.wait_until_settled(card)
             
             # Check for card number
             number = card.find_element(By.CSS_SELECTOR, '.hmg-ai-card-number')
@@ -102,9 +130,9 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", numbered_section)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(numbered_section)
         
-        selenium_helper.take_screenshot('takeaways_numbered')
+        selenium_helper.capture_element(numbered_section, 'takeaways_numbered', save=True)
         
         # Check numbered list
         items = numbered_section.find_elements(By.CSS_SELECTOR, '.hmg-ai-takeaway-item')
@@ -123,9 +151,9 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", highlights_section)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(highlights_section)
         
-        selenium_helper.take_screenshot('takeaways_highlights')
+        selenium_helper.capture_element(highlights_section, 'takeaways_highlights', save=True)
         
         # Check highlights layout
         highlights = highlights_section.find_elements(By.CSS_SELECTOR, '.hmg-ai-highlight-item')
@@ -147,10 +175,10 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", faq_section)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(faq_section)
         
         # Take initial screenshot
-        selenium_helper.take_screenshot('faq_accordion_initial')
+        selenium_helper.capture_element(faq_section, 'faq_accordion_initial', save=True)
         
         # Find accordion buttons
         buttons = faq_section.find_elements(By.CSS_SELECTOR, '[data-hmg-faq-toggle]')
@@ -165,18 +193,18 @@ class TestShortcodeVisual:
         
         # Click to close first item
         first_button.click()
-        time.sleep(0.5)
+        selenium_helper.wait_until_settled(faq_section)
         
-        selenium_helper.take_screenshot('faq_accordion_first_closed')
+        selenium_helper.capture_element(faq_section, 'faq_accordion_first_closed', save=True)
         
         assert first_button.get_attribute('aria-expanded') == 'false'
         
         # Click second accordion item
         second_button = buttons[1]
         second_button.click()
-        time.sleep(0.5)
+        selenium_helper.wait_until_settled(faq_section)
         
-        selenium_helper.take_screenshot('faq_accordion_second_open')
+        selenium_helper.capture_element(faq_section, 'faq_accordion_second_open', save=True)
         
         # Verify second item is now open
         assert second_button.get_attribute('aria-expanded') == 'true'
@@ -190,9 +218,9 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", faq_list)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(faq_list)
         
-        selenium_helper.take_screenshot('faq_list')
+        selenium_helper.capture_element(faq_list, 'faq_list', save=True)
         
         # Check list items
         items = faq_list.find_elements(By.CSS_SELECTOR, '.hmg-ai-faq-item')
@@ -216,9 +244,9 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", faq_cards)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(faq_cards)
         
-        selenium_helper.take_screenshot('faq_cards')
+        selenium_helper.capture_element(faq_cards, 'faq_cards', save=True)
         
         # Check cards layout
         cards_container = faq_cards.find_element(By.CSS_SELECTOR, '.hmg-ai-faq-cards')
@@ -230,7 +258,7 @@ class TestShortcodeVisual:
         for i, card in enumerate(cards[:2]):
             actions = ActionChains(browser)
             actions.move_to_element(card).perform()
-            time.sleep(0.3)
+            selenium_helper.wait_until_settled(card)
             
             # Check Q icon
             icon = card.find_element(By.CSS_SELECTOR, '.hmg-ai-faq-card-icon')
@@ -245,9 +273,9 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", toc_numbered)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(toc_numbered)
         
-        selenium_helper.take_screenshot('toc_numbered')
+        selenium_helper.capture_element(toc_numbered, 'toc_numbered', save=True)
         
         # Check TOC links
         links = toc_numbered.find_elements(By.CSS_SELECTOR, '[data-hmg-smooth-scroll]')
@@ -259,7 +287,7 @@ class TestShortcodeVisual:
         
         # Click link
         first_link.click()
-        time.sleep(1)
+        selenium_helper.wait_until_settled()
         
         # Verify scroll occurred
         target_element = browser.find_element(By.ID, target_id)
@@ -276,9 +304,9 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", toc_horizontal)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(toc_horizontal)
         
-        selenium_helper.take_screenshot('toc_horizontal')
+        selenium_helper.capture_element(toc_horizontal, 'toc_horizontal', save=True)
         
         # Check horizontal scroll container
         scroll_container = toc_horizontal.find_element(By.CSS_SELECTOR, '.hmg-ai-toc-scroll-container')
@@ -290,7 +318,7 @@ class TestShortcodeVisual:
         for item in horizontal_items[:3]:
             actions = ActionChains(browser)
             actions.move_to_element(item).perform()
-            time.sleep(0.2)
+            selenium_helper.wait_until_settled(item)
     
     def test_toc_minimal_style(self, selenium_helper, browser):
         """Test TOC minimal style"""
@@ -301,9 +329,9 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", toc_minimal)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(toc_minimal)
         
-        selenium_helper.take_screenshot('toc_minimal')
+        selenium_helper.capture_element(toc_minimal, 'toc_minimal', save=True)
         
         # Check minimal links
         minimal_items = toc_minimal.find_elements(By.CSS_SELECTOR, '.hmg-ai-toc-minimal-item')
@@ -313,7 +341,7 @@ class TestShortcodeVisual:
         for item in minimal_items[:2]:
             actions = ActionChains(browser)
             actions.move_to_element(item).perform()
-            time.sleep(0.3)
+            selenium_helper.wait_until_settled(item)
     
     def test_toc_sidebar_style(self, selenium_helper, browser):
         """Test TOC sidebar style with progress tracking"""
@@ -324,9 +352,9 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", toc_sidebar)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(toc_sidebar)
         
-        selenium_helper.take_screenshot('toc_sidebar')
+        selenium_helper.capture_element(toc_sidebar, 'toc_sidebar', save=True)
         
         # Check progress bar
         progress_bar = toc_sidebar.find_element(By.CSS_SELECTOR, '.hmg-ai-toc-progress-bar')
@@ -338,7 +366,7 @@ class TestShortcodeVisual:
         
         # Test scroll progress
         browser.execute_script("window.scrollTo(0, document.body.scrollHeight / 2);")
-        time.sleep(1)
+        selenium_helper.wait_until_settled()
         
         selenium_helper.take_screenshot('toc_sidebar_scroll_progress')
         
@@ -355,9 +383,9 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", audio_player)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(audio_player)
         
-        selenium_helper.take_screenshot('audio_player_default')
+        selenium_helper.capture_element(audio_player, 'audio_player_default', save=True)
         
         # Check audio element
         audio_element = audio_player.find_element(By.CSS_SELECTOR, '.hmg-ai-audio-element')
@@ -369,9 +397,9 @@ class TestShortcodeVisual:
         
         # Test speed control click
         speed_button.click()
-        time.sleep(0.5)
+        selenium_helper.wait_until_settled(audio_player)
         
-        selenium_helper.take_screenshot('audio_player_speed_changed')
+        selenium_helper.capture_element(audio_player, 'audio_player_speed_changed', save=True)
     
     def test_audio_compact_style(self, selenium_helper, browser):
         """Test audio compact style"""
@@ -382,9 +410,9 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", audio_compact)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(audio_compact)
         
-        selenium_helper.take_screenshot('audio_compact')
+        selenium_helper.capture_element(audio_compact, 'audio_compact', save=True)
         
         # Check compact layout
         compact_container = audio_compact.find_element(By.CSS_SELECTOR, '.hmg-ai-audio-compact')
@@ -405,9 +433,9 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", audio_minimal)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(audio_minimal)
         
-        selenium_helper.take_screenshot('audio_minimal')
+        selenium_helper.capture_element(audio_minimal, 'audio_minimal', save=True)
         
         # Check custom play button
         play_button = audio_minimal.find_element(By.CSS_SELECTOR, '[data-hmg-audio-toggle]')
@@ -419,9 +447,9 @@ class TestShortcodeVisual:
         
         # Test play button click
         play_button.click()
-        time.sleep(1)
+        selenium_helper.wait_until_settled(audio_minimal)
         
-        selenium_helper.take_screenshot('audio_minimal_playing')
+        selenium_helper.capture_element(audio_minimal, 'audio_minimal_playing', save=True)
     
     def test_audio_card_style(self, selenium_helper, browser):
         """Test audio card style"""
@@ -432,9 +460,9 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", audio_card)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(audio_card)
         
-        selenium_helper.take_screenshot('audio_card')
+        selenium_helper.capture_element(audio_card, 'audio_card', save=True)
         
         # Check card layout
         card_container = audio_card.find_element(By.CSS_SELECTOR, '.hmg-ai-audio-card')
@@ -455,7 +483,7 @@ class TestShortcodeVisual:
         browser.set_window_size(375, 667)  # iPhone 6/7/8 size
         browser.get(self.test_post_url)
         
-        time.sleep(2)  # Allow responsive adjustments
+        selenium_helper.wait_until_settled()  # Allow responsive adjustments
         
         # Test takeaways cards on mobile
         takeaways_cards = selenium_helper.wait_for_element(
@@ -463,17 +491,17 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", takeaways_cards)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(takeaways_cards)
         
-        selenium_helper.take_screenshot('mobile_takeaways')
+        selenium_helper.capture_element(takeaways_cards, 'mobile_takeaways', save=True)
         
         # Test FAQ accordion on mobile
         try:
             faq_accordion = browser.find_element(By.CSS_SELECTOR, '.hmg-ai-faq')
             browser.execute_script("arguments[0].scrollIntoView(true);", faq_accordion)
-            time.sleep(1)
+            selenium_helper.wait_until_settled(faq_accordion)
             
-            selenium_helper.take_screenshot('mobile_faq')
+            selenium_helper.capture_element(faq_accordion, 'mobile_faq', save=True)
         except NoSuchElementException:
             pass  # FAQ might not be visible in this test
         
@@ -497,7 +525,7 @@ class TestShortcodeVisual:
             
             # Test Tab navigation
             first_button.send_keys(Keys.TAB)
-            time.sleep(0.3)
+            selenium_helper.wait_until_settled(faq_section)
             
             selenium_helper.take_screenshot('accessibility_tab_navigation')
             
@@ -507,7 +535,7 @@ class TestShortcodeVisual:
             first_toc_link = toc_section.find_element(By.CSS_SELECTOR, 'a')
             
             first_toc_link.click()
-            time.sleep(0.5)
+            selenium_helper.wait_until_settled()
             
             selenium_helper.take_screenshot('accessibility_toc_keyboard')
     
@@ -562,38 +590,46 @@ class TestShortcodeVisual:
             document.head.appendChild(style);
         """)
         
-        time.sleep(1)
+        selenium_helper.wait_until_settled()
         
         # Take screenshots of components in dark mode
         takeaways = browser.find_element(By.CSS_SELECTOR, '.hmg-ai-takeaways')
         browser.execute_script("arguments[0].scrollIntoView(true);", takeaways)
-        selenium_helper.take_screenshot('dark_mode_takeaways')
+        selenium_helper.capture_element(takeaways, 'dark_mode_takeaways', save=True)
         
         faq = browser.find_element(By.CSS_SELECTOR, '.hmg-ai-faq')
         browser.execute_script("arguments[0].scrollIntoView(true);", faq)
-        selenium_helper.take_screenshot('dark_mode_faq')
+        selenium_helper.capture_element(faq, 'dark_mode_faq', save=True)
     
-    def test_performance_loading_times(self, selenium_helper, browser):
-        """Test component loading performance"""
-        start_time = time.time()
-        
-        browser.get(self.test_post_url)
+    def test_performance_loading_times(self, request, selenium_helper, browser, test_config):
+        """Test page performance metrics against the configured budgets"""
+        collector = PageMetricsCollector(browser)
+        collector.install()
         
-        # Wait for all shortcode components to load
-        components = [
-            '.hmg-ai-takeaways',
-            '.hmg-ai-faq', 
-            '.hmg-ai-toc',
-            '.hmg-ai-audio'
-        ]
-        
-        for component in components:
-            selenium_helper.wait_for_element((By.CSS_SELECTOR, component))
-        
-        load_time = time.time() - start_time
+        try:
+            browser.get(self.test_post_url)
+            
+            # Wait for all shortcode components to load
+            components = [
+                '.hmg-ai-takeaways',
+                '.hmg-ai-faq', 
+                '.hmg-ai-toc',
+                '.hmg-ai-audio'
+            ]
+            
+            for component in components:
+                selenium_helper.wait_for_element((By.CSS_SELECTOR, component))
+            
+            WebDriverWait(browser, 10).until(
+                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            )
+            
+            metrics = collector.collect(SHORTCODE_STYLES)
+        finally:
+            collector.uninstall()
         
-        # Assert reasonable loading time (adjust threshold as needed)
-        assert load_time < 10, f"Page loaded too slowly: {load_time}s"
+        record_metrics(test_config['performance_history'], request.node.nodeid, self.test_post_url, metrics)
+        print(f"Performance metrics: {metrics}")
         
         selenium_helper.take_screenshot('performance_all_components_loaded')
         
@@ -605,6 +641,9 @@ class TestShortcodeVisual:
         """)
         
         assert js_ready, "JavaScript components not properly initialized"
+        
+        violations = check_budgets(metrics, load_budgets(test_config['performance_budgets']))
+        assert not violations, f"Performance budgets exceeded: {violations}"
     
     def test_toc_navigation_functionality(self, selenium_helper, browser):
         """Test TOC navigation and smooth scrolling"""
@@ -615,9 +654,9 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", toc_section)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(toc_section)
         
-        selenium_helper.take_screenshot('toc_numbered')
+        selenium_helper.capture_element(toc_section, 'toc_numbered', save=True)
         
         # Check TOC links
         links = toc_section.find_elements(By.CSS_SELECTOR, '[data-hmg-smooth-scroll]')
@@ -629,7 +668,7 @@ class TestShortcodeVisual:
         
         # Click link
         first_link.click()
-        time.sleep(1)
+        selenium_helper.wait_until_settled()
         
         # Verify scroll occurred
         target_element = browser.find_element(By.ID, target_id)
@@ -646,9 +685,9 @@ class TestShortcodeVisual:
         )
         
         browser.execute_script("arguments[0].scrollIntoView(true);", audio_player)
-        time.sleep(1)
+        selenium_helper.wait_until_settled(audio_player)
         
-        selenium_helper.take_screenshot('audio_player_default')
+        selenium_helper.capture_element(audio_player, 'audio_player_default', save=True)
         
         # Check audio element
         audio_element = audio_player.find_element(By.CSS_SELECTOR, '.hmg-ai-audio-element')
@@ -660,16 +699,16 @@ class TestShortcodeVisual:
         
         # Test speed control click
         speed_button.click()
-        time.sleep(0.5)
+        selenium_helper.wait_until_settled(audio_player)
         
-        selenium_helper.take_screenshot('audio_player_speed_changed')
+        selenium_helper.capture_element(audio_player, 'audio_player_speed_changed', save=True)
     
     def test_all_shortcode_styles_present(self, selenium_helper, browser):
         """Test that all shortcode styles are present and rendered"""
         browser.get(self.test_post_url)
         
-        # Wait for page to load
-        time.sleep(3)
+        # Wait for page to settle
+        selenium_helper.wait_until_settled()
         
         # Take full page screenshot
         selenium_helper.take_screenshot('all_shortcodes_overview')
@@ -690,9 +729,9 @@ class TestShortcodeVisual:
                     found_shortcodes.append(selector)
                     # Scroll to each and take screenshot
                     browser.execute_script("arguments[0].scrollIntoView(true);", elements[0])
-                    time.sleep(1)
+                    selenium_helper.wait_until_settled(elements[0])
                     component_name = selector.replace('.hmg-ai-', '').replace('-', '_')
-                    selenium_helper.take_screenshot(f'component_{component_name}')
+                    selenium_helper.capture_element(elements[0], f'component_{component_name}', save=True)
             except Exception as e:
                 print(f"Could not find {selector}: {e}")
         
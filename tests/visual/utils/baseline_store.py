@@ -0,0 +1,134 @@
+import glob
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+
+import cv2
+import numpy as np
+
+
+class BaselineStore:
+    """Deterministic baseline screenshots keyed by test id, viewport and browser
+
+    Every entry is a PNG plus a JSON sidecar holding its content hash,
+    perceptual dHash and a coarse color signature, so a comparison can usually be decided from the
+    sidecar alone without reading the baseline PNG or diffing pixels.
+    Captures of the latest run are kept under the same keys in current_dir,
+    overwriting the previous run, and can be bulk-approved as baselines.
+    """
+
+    HASH_SIZE = 16
+
+    # Per-channel means over a COLOR_GRID x COLOR_GRID grid; dHash is grayscale,
+    # so this is what catches a color change with the same luminance structure
+    COLOR_GRID = 4
+    COLOR_TOLERANCE = 2
+
+    def __init__(self, baseline_dir, current_dir):
+        self.baseline_dir = baseline_dir
+        self.current_dir = current_dir
+
+    def key(self, test_id, name, viewport, browser):
+        """Filesystem-safe entry key, e.g. TestX.test_y-chrome__cards__1920x1080__chrome"""
+        # Drop the file path from pytest node ids; class and test name are enough
+        test_id = test_id.split('::', 1)[-1].replace('::', '.').replace('[', '-').replace(']', '')
+        raw = f"{test_id}__{name}__{viewport[0]}x{viewport[1]}__{browser}"
+        return re.sub(r'[^A-Za-z0-9_.-]+', '_', raw).strip('_')
+
+    def hashes(self, image):
+        """Exact content hash, perceptual dHash and color signature of a BGR image"""
+        content = hashlib.blake2b(image.tobytes(), digest_size=16)
+        content.update(repr(image.shape).encode())
+
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        small = cv2.resize(gray, (self.HASH_SIZE + 1, self.HASH_SIZE), interpolation=cv2.INTER_AREA)
+        bits = small[:, 1:] > small[:, :-1]
+
+        color = image if image.ndim == 3 else cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        cells = cv2.resize(color, (self.COLOR_GRID, self.COLOR_GRID), interpolation=cv2.INTER_AREA)
+
+        return {
+            'content_hash': content.hexdigest(),
+            'dhash': np.packbits(bits).tobytes().hex(),
+            'color': cells.astype(int).ravel().tolist(),
+            'width': int(image.shape[1]),
+            'height': int(image.shape[0])
+        }
+
+    def matches(self, baseline_meta, current_hashes):
+        """True when the sidecar hashes show the images are the same
+
+        An identical content hash is an exact match. An identical dHash with
+        a color signature within COLOR_TOLERANCE means no perceptible change
+        at hash resolution. Anything else, including sidecars written before
+        color signatures existed, needs a full pixel comparison.
+        """
+        if (baseline_meta.get('width'), baseline_meta.get('height')) != \
+                (current_hashes['width'], current_hashes['height']):
+            return False
+
+        if baseline_meta.get('content_hash') == current_hashes['content_hash']:
+            return True
+
+        baseline_color = baseline_meta.get('color')
+        if baseline_meta.get('dhash') != current_hashes['dhash'] or \
+                baseline_color is None or len(baseline_color) != len(current_hashes['color']):
+            return False
+
+        return max(abs(a - b) for a, b in zip(baseline_color, current_hashes['color'])) <= self.COLOR_TOLERANCE
+
+    def load_meta(self, key):
+        """Baseline sidecar for key, or None when there is no baseline yet"""
+        try:
+            with open(self._path(self.baseline_dir, key, '.json')) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def load_image(self, key):
+        """Decoded baseline PNG for key"""
+        return cv2.imread(self._path(self.baseline_dir, key, '.png'))
+
+    def save_current(self, key, image, meta):
+        """Write this run's capture for key, replacing the previous run's"""
+        return self._write(self.current_dir, key, image, meta)
+
+    def save_baseline(self, key, image, meta):
+        """Write image as the baseline for key"""
+        return self._write(self.baseline_dir, key, image, meta)
+
+    def approve(self, pattern=None):
+        """Promote current captures to baselines, optionally only keys containing pattern"""
+        approved = []
+
+        for meta_path in sorted(glob.glob(os.path.join(self.current_dir, '*.json'))):
+            key = os.path.basename(meta_path)[:-len('.json')]
+            png_path = self._path(self.current_dir, key, '.png')
+            if (pattern and pattern not in key) or not os.path.exists(png_path):
+                continue
+
+            os.makedirs(self.baseline_dir, exist_ok=True)
+            shutil.copy2(png_path, self._path(self.baseline_dir, key, '.png'))
+            shutil.copy2(meta_path, self._path(self.baseline_dir, key, '.json'))
+            approved.append(key)
+
+        return approved
+
+    def diff_path(self, diff_dir, key):
+        return self._path(diff_dir, key, '.png')
+
+    def _write(self, directory, key, image, meta):
+        os.makedirs(directory, exist_ok=True)
+        png_path = self._path(directory, key, '.png')
+        cv2.imwrite(png_path, image)
+
+        with open(self._path(directory, key, '.json'), 'w') as f:
+            json.dump(dict(meta, key=key, saved_at=int(time.time())), f, indent=2, sort_keys=True)
+
+        return png_path
+
+    def _path(self, directory, key, extension):
+        return os.path.join(directory, f"{key}{extension}")
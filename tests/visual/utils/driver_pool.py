@@ -0,0 +1,107 @@
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+
+class DriverPool:
+    """Keeps warm WebDriver sessions so tests don't pay grid session setup each time"""
+
+    DEFAULT_WINDOW_SIZE = (1920, 1080)
+    DEFAULT_IMPLICIT_WAIT = 10
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.idle = {}
+        self.stats = {
+            'created': 0,
+            'reused': 0,
+            'discarded': 0,
+            'create_seconds': 0.0,
+            'reset_seconds': 0.0
+        }
+
+    def acquire(self, browser_name):
+        """Get a ready driver for browser_name, reusing an idle session if possible"""
+        driver = self.idle.pop(browser_name, None)
+        if driver is not None:
+            self.stats['reused'] += 1
+            return driver
+
+        return self.create(browser_name)
+
+    def create(self, browser_name):
+        """Start a new session through the factory and record how long it took"""
+        start = time.perf_counter()
+        driver = self.factory(browser_name)
+        self.stats['create_seconds'] += time.perf_counter() - start
+        self.stats['created'] += 1
+
+        driver.implicitly_wait(self.DEFAULT_IMPLICIT_WAIT)
+        return driver
+
+    def release(self, browser_name, driver):
+        """Reset driver and park it for the next test, or quit it if the reset fails"""
+        start = time.perf_counter()
+        try:
+            self.reset(driver)
+        except WebDriverException as e:
+            print(f"Discarding pooled {browser_name} session: {e}")
+            self.discard(driver)
+            return
+        finally:
+            self.stats['reset_seconds'] += time.perf_counter() - start
+
+        previous = self.idle.pop(browser_name, None)
+        if previous is not None:
+            self.discard(previous)
+        self.idle[browser_name] = driver
+
+    def reset(self, driver):
+        """Cheap reset between tests: storage, cookies, timeouts, window and page"""
+        # Storage and cookies are scoped to the current origin, so clear them
+        # before leaving the page the test ended on
+        try:
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+        except WebDriverException:
+            pass
+        driver.delete_all_cookies()
+
+        driver.implicitly_wait(self.DEFAULT_IMPLICIT_WAIT)
+        driver.set_window_size(*self.DEFAULT_WINDOW_SIZE)
+        driver.get('about:blank')
+
+    def discard(self, driver):
+        """Quit a driver without letting grid errors escape"""
+        self.stats['discarded'] += 1
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def close(self):
+        """Quit every idle session"""
+        for driver in self.idle.values():
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+        self.idle = {}
+
+
+def summarize_pool_stats(stats):
+    """Turn raw pool counters (possibly merged across workers) into a report dict"""
+    created = stats.get('created', 0)
+    reused = stats.get('reused', 0)
+    avg_create = stats.get('create_seconds', 0.0) / created if created else 0.0
+    saved = reused * avg_create - stats.get('reset_seconds', 0.0)
+
+    return {
+        'sessions_created': created,
+        'sessions_reused': reused,
+        'sessions_discarded': stats.get('discarded', 0),
+        'avg_session_setup': avg_create,
+        'reset_seconds': stats.get('reset_seconds', 0.0),
+        'saved_seconds': max(saved, 0.0)
+    }
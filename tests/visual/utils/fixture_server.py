@@ -0,0 +1,147 @@
+import hashlib
+import io
+import mimetypes
+import os
+import threading
+import wave
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+
+def _silent_wav(seconds=2, rate=8000):
+    """A short silent WAV so audio shortcodes have a local, playable source"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(1)
+        wav.setframerate(rate)
+        wav.writeframes(b'\x80' * rate * seconds)
+    return buffer.getvalue()
+
+
+class FixtureServer:
+    """In-process HTTP server for offline shortcode rendering tests
+
+    Serves fixture pages from tests/visual/fixtures plus the plugin's real
+    public/css and public/js assets and vendored jQuery, so the shortcode
+    suite runs without WordPress, MySQL or network access. Assets get
+    ETag/Last-Modified validators and a cache lifetime like production;
+    fixture pages are always revalidated.
+    """
+
+    ASSET_MAX_AGE = 3600
+
+    def __init__(self, repo_root, fixtures_dir, public_host='localhost', port=0, bind='0.0.0.0'):
+        self.repo_root = repo_root
+        self.fixtures_dir = fixtures_dir
+        self.public_host = public_host
+        self.routes = {
+            '/public/css/': (os.path.join(repo_root, 'public', 'css'), self.ASSET_MAX_AGE),
+            '/public/js/': (os.path.join(repo_root, 'public', 'js'), self.ASSET_MAX_AGE),
+            '/vendor/': (os.path.join(fixtures_dir, 'vendor'), self.ASSET_MAX_AGE),
+            '/fixtures/': (fixtures_dir, 0)
+        }
+        self.generated = {'/fixtures/silence.wav': _silent_wav()}
+        self.requests = 0
+
+        self.httpd = ThreadingHTTPServer((bind, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def port(self):
+        return self.httpd.server_address[1]
+
+    def url(self, path=''):
+        """URL of path as seen by the browser (which may run on a grid node)"""
+        return f"http://{self.public_host}:{self.port}/{path.lstrip('/')}"
+
+    def add_page(self, name, content):
+        """Serve generated content at /fixtures/<name> and return its URL"""
+        path = '/fixtures/' + name.lstrip('/')
+        self.generated[path] = content.encode('utf-8') if isinstance(content, str) else content
+        return self.url(path)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name='fixture-server', daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def resolve(self, path):
+        """Map a request path to (file path, max-age), or None if it isn't served"""
+        for prefix, (directory, max_age) in self.routes.items():
+            if not path.startswith(prefix):
+                continue
+
+            relative = path[len(prefix):]
+            filepath = os.path.realpath(os.path.join(directory, relative))
+            # Never serve anything outside the route's directory
+            if not filepath.startswith(os.path.realpath(directory) + os.sep):
+                return None
+            if os.path.isfile(filepath):
+                return filepath, max_age
+
+        return None
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests += 1
+                path = urlparse(self.path).path
+
+                if path in server.generated:
+                    body = server.generated[path]
+                    self._respond(body, mimetypes.guess_type(path)[0], 0, None, None)
+                    return
+
+                resolved = server.resolve(path)
+                if resolved is None:
+                    self.send_error(404)
+                    return
+
+                filepath, max_age = resolved
+                with open(filepath, 'rb') as f:
+                    body = f.read()
+
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                last_modified = formatdate(os.path.getmtime(filepath), usegmt=True)
+
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Cache-Control', self._cache_control(max_age))
+                    self.end_headers()
+                    return
+
+                content_type = mimetypes.guess_type(filepath)[0] or 'application/octet-stream'
+                self._respond(body, content_type, max_age, etag, last_modified)
+
+            def _respond(self, body, content_type, max_age, etag, last_modified):
+                self.send_response(200)
+                if content_type and (content_type.startswith('text/') or content_type.endswith('javascript')):
+                    content_type += '; charset=utf-8'
+                self.send_header('Content-Type', content_type or 'application/octet-stream')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Cache-Control', self._cache_control(max_age))
+                if etag:
+                    self.send_header('ETag', etag)
+                if last_modified:
+                    self.send_header('Last-Modified', last_modified)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _cache_control(self, max_age):
+                return f"public, max-age={max_age}" if max_age else 'no-cache'
+
+            def log_message(self, format, *args):
+                # Keep test output quiet
+                pass
+
+        return Handler
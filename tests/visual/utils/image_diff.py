@@ -0,0 +1,161 @@
+import math
+
+import cv2
+import numpy as np
+from skimage.metrics import structural_similarity
+
+
+class DiffResult:
+    """Outcome of a tiled image comparison"""
+
+    def __init__(self, shape, tile_size):
+        self.shape = shape
+        self.tile_size = tile_size
+        self.similarity = 1.0
+        self.is_similar = True
+        self.message = "Identical"
+        self.changed_tiles = 0
+        self.compared_tiles = 0
+        self.early_exit = False
+        # Per-tile dissimilarity (1 - SSIM): 0 for identical tiles, NaN where
+        # the comparison stopped early
+        self.heatmap = None
+        # Changed regions as (x, y, width, height) in image pixels
+        self.regions = []
+
+
+def compare_images(baseline, current, threshold=0.1, tile_size=32, ssim_threshold=0.98, pixel_tolerance=2):
+    """Compare two BGR images tile by tile
+
+    Tiles whose pixels all match within pixel_tolerance are skipped by a cheap
+    vectorized pass. Only the remaining tiles are scored with SSIM, and a tile
+    counts as changed when its SSIM falls below ssim_threshold. Scoring stops
+    as soon as the changed area exceeds threshold (a fraction of the image),
+    since the comparison has already failed by then.
+    """
+    result = DiffResult(baseline.shape, tile_size)
+
+    if baseline.shape != current.shape:
+        result.similarity = 0.0
+        result.is_similar = False
+        result.message = (
+            f"Size mismatch: baseline {baseline.shape[1]}x{baseline.shape[0]}, "
+            f"current {current.shape[1]}x{current.shape[0]}"
+        )
+        return result
+
+    height, width = baseline.shape[:2]
+    rows = math.ceil(height / tile_size)
+    cols = math.ceil(width / tile_size)
+    result.heatmap = np.zeros((rows, cols), dtype=np.float32)
+
+    candidates = _candidate_tiles(baseline, current, rows, cols, tile_size, pixel_tolerance)
+    if not candidates.any():
+        return result
+
+    baseline_gray = cv2.cvtColor(baseline, cv2.COLOR_BGR2GRAY)
+    current_gray = cv2.cvtColor(current, cv2.COLOR_BGR2GRAY)
+
+    total_area = height * width
+    allowed_area = threshold * total_area
+    changed_area = 0
+    changed = np.zeros((rows, cols), dtype=bool)
+
+    tiles = np.argwhere(candidates)
+    for index, (row, col) in enumerate(tiles):
+        y0, x0 = row * tile_size, col * tile_size
+        y1, x1 = min(y0 + tile_size, height), min(x0 + tile_size, width)
+
+        score = _tile_ssim(baseline_gray[y0:y1, x0:x1], current_gray[y0:y1, x0:x1])
+        result.heatmap[row, col] = 1.0 - score
+        result.compared_tiles += 1
+
+        if score < ssim_threshold:
+            changed[row, col] = True
+            changed_area += (y1 - y0) * (x1 - x0)
+
+            if changed_area > allowed_area:
+                # Already failing; mark the unscored candidates as unknown
+                remaining = tiles[index + 1:]
+                result.heatmap[remaining[:, 0], remaining[:, 1]] = np.nan
+                result.early_exit = True
+                break
+
+    result.changed_tiles = int(changed.sum())
+    result.similarity = 1.0 - changed_area / total_area
+    result.is_similar = changed_area <= allowed_area
+    result.regions = _changed_regions(changed, tile_size, width, height)
+    result.message = (
+        f"{result.changed_tiles} changed tile(s) in {len(result.regions)} region(s)"
+        + (" (stopped early)" if result.early_exit else "")
+    )
+    return result
+
+
+def render_diff(current, result):
+    """Overlay the tile heatmap and changed-region boxes on the current image"""
+    height, width = current.shape[:2]
+
+    heat = np.nan_to_num(result.heatmap, nan=1.0)
+    heat = np.clip(heat * 255 * 4, 0, 255).astype(np.uint8)
+    heat = cv2.resize(heat, (heat.shape[1] * result.tile_size, heat.shape[0] * result.tile_size),
+                      interpolation=cv2.INTER_NEAREST)[:height, :width]
+    heat_color = cv2.applyColorMap(heat, cv2.COLORMAP_JET)
+
+    overlay = current.copy()
+    mask = heat > 0
+    overlay[mask] = cv2.addWeighted(current, 0.5, heat_color, 0.5, 0)[mask]
+
+    for x, y, w, h in result.regions:
+        cv2.rectangle(overlay, (x, y), (x + w - 1, y + h - 1), (0, 0, 255), 2)
+
+    return overlay
+
+
+def _candidate_tiles(baseline, current, rows, cols, tile_size, pixel_tolerance):
+    """Boolean tile grid marking tiles with any pixel outside pixel_tolerance"""
+    height, width = baseline.shape[:2]
+
+    delta = cv2.absdiff(baseline, current)
+    if delta.ndim == 3:
+        delta = np.maximum(np.maximum(delta[:, :, 0], delta[:, :, 1]), delta[:, :, 2])
+
+    # Per-tile maximum via padding and a 4D reshape, no Python loop over tiles
+    padded = np.zeros((rows * tile_size, cols * tile_size), dtype=np.uint8)
+    padded[:height, :width] = delta
+    return padded.reshape(rows, tile_size, cols, tile_size).max(axis=(1, 3)) > pixel_tolerance
+
+
+def _tile_ssim(baseline_tile, current_tile):
+    """SSIM for one grayscale tile, handling tiles smaller than the SSIM window"""
+    win_size = min(7, baseline_tile.shape[0], baseline_tile.shape[1])
+    if win_size % 2 == 0:
+        win_size -= 1
+
+    if win_size < 3:
+        # Too small for SSIM; fall back to normalized mean absolute difference
+        delta = cv2.absdiff(baseline_tile, current_tile)
+        return 1.0 - float(delta.mean()) / 255.0
+
+    return structural_similarity(baseline_tile, current_tile, win_size=win_size, data_range=255)
+
+
+def _changed_regions(changed, tile_size, width, height):
+    """Bounding boxes of connected groups of changed tiles, in image pixels"""
+    if not changed.any():
+        return []
+
+    count, _, stats, _ = cv2.connectedComponentsWithStats(changed.astype(np.uint8), connectivity=8)
+
+    regions = []
+    for label in range(1, count):
+        col, row, cols, rows = stats[label][:4]
+        x, y = col * tile_size, row * tile_size
+        regions.append((
+            int(x),
+            int(y),
+            int(min((col + cols) * tile_size, width) - x),
+            int(min((row + rows) * tile_size, height) - y)
+        ))
+
+    return regions
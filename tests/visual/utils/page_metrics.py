@@ -0,0 +1,250 @@
+import json
+import os
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+
+# Idempotent PerformanceObserver setup. Injected before any page script via CDP
+# when available, otherwise run late with buffered: true (long tasks are only
+# seen by observers registered before they happen).
+OBSERVER_SCRIPT = """
+if (!window.__hmgPerf) {
+    window.__hmgPerf = {lcp: null, layoutShifts: [], longTasks: [], installedAt: performance.now()};
+
+    var observe = function(type, callback) {
+        try {
+            new PerformanceObserver(function(list) {
+                list.getEntries().forEach(callback);
+            }).observe({type: type, buffered: true});
+        } catch (e) {}
+    };
+
+    observe('largest-contentful-paint', function(entry) {
+        window.__hmgPerf.lcp = entry;
+    });
+    observe('layout-shift', function(entry) {
+        if (!entry.hadRecentInput) {
+            window.__hmgPerf.layoutShifts.push(entry);
+        }
+    });
+    observe('longtask', function(entry) {
+        window.__hmgPerf.longTasks.push(entry.duration);
+    });
+}
+"""
+
+COLLECT_SCRIPT = OBSERVER_SCRIPT + """
+var components = arguments[0];
+var done = arguments[arguments.length - 1];
+
+function round(value) {
+    return value === null || value === undefined ? null : Math.round(value * 10) / 10;
+}
+
+function inside(node, selector) {
+    var element = node && (node.nodeType === 1 ? node : node.parentElement);
+    return !!(element && element.closest(selector));
+}
+
+function finish() {
+    var state = window.__hmgPerf;
+    var navigation = performance.getEntriesByType('navigation')[0];
+    var paints = {};
+    performance.getEntriesByType('paint').forEach(function(entry) {
+        paints[entry.name] = entry.startTime;
+    });
+    var init = performance.getEntriesByName('hmg-ai-public-init', 'measure')[0];
+
+    var cls = 0;
+    state.layoutShifts.forEach(function(entry) { cls += entry.value; });
+
+    var lcpComponent = null;
+    var lcpElement = state.lcp && state.lcp.element;
+
+    var componentMetrics = {};
+    Object.keys(components).forEach(function(name) {
+        var selector = components[name];
+        var shift = 0;
+        state.layoutShifts.forEach(function(entry) {
+            var hit = (entry.sources || []).some(function(source) { return inside(source.node, selector); });
+            if (hit) {
+                shift += entry.value;
+            }
+        });
+        if (lcpElement && inside(lcpElement, selector)) {
+            lcpComponent = name;
+        }
+        componentMetrics[name] = {
+            count: document.querySelectorAll(selector).length,
+            cumulative_layout_shift: Math.round(shift * 10000) / 10000
+        };
+    });
+
+    done({
+        ttfb_ms: navigation ? round(navigation.responseStart) : null,
+        dom_content_loaded_ms: navigation ? round(navigation.domContentLoadedEventEnd) : null,
+        load_ms: navigation ? round(navigation.loadEventEnd) : null,
+        first_paint_ms: round(paints['first-paint']),
+        first_contentful_paint_ms: round(paints['first-contentful-paint']),
+        largest_contentful_paint_ms: state.lcp ? round(state.lcp.renderTime || state.lcp.loadTime || state.lcp.startTime) : null,
+        lcp_component: lcpComponent,
+        cumulative_layout_shift: Math.round(cls * 10000) / 10000,
+        long_task_count: state.longTasks.length,
+        total_blocking_time_ms: round(state.longTasks.reduce(function(total, duration) {
+            return total + Math.max(0, duration - 50);
+        }, 0)),
+        hmg_init_ms: init ? round(init.duration) : null,
+        observers_installed_early: state.installedAt < (navigation ? navigation.domInteractive : 0),
+        components: componentMetrics
+    });
+}
+
+// Buffered entries are delivered asynchronously; let them arrive first
+requestAnimationFrame(function() { setTimeout(finish, 0); });
+"""
+
+# Scaling measurements for a generated fixture page: parse and first layout
+# come from the page's own User Timing measures; relayout forces a full
+# layout of the component; interaction is the time from a click on the last
+# target to the next frame, so it covers handlers plus style/layout work.
+SCALING_SCRIPT = """
+var component = document.querySelector(arguments[0]);
+var targetSelector = arguments[1];
+var done = arguments[arguments.length - 1];
+
+function measure(name) {
+    var entry = performance.getEntriesByName(name, 'measure')[0];
+    return entry ? Math.round(entry.duration * 10) / 10 : null;
+}
+
+function nextFrame(start, callback) {
+    requestAnimationFrame(function() {
+        setTimeout(function() { callback(Math.round((performance.now() - start) * 10) / 10); }, 0);
+    });
+}
+
+var result = {
+    element_count: component ? component.getElementsByTagName('*').length : 0,
+    render_ms: measure('hmg-fixture-render'),
+    layout_ms: measure('hmg-fixture-layout'),
+    relayout_ms: null,
+    interaction_ms: null
+};
+
+if (!component) {
+    done(result);
+    return;
+}
+
+var width = component.style.width;
+var start = performance.now();
+component.style.width = (component.getBoundingClientRect().width - 1) + 'px';
+component.offsetHeight;
+result.relayout_ms = Math.round((performance.now() - start) * 10) / 10;
+component.style.width = width;
+
+var targets = targetSelector ? component.querySelectorAll(targetSelector) : [];
+if (!targets.length) {
+    done(result);
+    return;
+}
+
+var target = targets[targets.length - 1];
+requestAnimationFrame(function() {
+    var clickStart = performance.now();
+    target.click();
+    nextFrame(clickStart, function(elapsed) {
+        result.interaction_ms = elapsed;
+        done(result);
+    });
+});
+"""
+
+
+class PageMetricsCollector:
+    """Reads Navigation Timing, paint, LCP, CLS, long tasks and HMG init time from the browser"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.script_id = None
+
+    def install(self):
+        """Register the observers before the next navigation (Chromium via CDP)
+
+        Returns False when CDP is unavailable; collect() then falls back to
+        buffered observers, and long tasks may be under-reported.
+        """
+        try:
+            response = self.driver.execute('executeCdpCommand', {
+                'cmd': 'Page.addScriptToEvaluateOnNewDocument',
+                'params': {'source': OBSERVER_SCRIPT}
+            })
+            self.script_id = response['value']['identifier']
+            return True
+        except (WebDriverException, KeyError, TypeError):
+            return False
+
+    def uninstall(self):
+        """Stop injecting observers (the driver may be reused by later tests)"""
+        if self.script_id is None:
+            return
+
+        try:
+            self.driver.execute('executeCdpCommand', {
+                'cmd': 'Page.removeScriptToEvaluateOnNewDocument',
+                'params': {'identifier': self.script_id}
+            })
+        except WebDriverException:
+            pass
+        self.script_id = None
+
+    def collect(self, components):
+        """Collect metrics for the loaded page; components maps names to selectors"""
+        return self.driver.execute_async_script(COLLECT_SCRIPT, components)
+
+    def collect_scaling(self, component_selector, target_selector=None):
+        """Parse, layout and interaction timings for a generated fixture page"""
+        return self.driver.execute_async_script(SCALING_SCRIPT, component_selector, target_selector)
+
+
+def load_budgets(path):
+    """Load per-metric budgets: {'page': {...}, 'components': {'default': {...}, name: {...}}}"""
+    with open(path) as f:
+        return json.load(f)
+
+
+def check_budgets(metrics, budgets):
+    """List of human-readable budget violations; metrics that weren't measured are skipped"""
+    violations = []
+
+    for metric, limit in budgets.get('page', {}).items():
+        value = metrics.get(metric)
+        if value is not None and value > limit:
+            violations.append(f"{metric}: {value} > {limit}")
+
+    component_budgets = budgets.get('components', {})
+    for name, component_metrics in metrics.get('components', {}).items():
+        limits = dict(component_budgets.get('default', {}), **component_budgets.get(name, {}))
+        for metric, limit in limits.items():
+            value = component_metrics.get(metric)
+            if value is not None and value > limit:
+                violations.append(f"{name}.{metric}: {value} > {limit}")
+
+    return violations
+
+
+def record_metrics(path, test_id, url, metrics):
+    """Append one measurement to the JSON-lines history used to track regressions"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    entry = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'test_id': test_id,
+        'url': url,
+        'metrics': metrics
+    }
+    with open(path, 'a') as f:
+        f.write(json.dumps(entry, sort_keys=True) + '\n')
+
+    return entry
@@ -0,0 +1,56 @@
+import numpy as np
+
+
+def hex_to_rgb(hex_colors):
+    """Convert '#RRGGBB' strings to an (n, 3) integer RGB array"""
+    return np.array(
+        [[int(color.lstrip('#')[i:i + 2], 16) for i in (0, 2, 4)] for color in hex_colors],
+        dtype=np.int32
+    )
+
+
+def analyze_palette(image, brand_colors, tolerance=30, top=20):
+    """Measure how much of a BGR image is covered by off-brand colors
+
+    Every pixel is packed into a 24-bit RGB integer and histogrammed with
+    np.unique, then the distance from each distinct color to every brand
+    color is computed in one broadcast. A color is on-brand when it lies
+    within tolerance (Euclidean RGB distance) of some brand color.
+
+    brand_colors maps names to '#RRGGBB'. Returns the off-brand pixel share,
+    the most common off-brand colors and the pixel share of each brand color.
+    """
+    names = list(brand_colors.keys())
+    palette = hex_to_rgb(brand_colors.values())
+
+    pixels = image.reshape(-1, image.shape[-1])
+    packed = (
+        (pixels[:, 2].astype(np.uint32) << 16)
+        | (pixels[:, 1].astype(np.uint32) << 8)
+        | pixels[:, 0].astype(np.uint32)
+    )
+    colors, counts = np.unique(packed, return_counts=True)
+    total = int(counts.sum())
+
+    rgb = np.stack([(colors >> 16) & 0xFF, (colors >> 8) & 0xFF, colors & 0xFF], axis=1).astype(np.int32)
+
+    # (distinct colors x brand colors) squared distances in one operation
+    distances = ((rgb[:, None, :] - palette[None, :, :]) ** 2).sum(axis=2)
+    nearest = distances.argmin(axis=1)
+    off_brand = distances[np.arange(len(colors)), nearest] > tolerance ** 2
+
+    off_counts = counts[off_brand]
+    off_colors = colors[off_brand]
+    order = np.argsort(off_counts)[::-1][:top]
+
+    brand_usage = np.bincount(nearest[~off_brand], weights=counts[~off_brand], minlength=len(names))
+
+    return {
+        'total_pixels': total,
+        'distinct_colors': int(len(colors)),
+        'off_brand_share': float(off_counts.sum()) / total if total else 0.0,
+        'off_brand_colors': [
+            (f"#{int(off_colors[i]):06X}", float(off_counts[i]) / total) for i in order
+        ],
+        'brand_usage': {name: float(usage) / total for name, usage in zip(names, brand_usage)}
+    }
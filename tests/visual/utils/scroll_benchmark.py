@@ -0,0 +1,119 @@
+from selenium.common.exceptions import WebDriverException
+
+
+FRAME_MS = 1000 / 60
+
+# Records every animation frame and scroll event until stopped. The scroll
+# listener is installed once per page (jQuery's off('scroll') can't remove it),
+# and each run only resets the counters; the frame loop keeps a reference to
+# its own run so a previous run's loop can't record into the next one.
+FRAME_RECORDER_SCRIPT = """
+var state = window.__hmgFrames = {times: [], scrollEvents: 0, running: true};
+if (!window.__hmgScrollListener) {
+    window.__hmgScrollListener = true;
+    window.addEventListener('scroll', function() {
+        if (window.__hmgFrames.running) {
+            window.__hmgFrames.scrollEvents++;
+        }
+    }, {passive: true});
+}
+(function loop(time) {
+    if (!state.running) {
+        return;
+    }
+    state.times.push(time);
+    requestAnimationFrame(loop);
+})(performance.now());
+"""
+
+STOP_RECORDER_SCRIPT = """
+window.__hmgFrames.running = false;
+return {times: window.__hmgFrames.times, scroll_events: window.__hmgFrames.scrollEvents};
+"""
+
+# Metrics from CDP Performance.getMetrics that the benchmark reports as deltas
+CDP_METRICS = ('ScriptDuration', 'LayoutCount', 'LayoutDuration', 'RecalcStyleCount', 'RecalcStyleDuration', 'TaskDuration')
+
+
+class ScrollBenchmark:
+    """Drives scroll gestures through CDP and measures the page's work per frame
+
+    Each run synthesizes the same scroll gesture, reads script, layout and
+    style-recalc totals from the Performance domain before and after, and
+    counts frames from a requestAnimationFrame recorder. Running once with
+    the page's scroll handlers and once without them attributes the cost to
+    those handlers. Chromium only; is_supported() is False elsewhere.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def cdp(self, cmd, params=None):
+        return self.driver.execute('executeCdpCommand', {'cmd': cmd, 'params': params or {}})['value']
+
+    def is_supported(self):
+        try:
+            self.cdp('Performance.enable')
+            return True
+        except (WebDriverException, KeyError, TypeError):
+            return False
+
+    def run(self, distance, speed=1200, repeat=1):
+        """Scroll down distance CSS pixels (speed px/s), then back to the top between repeats"""
+        self.driver.execute_script("window.scrollTo(0, 0);")
+        self.cdp('Performance.enable')
+        before = self._metrics()
+        self.driver.execute_script(FRAME_RECORDER_SCRIPT)
+
+        viewport = self.driver.execute_script("return [window.innerWidth, window.innerHeight];")
+        for _ in range(repeat):
+            # Resolves once the gesture has finished
+            self.cdp('Input.synthesizeScrollGesture', {
+                'x': viewport[0] // 2,
+                'y': viewport[1] // 2,
+                'yDistance': -distance,
+                'speed': speed,
+                'gestureSourceType': 'mouse'
+            })
+            self.driver.execute_script("window.scrollTo(0, 0);")
+
+        frames = self.driver.execute_script(STOP_RECORDER_SCRIPT)
+        after = self._metrics()
+        self.cdp('Performance.disable')
+
+        return self._summarize(before, after, frames)
+
+    def _metrics(self):
+        return {metric['name']: metric['value'] for metric in self.cdp('Performance.getMetrics')['metrics']}
+
+    def _summarize(self, before, after, frames):
+        delta = {name: after.get(name, 0) - before.get(name, 0) for name in CDP_METRICS}
+
+        times = frames['times']
+        intervals = [b - a for a, b in zip(times, times[1:])]
+        # A frame interval spanning n vsyncs means n - 1 frames were dropped
+        dropped = sum(max(0, round(interval / FRAME_MS) - 1) for interval in intervals)
+        frame_count = max(len(intervals), 1)
+
+        return {
+            'frames': len(intervals),
+            'dropped_frames': dropped,
+            'dropped_frame_share': round(dropped / (frame_count + dropped), 3),
+            'scroll_events': frames['scroll_events'],
+            'script_ms': round(delta['ScriptDuration'] * 1000, 1),
+            'script_ms_per_frame': round(delta['ScriptDuration'] * 1000 / frame_count, 2),
+            'layouts': int(delta['LayoutCount']),
+            'layout_ms': round(delta['LayoutDuration'] * 1000, 1),
+            'style_recalcs': int(delta['RecalcStyleCount']),
+            'style_recalc_ms': round(delta['RecalcStyleDuration'] * 1000, 1),
+            'task_ms': round(delta['TaskDuration'] * 1000, 1)
+        }
+
+
+def handler_cost(with_handlers, without_handlers):
+    """Per-metric difference between runs with and without the scroll handlers"""
+    return {
+        metric: round(value - without_handlers.get(metric, 0), 3)
+        for metric, value in with_handlers.items()
+        if metric not in ('frames', 'scroll_events')
+    }
@@ -1,5 +1,6 @@
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -8,16 +9,176 @@ from PIL import Image
 import cv2
 import numpy as np
 
+from baseline_store import BaselineStore
+from image_diff import compare_images, render_diff
+
+# Resolves once the element (or whole document) has no running CSS transitions,
+# finite Web Animations or jQuery effects (the public script animates the FAQ
+# accordion and smooth scrolling with jQuery), scroll position and layout held still across consecutive
+# animation frames, or the timeout elapsed. Calls back with true when settled.
+SETTLE_SCRIPT = """
+var element = arguments[0];
+var timeoutMs = arguments[1];
+var stableFramesNeeded = arguments[2];
+var done = arguments[arguments.length - 1];
+
+var root = element || document.documentElement;
+var start = performance.now();
+var stableFrames = 0;
+var lastSnapshot = null;
+var finished = false;
+
+function runningAnimations() {
+    if (window.jQuery && jQuery.timers && jQuery.timers.length) {
+        return jQuery.timers.length;
+    }
+
+    var animations = element && element.getAnimations
+        ? element.getAnimations({subtree: true})
+        : (document.getAnimations ? document.getAnimations() : []);
+
+    return animations.filter(function(animation) {
+        if (animation.playState !== 'running' && animation.playState !== 'pending') {
+            return false;
+        }
+        // Looping animations (spinners, pulses) never finish; don't wait on them
+        var timing = animation.effect && animation.effect.getComputedTiming
+            ? animation.effect.getComputedTiming()
+            : null;
+        return !timing || timing.iterations !== Infinity;
+    }).length;
+}
+
+function snapshot() {
+    var rect = root.getBoundingClientRect();
+    return [window.scrollX, window.scrollY, rect.top, rect.left, rect.width, rect.height].join(',');
+}
+
+function finish(settled) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    document.removeEventListener('transitionend', onTransitionEnd, true);
+    done(settled);
+}
+
+function onTransitionEnd() {
+    // A transition just finished; the next frame has to prove stability again
+    stableFrames = 0;
+}
+
+function check() {
+    if (finished) {
+        return;
+    }
+    if (performance.now() - start > timeoutMs) {
+        finish(false);
+        return;
+    }
+
+    var current = snapshot();
+    if (runningAnimations() === 0 && current === lastSnapshot) {
+        stableFrames++;
+    } else {
+        stableFrames = 0;
+    }
+    lastSnapshot = current;
+
+    if (stableFrames >= stableFramesNeeded) {
+        finish(true);
+        return;
+    }
+    requestAnimationFrame(check);
+}
+
+document.addEventListener('transitionend', onTransitionEnd, true);
+requestAnimationFrame(check);
+"""
+
+# Computed styles, rects and visibility for every element matching a selector,
+# returned as columns (one array per field) to keep the payload compact.
+COLLECT_STYLES_SCRIPT = """
+var selector = arguments[0];
+var properties = arguments[1];
+var limit = arguments[2];
+var root = arguments[3] || document;
+
+var elements = Array.prototype.slice.call(root.querySelectorAll(selector));
+if (limit) {
+    elements = elements.slice(0, limit);
+}
+
+var result = {
+    count: elements.length,
+    styles: {},
+    rects: {x: [], y: [], width: [], height: []},
+    visible: []
+};
+properties.forEach(function(property) {
+    result.styles[property] = [];
+});
+
+elements.forEach(function(element) {
+    var styles = window.getComputedStyle(element);
+    var rect = element.getBoundingClientRect();
+
+    properties.forEach(function(property) {
+        // Accept both CSS names (font-size) and camelCase (fontSize)
+        var value = property.indexOf('-') === -1 ? styles[property] : styles.getPropertyValue(property);
+        result.styles[property].push(value === undefined ? null : value);
+    });
+
+    result.rects.x.push(Math.round(rect.left));
+    result.rects.y.push(Math.round(rect.top));
+    result.rects.width.push(Math.round(rect.width));
+    result.rects.height.push(Math.round(rect.height));
+    result.visible.push(
+        rect.width > 0 && rect.height > 0 &&
+        styles.display !== 'none' && styles.visibility !== 'hidden' && parseFloat(styles.opacity) > 0
+    );
+});
+
+return result;
+"""
+
+def style_rows(collected):
+    """Iterate collect_styles() columns as one dict per element"""
+    properties = list(collected['styles'].keys())
+    rects = collected['rects']
+    
+    for i in range(collected['count']):
+        row = {prop: collected['styles'][prop][i] for prop in properties}
+        row['rect'] = {field: rects[field][i] for field in ('x', 'y', 'width', 'height')}
+        row['visible'] = collected['visible'][i]
+        yield row
+
+# Background writer for optional screenshot files, shared by all helpers
+_screenshot_writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix='screenshot-writer')
+
+def _write_png(filepath, png_bytes):
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    with open(filepath, 'wb') as f:
+        f.write(png_bytes)
+    return filepath
+
+def decode_png(png_bytes):
+    """Decode PNG bytes into a BGR NumPy array (OpenCV channel order)"""
+    return cv2.imdecode(np.frombuffer(png_bytes, dtype=np.uint8), cv2.IMREAD_COLOR)
+
 class SeleniumHelper:
-    def __init__(self, driver, config):
+    def __init__(self, driver, config, test_id=None):
         self.driver = driver
         self.config = config
+        self.test_id = test_id or 'adhoc'
         self.wait = WebDriverWait(driver, 10)
+        self.pending_writes = []
+        self.last_diff = None
+        self.baseline_store = BaselineStore(config['baseline_dir'], config['current_dir'])
     
     def take_screenshot(self, name):
-        """Take screenshot"""
-        timestamp = int(time.time())
-        filename = f"{name}_{timestamp}.png"
+        """Take screenshot (overwrites the previous run's file of the same name)"""
+        filename = f"{name}.png"
         filepath = os.path.join(self.config['current_dir'], filename)
         
         # Ensure directory exists
@@ -26,6 +187,47 @@ class SeleniumHelper:
         self.driver.save_screenshot(filepath)
         return filepath
     
+    def capture_element(self, element, name=None, save=False):
+        """Capture only the pixels of element and return them as a BGR array
+
+        Uses the WebDriver element screenshot endpoint, so the browser crops
+        the image and only the component's PNG crosses the grid. With save=True
+        the PNG is also written to current_dir/{name}.png in the background.
+        """
+        png_bytes = element.screenshot_as_png
+        if save:
+            self.save_png_async(png_bytes, name)
+        return decode_png(png_bytes)
+    
+    def capture_viewport(self, name=None, save=False):
+        """Capture the viewport as a BGR array, optionally saving it in the background"""
+        png_bytes = self.driver.get_screenshot_as_png()
+        if save:
+            self.save_png_async(png_bytes, name)
+        return decode_png(png_bytes)
+    
+    def save_png_async(self, png_bytes, name):
+        """Queue already-encoded PNG bytes to be written to current_dir"""
+        filepath = os.path.join(self.config['current_dir'], f"{name}.png")
+        future = _screenshot_writer.submit(_write_png, filepath, png_bytes)
+        self.pending_writes.append(future)
+        return filepath
+    
+    def flush_screenshots(self):
+        """Block until every queued screenshot file has been written"""
+        paths = [future.result() for future in self.pending_writes]
+        self.pending_writes = []
+        return paths
+    
+    def collect_styles(self, selector, properties, limit=None, root=None):
+        """Computed styles, rects and visibility of all matching elements in one round trip
+
+        Returns columns: {'count': n, 'styles': {property: [n values]},
+        'rects': {'x'|'y'|'width'|'height': [n values]}, 'visible': [n bools]}.
+        Use style_rows() to walk it element by element.
+        """
+        return self.driver.execute_script(COLLECT_STYLES_SCRIPT, selector, list(properties), limit, root)
+    
     def wait_for_element(self, locator, timeout=10):
         """Wait for element"""
         try:
@@ -36,41 +238,108 @@ class SeleniumHelper:
         except TimeoutException:
             raise TimeoutException(f"Element {locator} not found within {timeout} seconds")
     
-    def compare_screenshots(self, baseline_path, current_path, threshold=0.1):
-        """Basic screenshot comparison"""
+    def wait_until_settled(self, element=None, timeout=5, stable_frames=2):
+        """Wait until transitions, animations and scrolling have settled
+
+        Uses a single async script instead of a fixed sleep. Pass an element to
+        watch only its subtree, or None to watch the whole document. Returns
+        False if the page was still moving when the timeout was reached.
+        """
+        try:
+            return bool(self.driver.execute_async_script(
+                SETTLE_SCRIPT, element, int(timeout * 1000), stable_frames
+            ))
+        except TimeoutException:
+            return False
+    
+    def compare_with_baseline(self, name, image, threshold=0.1):
+        """Compare a captured image with the stored baseline for this test
+
+        The baseline is looked up by test id, viewport and browser. When the
+        sidecar hashes match, the baseline PNG is not even read. The capture is
+        always saved to the current store (in the background) so it can be
+        approved with run_shortcode_tests.py --approve.
+        """
+        store = self.baseline_store
+        viewport = self.driver.execute_script("return [window.innerWidth, window.innerHeight];")
+        browser_name = self.driver.capabilities.get('browserName', 'unknown')
+        key = store.key(self.test_id, name, viewport, browser_name)
+        
+        meta = dict(store.hashes(image), test_id=self.test_id, name=name, browser=browser_name,
+                    viewport=f"{viewport[0]}x{viewport[1]}")
+        self.pending_writes.append(_screenshot_writer.submit(store.save_current, key, image, meta))
+        
+        baseline_meta = store.load_meta(key)
+        if baseline_meta is None:
+            # First run - current capture becomes the baseline
+            self.pending_writes.append(_screenshot_writer.submit(store.save_baseline, key, image, meta))
+            return True, 1.0, "Baseline created"
+        
+        if store.matches(baseline_meta, meta):
+            return True, 1.0, "Hash match"
+        
+        baseline = store.load_image(key)
+        if baseline is None:
+            return False, 0.0, "Could not load baseline image"
+        
+        result = compare_images(baseline, image, threshold=threshold)
+        self.last_diff = result
+        
+        if not result.changed_tiles:
+            return result.is_similar, result.similarity, result.message
+        
+        diff_path = store.diff_path(self.config['diff_dir'], key)
+        os.makedirs(os.path.dirname(diff_path), exist_ok=True)
+        cv2.imwrite(diff_path, render_diff(image, result))
+        
+        return result.is_similar, result.similarity, diff_path
+    
+    def compare_screenshots(self, baseline_path, current, threshold=0.1):
+        """Tiled perceptual screenshot comparison
+
+        threshold is the fraction of the image allowed to change. The full
+        result (tile heatmap, changed regions) is kept in self.last_diff.
+        current may be a file path or an already decoded BGR array, such as
+        the result of capture_element().
+        """
+        in_memory = isinstance(current, np.ndarray)
+        current_path = None if in_memory else current
+        
         if not os.path.exists(baseline_path):
             # First run - copy current to baseline
             os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
-            import shutil
-            shutil.copy2(current_path, baseline_path)
+            if in_memory:
+                cv2.imwrite(baseline_path, current)
+            else:
+                import shutil
+                shutil.copy2(current_path, baseline_path)
             return True, 1.0, "Baseline created"
         
         try:
             # Load images
             baseline = cv2.imread(baseline_path)
-            current = cv2.imread(current_path)
+            if not in_memory:
+                current = cv2.imread(current)
             
             if baseline is None or current is None:
                 return False, 0.0, "Could not load images"
             
-            # Resize if different sizes
-            if baseline.shape != current.shape:
-                current = cv2.resize(current, (baseline.shape[1], baseline.shape[0]))
-            
-            # Simple pixel difference
-            diff = cv2.absdiff(baseline, current)
-            total_pixels = baseline.shape[0] * baseline.shape[1] * baseline.shape[2]
-            diff_pixels = np.count_nonzero(diff)
+            # Tiled comparison; mismatched sizes fail instead of being resized
+            result = compare_images(baseline, current, threshold=threshold)
+            self.last_diff = result
             
-            similarity = 1 - (diff_pixels / total_pixels)
+            if not result.changed_tiles:
+                return result.is_similar, result.similarity, result.message
             
-            # Save diff image
-            diff_path = current_path.replace('current', 'diff')
+            # Save diff image: tile heatmap with changed regions boxed
+            if in_memory:
+                diff_path = os.path.join(self.config['diff_dir'], os.path.basename(baseline_path))
+            else:
+                diff_path = current_path.replace('current', 'diff')
             os.makedirs(os.path.dirname(diff_path), exist_ok=True)
-            cv2.imwrite(diff_path, diff)
+            cv2.imwrite(diff_path, render_diff(current, result))
             
-            is_similar = similarity >= (1 - threshold)
-            return is_similar, similarity, diff_path
+            return result.is_similar, result.similarity, diff_path
             
         except Exception as e:
-            return False, 0.0, f"Comparison error: {str(e)}"
+            return False, 0.0, f"Comparison error: {str(e)}"
\ No newline at end of file
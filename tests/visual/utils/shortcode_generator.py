@@ -0,0 +1,445 @@
+from html import escape
+
+
+# Styles of each list-based partial in public/partials/*-template.php. The
+# audio player renders a single file, so it has no item count to scale.
+STYLES = {
+    'takeaways': ['default', 'numbered', 'cards', 'highlights'],
+    'faq': ['accordion', 'list', 'cards'],
+    'toc': ['numbered', 'horizontal', 'minimal', 'sidebar']
+}
+
+# One element per generated item, for checking what was rendered
+ITEM_SELECTORS = {
+    'takeaways': '.hmg-ai-takeaway-item, .hmg-ai-takeaway-card, .hmg-ai-takeaway-highlight',
+    'faq': '.hmg-ai-faq-accordion-item, .hmg-ai-faq-card, .hmg-ai-faq-item',
+    'toc': '.hmg-ai-toc-link'
+}
+
+# The element a user clicks in each component
+INTERACTION_TARGETS = {
+    'takeaways': '.hmg-ai-takeaway-item, .hmg-ai-takeaway-card, .hmg-ai-takeaway-highlight',
+    'faq': '.hmg-ai-faq-question',
+    'toc': '.hmg-ai-toc-link'
+}
+
+TOPICS = [
+    'candidate sourcing', 'employer branding', 'job descriptions', 'interview scheduling',
+    'recruiter outreach', 'applicant tracking', 'talent pipelines', 'onboarding content',
+    'salary benchmarks', 'social recruiting', 'referral programs', 'career sites'
+]
+
+
+def generate_items(component, count, depth=1):
+    """Deterministic item data in the shape each partial expects
+
+    depth only affects the TOC: heading levels cycle 1..depth, giving
+    nested sublists up to depth levels deep.
+    """
+    items = []
+    for index in range(count):
+        topic = TOPICS[index % len(TOPICS)]
+        number = index + 1
+
+        if component == 'takeaways':
+            items.append(f"Takeaway {number}: AI-assisted {topic} saves recruiters time on every requisition")
+        elif component == 'faq':
+            items.append({
+                'question': f"Question {number}: How does AI help with {topic}?",
+                'answer': f"It drafts and refines {topic} content in the company's voice, "
+                          f"so marketers review instead of writing from scratch (answer {number})."
+            })
+        elif component == 'toc':
+            items.append({
+                'title': f"Section {number}: {topic.capitalize()}",
+                'anchor': f"#section-{number}",
+                'level': 1 + index % max(depth, 1)
+            })
+        else:
+            raise ValueError(f"Unsupported component: {component}")
+
+    return items
+
+
+def render_takeaways(style, items, post_id=1):
+    """Python port of public/partials/takeaways-template.php"""
+    parts = [
+        f'<div class="hmg-ai-takeaways hmg-ai-takeaways-{style}" data-post-id="{post_id}">',
+        '<h3 class="hmg-ai-takeaways-title">Key Takeaways</h3>'
+    ]
+
+    if style == 'cards':
+        parts.append('<div class="hmg-ai-takeaways-cards">')
+        for index, takeaway in enumerate(items):
+            parts.append(
+                f'<div class="hmg-ai-takeaway-card"><div class="hmg-ai-takeaway-number">{index + 1}</div>'
+                f'<div class="hmg-ai-takeaway-content">{escape(takeaway)}</div></div>'
+            )
+        parts.append('</div>')
+    elif style == 'numbered':
+        parts.append('<ol class="hmg-ai-takeaways-numbered">')
+        for takeaway in items:
+            parts.append(
+                f'<li class="hmg-ai-takeaway-item"><span class="hmg-ai-takeaway-text">{escape(takeaway)}</span></li>'
+            )
+        parts.append('</ol>')
+    elif style == 'highlights':
+        parts.append('<div class="hmg-ai-takeaways-highlights">')
+        for index, takeaway in enumerate(items):
+            parts.append(
+                '<div class="hmg-ai-takeaway-highlight"><div class="hmg-ai-takeaway-marker"></div>'
+                f'<div class="hmg-ai-takeaway-content"><strong>Point {index + 1}:</strong> {escape(takeaway)}</div></div>'
+            )
+        parts.append('</div>')
+    else:
+        parts.append('<ul class="hmg-ai-takeaways-list">')
+        for takeaway in items:
+            parts.append(
+                '<li class="hmg-ai-takeaway-item"><span class="hmg-ai-takeaway-icon">•</span>'
+                f'<span class="hmg-ai-takeaway-text">{escape(takeaway)}</span></li>'
+            )
+        parts.append('</ul>')
+
+    parts.append('</div>')
+    return '\n'.join(parts)
+
+
+def render_faq(style, items, post_id=1):
+    """Python port of public/partials/faq-template.php, including its accordion script"""
+    unique_id = f"hmg-faq-{post_id}-1000"
+    parts = [
+        f'<div class="hmg-ai-faq hmg-ai-faq-{style}" data-post-id="{post_id}">',
+        '<h3 class="hmg-ai-faq-title">Frequently Asked Questions</h3>'
+    ]
+
+    if style == 'accordion':
+        parts.append(f'<div class="hmg-ai-faq-accordion" id="{unique_id}">')
+        for index, item in enumerate(items):
+            answer_id = f"{unique_id}-answer-{index}"
+            parts.append(
+                '<div class="hmg-ai-faq-accordion-item">'
+                f'<button class="hmg-ai-faq-accordion-button" aria-expanded="false" aria-controls="{answer_id}">'
+                f'<span class="hmg-ai-faq-question">{escape(item["question"])}</span>'
+                '<span class="hmg-ai-faq-icon" aria-hidden="true"><svg width="20" height="20" viewBox="0 0 20 20" fill="none">'
+                '<path d="M5 7.5L10 12.5L15 7.5" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/>'
+                '</svg></span></button>'
+                f'<div class="hmg-ai-faq-accordion-content" id="{answer_id}" aria-hidden="true">'
+                f'<div class="hmg-ai-faq-answer">{escape(item["answer"])}</div></div></div>'
+            )
+        parts.append('</div>')
+    elif style == 'cards':
+        parts.append('<div class="hmg-ai-faq-cards">')
+        for index, item in enumerate(items):
+            parts.append(
+                '<div class="hmg-ai-faq-card"><div class="hmg-ai-faq-card-header">'
+                f'<span class="hmg-ai-faq-number">Q{index + 1}</span>'
+                f'<h4 class="hmg-ai-faq-question">{escape(item["question"])}</h4></div>'
+                f'<div class="hmg-ai-faq-card-body"><p class="hmg-ai-faq-answer">{escape(item["answer"])}</p></div></div>'
+            )
+        parts.append('</div>')
+    else:
+        parts.append('<div class="hmg-ai-faq-list">')
+        for item in items:
+            parts.append(
+                '<div class="hmg-ai-faq-item">'
+                f'<h4 class="hmg-ai-faq-question"><strong>Q:</strong> {escape(item["question"])}</h4>'
+                f'<div class="hmg-ai-faq-answer"><strong>A:</strong> {escape(item["answer"])}</div></div>'
+            )
+        parts.append('</div>')
+
+    parts.append('</div>')
+
+    if style == 'accordion':
+        parts.append(FAQ_ACCORDION_SCRIPT.replace('__UNIQUE_ID__', unique_id))
+
+    return '\n'.join(parts)
+
+
+def render_toc(style, items, post_id=1):
+    """Python port of public/partials/toc-template.php, including its scripts"""
+    parts = [
+        f'<div class="hmg-ai-toc hmg-ai-toc-{style}" data-post-id="{post_id}">',
+        '<div class="hmg-ai-toc-header"><h3 class="hmg-ai-toc-title">Table of Contents</h3>'
+    ]
+    if style == 'sidebar':
+        parts.append('<button class="hmg-ai-toc-toggle" aria-label="Toggle Table of Contents"><span></span></button>')
+    parts.append('</div>')
+    parts.append('<div class="hmg-ai-toc-content">')
+
+    if style == 'horizontal':
+        parts.append('<nav class="hmg-ai-toc-horizontal-nav">')
+        for item in items:
+            parts.append(
+                f'<a href="{escape(item["anchor"])}" class="hmg-ai-toc-link hmg-ai-toc-level-{item["level"]}">'
+                f'{escape(item["title"])}</a>'
+            )
+        parts.append('</nav>')
+    elif style == 'minimal':
+        parts.append('<ul class="hmg-ai-toc-minimal-list">')
+        for item in items:
+            parts.append(
+                f'<li class="hmg-ai-toc-item hmg-ai-toc-level-{item["level"]}">'
+                f'<a href="{escape(item["anchor"])}" class="hmg-ai-toc-link">{escape(item["title"])}</a></li>'
+            )
+        parts.append('</ul>')
+    elif style == 'sidebar':
+        parts.append('<div class="hmg-ai-toc-progress"><div class="hmg-ai-toc-progress-bar"></div></div>')
+        parts.append('<nav class="hmg-ai-toc-sidebar-nav">')
+        current_level = 0
+        for item in items:
+            while current_level > item['level']:
+                parts.append('</ul>')
+                current_level -= 1
+            while current_level < item['level']:
+                parts.append('<ul class="hmg-ai-toc-sublevel">')
+                current_level += 1
+            anchor = escape(item['anchor'])
+            parts.append(
+                f'<li class="hmg-ai-toc-item"><a href="{anchor}" class="hmg-ai-toc-link" data-anchor="{anchor}">'
+                f'{escape(item["title"])}</a></li>'
+            )
+        parts.append('</ul>' * current_level)
+        parts.append('</nav>')
+    else:
+        parts.append('<ol class="hmg-ai-toc-numbered-list">')
+        current_level = items[0]['level'] if items else 1
+        for item in items:
+            while current_level > item['level']:
+                parts.append('</ol></li>')
+                current_level -= 1
+            while current_level < item['level']:
+                parts.append('<ol class="hmg-ai-toc-sublist">')
+                current_level += 1
+            parts.append(
+                f'<li class="hmg-ai-toc-item"><a href="{escape(item["anchor"])}" class="hmg-ai-toc-link">'
+                f'{escape(item["title"])}</a>'
+            )
+        parts.append('</li></ol>' * (current_level - 1))
+        parts.append('</li></ol>')
+
+    parts.append('</div></div>')
+    parts.append(TOC_SCRIPT.replace('__STYLE__', style).replace('__OFFSET__', '100' if style == 'sidebar' else '80'))
+    if style == 'sidebar':
+        parts.append(TOC_SIDEBAR_SCRIPT)
+
+    return '\n'.join(parts)
+
+
+RENDERERS = {
+    'takeaways': render_takeaways,
+    'faq': render_faq,
+    'toc': render_toc
+}
+
+
+def render_article(component, items):
+    """Post body the component sits in; TOC items get matching headings"""
+    paragraph = (
+        '<p>AI-assisted content workflows help recruiting and staffing marketers publish '
+        'consistently while editors keep control of tone and accuracy.</p>'
+    )
+
+    if component != 'toc':
+        return '<article class="hmg-fixture-article">' + paragraph * 5 + '</article>'
+
+    sections = []
+    for item in items:
+        tag = f"h{min(item['level'] + 1, 6)}"
+        sections.append(f'<{tag} id="{escape(item["anchor"][1:])}">{escape(item["title"])}</{tag}>{paragraph}')
+    return '<article class="hmg-fixture-article">' + ''.join(sections) + '</article>'
+
+
+def render_page(component, style, count, depth=1):
+    """Complete fixture page with one component of count items
+
+    User Timing marks around the component let tests read how long it took
+    to parse (hmg-fixture-render) and to lay out the first time
+    (hmg-fixture-layout).
+    """
+    if style not in STYLES.get(component, []):
+        raise ValueError(f"Unsupported {component} style: {style}")
+
+    items = generate_items(component, count, depth)
+    markup = RENDERERS[component](style, items)
+
+    return PAGE_TEMPLATE.format(
+        title=escape(f"{component} {style} x{count} (depth {depth})"),
+        component=markup,
+        article=render_article(component, items)
+    )
+
+
+def render_sidebar_page(count, depth=1):
+    """Page with the live sidebar TOC markup and count headings
+
+    The partial's sidebar differs from what the live shortcode renders (see
+    shortcode-test.html); hmg-ai-public.js's progress bar and scroll spy
+    target the live markup ([data-hmg-smooth-scroll] items), so this is
+    the page to benchmark those scroll handlers on.
+    """
+    items = generate_items('toc', count, depth)
+    links = []
+    for item in items:
+        target = escape(item['anchor'][1:])
+        links.append(
+            f'<a href="#{target}" class="hmg-ai-toc-sidebar-item" data-hmg-smooth-scroll '
+            f'data-level="{item["level"]}" data-target="{target}">'
+            f'<span class="hmg-ai-toc-dot"></span><span class="hmg-ai-toc-text">{escape(item["title"])}</span></a>'
+        )
+
+    markup = (
+        '<div class="hmg-ai-toc hmg-ai-toc-sidebar" data-hmg-component="toc">'
+        '<div class="hmg-ai-toc-header"><h3 class="hmg-ai-toc-title">Table of Contents</h3></div>'
+        '<div class="hmg-ai-toc-content"><div class="hmg-ai-toc-sidebar"><div class="hmg-ai-toc-sticky">'
+        '<div class="hmg-ai-toc-progress"><div class="hmg-ai-toc-progress-bar"></div></div>'
+        '<nav class="hmg-ai-toc-nav" role="navigation" aria-label="Table of Contents">'
+        + ''.join(links) +
+        '</nav></div></div></div>'
+        f'<div class="hmg-ai-toc-footer"><div class="hmg-ai-meta"><span class="hmg-ai-count">{count} sections</span></div></div>'
+        '</div>'
+    )
+
+    return PAGE_TEMPLATE.format(
+        title=escape(f"toc live sidebar x{count} (depth {depth})"),
+        component=markup,
+        article=render_article('toc', items)
+    )
+
+
+def page_name(component, style, count, depth=1):
+    return f"generated/{component}-{style}-{count}-d{depth}.html"
+
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <title>{title}</title>
+    <!-- Generated by tests/visual/utils/shortcode_generator.py -->
+    <link rel="stylesheet" href="/public/css/hmg-ai-public.css">
+</head>
+<body>
+<div class="hmg-fixture-content" style="max-width: 1200px; margin: 0 auto; padding: 20px;">
+<h1>Generated shortcode fixture</h1>
+<script>performance.mark('hmg-fixture-render-start');</script>
+{component}
+<script>
+performance.mark('hmg-fixture-render-end');
+document.body.offsetHeight;
+performance.mark('hmg-fixture-layout-end');
+performance.measure('hmg-fixture-render', 'hmg-fixture-render-start', 'hmg-fixture-render-end');
+performance.measure('hmg-fixture-layout', 'hmg-fixture-render-end', 'hmg-fixture-layout-end');
+</script>
+{article}
+</div>
+
+<script src="/vendor/jquery-3.7.1.min.js"></script>
+<script src="/public/js/hmg-ai-public.js"></script>
+</body>
+</html>
+"""
+
+# Inline scripts emitted by the partials, kept verbatim apart from the PHP echoes
+FAQ_ACCORDION_SCRIPT = """<script>
+(function() {
+    const accordion = document.getElementById('__UNIQUE_ID__');
+    if (accordion) {
+        const buttons = accordion.querySelectorAll('.hmg-ai-faq-accordion-button');
+
+        buttons.forEach(button => {
+            button.addEventListener('click', function() {
+                const expanded = this.getAttribute('aria-expanded') === 'true';
+                const content = this.nextElementSibling;
+
+                // Close all other items
+                buttons.forEach(btn => {
+                    if (btn !== this) {
+                        btn.setAttribute('aria-expanded', 'false');
+                        btn.nextElementSibling.setAttribute('aria-hidden', 'true');
+                    }
+                });
+
+                // Toggle current item
+                this.setAttribute('aria-expanded', !expanded);
+                content.setAttribute('aria-hidden', expanded);
+            });
+        });
+    }
+})();
+</script>"""
+
+TOC_SCRIPT = """<script>
+(function() {
+    // Smooth scrolling for TOC links
+    const tocLinks = document.querySelectorAll('.hmg-ai-toc-__STYLE__ .hmg-ai-toc-link');
+
+    tocLinks.forEach(link => {
+        link.addEventListener('click', function(e) {
+            e.preventDefault();
+            const targetId = this.getAttribute('href').substring(1);
+            const targetElement = document.getElementById(targetId);
+
+            if (targetElement) {
+                const offset = __OFFSET__;
+                const targetPosition = targetElement.offsetTop - offset;
+
+                window.scrollTo({
+                    top: targetPosition,
+                    behavior: 'smooth'
+                });
+
+                // Update URL without jumping
+                history.pushState(null, null, '#' + targetId);
+            }
+        });
+    });
+})();
+</script>"""
+
+TOC_SIDEBAR_SCRIPT = """<script>
+(function() {
+    // Sidebar scroll spy and progress bar
+    const progressBar = document.querySelector('.hmg-ai-toc-sidebar .hmg-ai-toc-progress-bar');
+    const sidebarLinks = document.querySelectorAll('.hmg-ai-toc-sidebar .hmg-ai-toc-link');
+
+    function updateProgress() {
+        const scrollTop = window.pageYOffset || document.documentElement.scrollTop;
+        const docHeight = document.documentElement.scrollHeight - document.documentElement.clientHeight;
+        const progress = (scrollTop / docHeight) * 100;
+
+        if (progressBar) {
+            progressBar.style.width = progress + '%';
+        }
+
+        // Update active link
+        sidebarLinks.forEach(link => {
+            const targetId = link.getAttribute('data-anchor').substring(1);
+            const targetElement = document.getElementById(targetId);
+
+            if (targetElement) {
+                const rect = targetElement.getBoundingClientRect();
+                if (rect.top <= 150 && rect.bottom >= 150) {
+                    link.classList.add('active');
+                } else {
+                    link.classList.remove('active');
+                }
+            }
+        });
+    }
+
+    window.addEventListener('scroll', updateProgress);
+    updateProgress();
+
+    // Toggle button for mobile
+    const toggleBtn = document.querySelector('.hmg-ai-toc-sidebar .hmg-ai-toc-toggle');
+    const tocContent = document.querySelector('.hmg-ai-toc-sidebar .hmg-ai-toc-content');
+
+    if (toggleBtn && tocContent) {
+        toggleBtn.addEventListener('click', function() {
+            tocContent.classList.toggle('expanded');
+            this.classList.toggle('active');
+        });
+    }
+})();
+</script>"""
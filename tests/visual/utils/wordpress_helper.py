@@ -5,6 +5,34 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 
+class ShortcodeTestPost:
+    """Session-wide cache of the resolved shortcode test post URL
+
+    The post (or static fallback page) is probed once and reused by every
+    test. After a test failure the cache is invalidated so the next test
+    re-probes it instead of trusting a URL that may have gone bad.
+
+    A fixed_url (the fixture server page) skips WordPress entirely; a
+    fallback_url replaces the static page when the post has no shortcodes.
+    """
+    
+    def __init__(self, fixed_url=None, fallback_url=None):
+        self.fixed_url = fixed_url
+        self.fallback_url = fallback_url
+        self.url = fixed_url
+        self.probes = 0
+    
+    def get(self, wordpress_helper):
+        """Return the cached URL, probing it first if needed"""
+        if self.url is None:
+            self.url = wordpress_helper.create_shortcode_test_post(self.fallback_url)
+            self.probes += 1
+        return self.url
+    
+    def invalidate(self):
+        """Force the next get() to re-validate the test post"""
+        self.url = self.fixed_url
+
 class WordPressHelper:
     def __init__(self, driver, config):
         self.driver = driver
@@ -43,27 +71,34 @@ class WordPressHelper:
             print(f"Login failed: {e}")
             raise
     
-    def create_shortcode_test_post(self):
-        """Create a test post with all shortcode styles"""
+    def create_shortcode_test_post(self, fallback_url=None):
+        """Create a test post with all shortcode styles
+        
+        fallback_url (normally the fixture server page) is used when the post
+        has no shortcodes; without it a static file:// page is written, which
+        only works when the browser runs on this machine.
+        """
         # Use our existing test post that we created
         test_post_url = f"{self.wp_url}/?p=10"
         
         # Verify the post exists by checking for shortcode elements
         try:
             self.driver.get(test_post_url)
-            time.sleep(2)
+            WebDriverWait(self.driver, 10).until(
+                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            )
             
             # Check if shortcodes are present
             if self._check_for_shortcodes():
                 return test_post_url
             
             # If shortcodes not found, try the fallback
-            return self._create_static_test_page()
+            return fallback_url or self._create_static_test_page()
             
         except Exception as e:
             print(f"Error accessing test post: {e}")
             # Return a fallback URL with static test content
-            return self._create_static_test_page()
+            return fallback_url or self._create_static_test_page()
     
     def _check_for_shortcodes(self):
         """Check if current page has shortcode elements"""